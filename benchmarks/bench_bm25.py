@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark BM25 lexical search.
+
+Builds the sparse BM25 engine (indexing.bm25_engine.SparseBM25) over the
+chunks of data/policies_md, optionally resampled into a larger synthetic
+corpus, and times top-k search for multi-term queries drawn from the
+vocabulary. If rank_bm25 is installed, BM25Okapi with a full sort (the
+previous implementation) is timed on the same queries and the top-k results
+are compared.
+
+Usage:
+    python benchmarks/bench_bm25.py
+    python benchmarks/bench_bm25.py --chunks 100000 --queries 50
+"""
+
+import io
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from indexing.bm25_engine import SparseBM25
+from indexing.index_builder import create_chunks_from_documents
+from indexing.markdown_parser import parse_all_markdown_files
+from indexing.tokenizer import Tokenizer
+
+try:
+    from rank_bm25 import BM25Okapi
+except ImportError:  # Reference implementation is optional
+    BM25Okapi = None
+
+
+def load_corpus(input_dir: Path, size: int, seed: int) -> list[list[str]]:
+    """Tokenized chunks of the markdown corpus, resampled to `size` chunks if larger."""
+    with redirect_stdout(io.StringIO()):
+        documents = parse_all_markdown_files(input_dir)
+    tokenize = Tokenizer().tokenize
+    corpus = [tokenize(chunk.content) for chunk in create_chunks_from_documents(documents)]
+
+    if size <= len(corpus):
+        return corpus
+
+    # Synthetic chunks: real chunk lengths, tokens shuffled across the corpus
+    rng = random.Random(seed)
+    pool = [token for tokens in corpus for token in tokens]
+    return corpus + [
+        rng.choices(pool, k=len(rng.choice(corpus)))
+        for _ in range(size - len(corpus))
+    ]
+
+
+def time_queries(search, queries: list[list[str]]) -> tuple[list, float]:
+    """
+    Run every query once.
+
+    Returns:
+        (results per query, mean milliseconds per query)
+    """
+    start = time.perf_counter()
+    results = [search(query) for query in queries]
+    return results, (time.perf_counter() - start) / len(queries) * 1000
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark BM25 lexical search")
+    parser.add_argument(
+        "--input-dir",
+        type=Path,
+        default=Path(__file__).resolve().parent.parent / "data" / "policies_md",
+        help="Directory of markdown files (default: data/policies_md)"
+    )
+    parser.add_argument("--chunks", type=int, default=0,
+                        help="Resample the corpus to this many chunks (default: corpus size)")
+    parser.add_argument("--queries", type=int, default=100, help="Number of queries (default: 100)")
+    parser.add_argument("--top-k", type=int, default=10, help="Results per query (default: 10)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.input_dir, args.chunks, args.seed)
+    if not corpus:
+        print(f"No chunks found in {args.input_dir}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    engine = SparseBM25(corpus)
+    build_seconds = time.perf_counter() - start
+    print(f"Benchmarking BM25 on {len(corpus)} chunks, {len(engine.vocabulary)} terms "
+          f"(sparse build {build_seconds:.2f}s)\n")
+
+    # Expanded requirement queries carry 5-15 search terms
+    rng = random.Random(args.seed)
+    vocabulary = list(engine.vocabulary)
+    queries = [rng.choices(vocabulary, k=rng.randint(5, 15)) for _ in range(args.queries)]
+
+    sparse, sparse_ms = time_queries(lambda q: list(engine.top_k(q, args.top_k)[0]), queries)
+    rows = [("sparse", sparse_ms)]
+
+    identical = None
+
+    if BM25Okapi is not None:
+        reference = BM25Okapi(corpus)
+
+        def reference_search(query):
+            scored = list(enumerate(reference.get_scores(query)))
+            scored.sort(key=lambda x: x[1], reverse=True)
+            return [i for i, _ in scored[:args.top_k]]
+
+        expected, reference_ms = time_queries(reference_search, queries)
+        identical = expected == sparse
+        rows.insert(0, ("rank_bm25", reference_ms))
+
+    print(f"{'Engine':<10} {'ms/query':>9} {'Speedup':>8}")
+    print("-" * 29)
+    for name, elapsed in rows:
+        print(f"{name:<10} {elapsed:>9.3f} {rows[0][1] / elapsed:>7.1f}x")
+
+    if identical is None:
+        print("\nrank_bm25 not installed; reference comparison skipped")
+    else:
+        print(f"\nTop-{args.top_k} identical: {'yes' if identical else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark PDF extraction backends.
+
+Extracts every PDF in data/policies with each backend and reports throughput
+(pages/sec) and output parity against pdfplumber:
+- text similarity (difflib ratio over whitespace-normalized page text)
+- pages where pdfplumber found tables, and how many of them each backend kept
+
+Usage:
+    python benchmarks/bench_extraction.py                       # All backends
+    python benchmarks/bench_extraction.py --backends pdfium     # pdfium vs pdfplumber
+    python benchmarks/bench_extraction.py --input-dir some/pdfs --repeat 3
+"""
+
+import sys
+import time
+import difflib
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+
+def page_similarity(reference: str, candidate: str) -> float:
+    """Similarity of two page texts, ignoring whitespace and line breaks."""
+    ref_words = reference.split()
+    cand_words = candidate.split()
+    if not ref_words and not cand_words:
+        return 1.0
+    return difflib.SequenceMatcher(None, ref_words, cand_words, autojunk=False).ratio()
+
+
+def time_backend(pdf_files: list[Path], backend: str, repeat: int) -> tuple[dict, float]:
+    """
+    Extract all PDFs with a backend (best of `repeat` runs).
+
+    Returns:
+        (documents by filename, best total seconds)
+    """
+    from ingestion.pdf_extractor import extract_pdf
+
+    best = None
+    documents = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        documents = {pdf.name: extract_pdf(pdf, backend=backend) for pdf in pdf_files}
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return documents, best
+
+
+def compare(reference: dict, candidate: dict) -> dict:
+    """Parity statistics of a backend's output against the reference."""
+    similarities = []
+    table_pages = 0
+    table_pages_kept = 0
+
+    for name, ref_doc in reference.items():
+        cand_doc = candidate[name]
+        for ref_page, cand_page in zip(ref_doc.pages, cand_doc.pages):
+            similarities.append(page_similarity(ref_page.text, cand_page.text))
+            if ref_page.tables:
+                table_pages += 1
+                if len(cand_page.tables) == len(ref_page.tables):
+                    table_pages_kept += 1
+
+    similarities.sort()
+    return {
+        "mean_similarity": sum(similarities) / len(similarities) if similarities else 1.0,
+        "min_similarity": similarities[0] if similarities else 1.0,
+        "table_pages": table_pages,
+        "table_pages_kept": table_pages_kept
+    }
+
+
+def main():
+    import argparse
+    from ingestion.extraction_backends import BACKENDS
+
+    parser = argparse.ArgumentParser(description="Benchmark PDF extraction backends")
+    parser.add_argument(
+        "--input-dir",
+        type=Path,
+        default=Path(__file__).resolve().parent.parent / "data" / "policies",
+        help="Directory of PDFs (default: data/policies)"
+    )
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=list(BACKENDS),
+        choices=list(BACKENDS),
+        help="Backends to benchmark (pdfplumber is always run as the reference)"
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per backend; best time is reported")
+
+    args = parser.parse_args()
+
+    pdf_files = sorted(args.input_dir.glob("*.pdf"))
+    if not pdf_files:
+        print(f"No PDFs found in {args.input_dir}")
+        sys.exit(1)
+
+    backends = ["pdfplumber"] + [b for b in args.backends if b != "pdfplumber"]
+
+    print(f"Benchmarking {len(backends)} backend(s) on {len(pdf_files)} PDFs\n")
+
+    results = {}
+    for backend in backends:
+        try:
+            documents, elapsed = time_backend(pdf_files, backend, args.repeat)
+        except ImportError as e:
+            print(f"  ⚠️  Skipping {backend}: {e}")
+            continue
+        total_pages = sum(doc.total_pages for doc in documents.values())
+        results[backend] = (documents, elapsed, total_pages)
+        print(f"  {backend}: {total_pages} pages in {elapsed:.2f}s")
+
+    reference = results["pdfplumber"][0]
+    ref_elapsed = results["pdfplumber"][1]
+
+    print(f"\n{'Backend':<12} {'Pages/s':>9} {'Speedup':>8} {'Mean sim':>9} {'Min sim':>8} {'Tables kept':>12}")
+    print("-" * 63)
+    for backend, (documents, elapsed, total_pages) in results.items():
+        parity = compare(reference, documents)
+        pages_per_sec = total_pages / elapsed if elapsed else float("inf")
+        speedup = ref_elapsed / elapsed if elapsed else float("inf")
+        tables = f"{parity['table_pages_kept']}/{parity['table_pages']}"
+        print(f"{backend:<12} {pages_per_sec:>9.1f} {speedup:>7.1f}x "
+              f"{parity['mean_similarity']:>9.3f} {parity['min_similarity']:>8.3f} {tables:>12}")
+
+
+if __name__ == "__main__":
+    main()
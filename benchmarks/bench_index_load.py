@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark index loading.
+
+Times retrieval.hybrid_retriever.load_retriever on a saved index directory
+(what run_query.py does at startup), broken down by component, and compares
+loading the same BM25 index from the memory-mapped bundle, the pickle with
+precomputed statistics, and the old tokens-only pickle, which recomputes
+them on every load.
+
+Usage:
+    python benchmarks/bench_index_load.py
+    python benchmarks/bench_index_load.py --index-dir data/indexes --repeat 10 --no-graph
+"""
+
+import io
+import pickle
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from dataclasses import asdict
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from indexing.index_builder import BUNDLE_FILENAME, BM25Index, VectorStore
+from indexing.graph_builder import KnowledgeGraphBuilder
+from retrieval.hybrid_retriever import load_retriever
+
+
+def best_time(load, repeat: int) -> float:
+    """Best wall-clock seconds of `repeat` calls (output suppressed)."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            load()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def load_bm25(path: Path) -> BM25Index:
+    index = BM25Index()
+    if path.suffix == ".bundle":
+        index.load_bundle(path)
+    else:
+        index.load(path)
+    return index
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark index loading")
+    parser.add_argument(
+        "--index-dir",
+        type=Path,
+        default=Path(__file__).resolve().parent.parent / "data" / "indexes",
+        help="Index directory (default: data/indexes)"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Loads per measurement; best time is reported")
+    parser.add_argument("--no-graph", action="store_true", help="Load without the knowledge graph")
+
+    args = parser.parse_args()
+
+    bm25_path = args.index_dir / BUNDLE_FILENAME
+    if not bm25_path.exists():
+        bm25_path = args.index_dir / "bm25_index.pkl"
+    if not bm25_path.exists():
+        print(f"No BM25 index found in {args.index_dir}")
+        print("Run `python run_indexing.py` first")
+        sys.exit(1)
+
+    with redirect_stdout(io.StringIO()):
+        index = load_bm25(bm25_path)
+        chunks = list(index.chunks)
+    print(f"Benchmarking index loading from {args.index_dir} ({len(index.chunks)} chunks)\n")
+
+    rows = [("load_retriever", best_time(
+        lambda: load_retriever(args.index_dir, load_graph=not args.no_graph), args.repeat
+    ))]
+    rows.append(("  BM25 index", best_time(lambda: load_bm25(bm25_path), args.repeat)))
+    if (args.index_dir / "chromadb").exists():
+        rows.append(("  ChromaDB", best_time(
+            lambda: VectorStore(args.index_dir / "chromadb").initialize(), args.repeat
+        )))
+    if not args.no_graph and (args.index_dir / "knowledge_graph.pkl").exists():
+        rows.append(("  Graph", best_time(lambda: KnowledgeGraphBuilder.load(args.index_dir), args.repeat)))
+
+    # The same BM25 index in each format
+    with tempfile.TemporaryDirectory() as tmp:
+        bundle_path = Path(tmp) / BUNDLE_FILENAME
+        current_path = Path(tmp) / "current.pkl"
+        legacy_path = Path(tmp) / "legacy.pkl"
+        index.chunks = chunks
+        with redirect_stdout(io.StringIO()):
+            index.save_bundle(bundle_path)
+            index.save(current_path)
+        with open(legacy_path, "wb") as f:
+            pickle.dump({
+                "chunks": [asdict(c) for c in chunks],
+                "tokenized_corpus": [index.tokenizer.tokenize(c.content) for c in chunks]
+            }, f)
+
+        legacy = best_time(lambda: load_bm25(legacy_path), args.repeat)
+        current = best_time(lambda: load_bm25(current_path), args.repeat)
+        bundle = best_time(lambda: load_bm25(bundle_path), args.repeat)
+
+    print(f"{'Stage':<18} {'ms':>9}")
+    print("-" * 28)
+    for name, elapsed in rows:
+        print(f"{name:<18} {elapsed * 1000:>9.1f}")
+
+    print(f"\nBM25 load, recomputing statistics: {legacy * 1000:.1f}ms")
+    print(f"BM25 load, precomputed statistics: {current * 1000:.1f}ms "
+          f"({legacy / current:.1f}x faster)")
+    print(f"BM25 load, memory-mapped bundle:   {bundle * 1000:.1f}ms "
+          f"({legacy / bundle:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
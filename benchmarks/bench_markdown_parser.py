@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark markdown section parsing.
+
+Parses every markdown file in data/policies_md with the single-pass scanner
+in indexing.markdown_parser.parse_sections and with the previous multi-pass
+implementation (kept below as the reference), and reports the time per
+corpus pass, the speedup, and whether both produce identical sections.
+
+Only section parsing is timed; files are read and frontmatter is split off
+beforehand.
+
+Usage:
+    python benchmarks/bench_markdown_parser.py
+    python benchmarks/bench_markdown_parser.py --input-dir some/markdown --repeat 50
+"""
+
+import re
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from indexing.frontmatter import split_frontmatter
+from indexing.markdown_parser import Section, parse_sections
+
+
+def reference_parse_sections(content: str, document_id: str, document_title: str) -> list[Section]:
+    """
+    The multi-pass parser parse_sections replaced: a per-line re.match on an
+    uncompiled heading pattern, then three regex searches for metadata and an
+    entity scan per section.
+    """
+    sections = []
+    header_pattern = r'^(#{1,6})\s+(.+?)$'
+
+    current_section = None
+    current_content = []
+    section_stack = []
+
+    def close():
+        current_section.content = '\n'.join(current_content).strip()
+        if current_section.content or current_section.title:
+            sections.append(current_section)
+
+    for line in content.split('\n'):
+        header_match = re.match(header_pattern, line)
+        if header_match:
+            if current_section is not None:
+                close()
+            level = len(header_match.group(1))
+            title = header_match.group(2).strip()
+            while section_stack and section_stack[-1][0] >= level:
+                section_stack.pop()
+            section_stack.append((level, title))
+            current_section = Section(
+                section_id="", title=title, level=level, content="",
+                document_id=document_id, document_title=document_title,
+                section_path=" > ".join(t for _, t in section_stack)
+            )
+            current_content = []
+        else:
+            current_content.append(line)
+
+    if current_section is not None:
+        close()
+
+    type_pattern = r'\[\[(role|control|asset|process|external|doc|framework):([^\]]+)\]\]'
+    for section in sections:
+        section_id = re.search(r'<!--\s*section_id:\s*([^\s>]+)\s*-->', section.content)
+        if section_id:
+            section.section_id = section_id.group(1)
+        else:
+            title_slug = re.sub(r'[^\w\s]', '', section.title)
+            title_slug = re.sub(r'\s+', '-', title_slug.strip().lower())[:20]
+            section.section_id = f"{document_id}-{title_slug}"
+
+        relevance = re.search(r'<!--\s*compliance_relevance:\s*(\w+)\s*-->', section.content)
+        section.compliance_relevance = relevance.group(1) if relevance else None
+
+        maps = re.search(r'<!--\s*likely_maps_to:\s*\[([^\]]+)\]\s*-->', section.content)
+        section.likely_maps_to = [
+            item.strip().strip('"\'') for item in maps.group(1).split(",")
+        ] if maps else []
+
+        entities = {
+            "roles": [], "controls": [], "assets": [], "processes": [],
+            "external": [], "documents": [], "frameworks": []
+        }
+        for match in re.finditer(type_pattern, section.content):
+            type_mapping = {
+                "role": "roles", "control": "controls", "asset": "assets",
+                "process": "processes", "external": "external",
+                "doc": "documents", "framework": "frameworks"
+            }
+            key = type_mapping[match.group(1)]
+            value = match.group(2).strip()
+            if value not in entities[key]:
+                entities[key].append(value)
+        section.entities = entities
+
+    return sections
+
+
+def time_parser(parse, bodies: list[str], repeat: int) -> tuple[list, float]:
+    """
+    Parse every body with `parse` (best of `repeat` corpus passes).
+
+    Returns:
+        (sections per body, best seconds per pass)
+    """
+    best = None
+    results = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [parse(body, "DOC", "Title") for body in bodies]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return results, best
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark markdown section parsing")
+    parser.add_argument(
+        "--input-dir",
+        type=Path,
+        default=Path(__file__).resolve().parent.parent / "data" / "policies_md",
+        help="Directory of markdown files (default: data/policies_md)"
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="Corpus passes per parser; best time is reported")
+
+    args = parser.parse_args()
+
+    md_files = sorted(args.input_dir.glob("*.md"))
+    if not md_files:
+        print(f"No markdown files found in {args.input_dir}")
+        sys.exit(1)
+
+    contents = [f.read_text(encoding="utf-8") for f in md_files]
+    bodies = [content[split_frontmatter(content)[1]:] for content in contents]
+    total_bytes = sum(len(body.encode("utf-8")) for body in bodies)
+    print(f"Benchmarking section parsing on {len(md_files)} files ({total_bytes / 1024:.0f} KiB)\n")
+
+    reference, ref_elapsed = time_parser(reference_parse_sections, bodies, args.repeat)
+    scanned, scan_elapsed = time_parser(parse_sections, bodies, args.repeat)
+
+    identical = all(
+        [asdict(s) for s in ref] == [asdict(s) for s in new]
+        for ref, new in zip(reference, scanned)
+    )
+    sections = sum(len(result) for result in scanned)
+
+    print(f"{'Parser':<12} {'ms/pass':>9} {'MiB/s':>8} {'Speedup':>8}")
+    print("-" * 40)
+    for name, elapsed in (("multi-pass", ref_elapsed), ("scanner", scan_elapsed)):
+        mib_per_sec = total_bytes / (1024 * 1024) / elapsed if elapsed else float("inf")
+        speedup = ref_elapsed / elapsed if elapsed else float("inf")
+        print(f"{name:<12} {elapsed * 1000:>9.2f} {mib_per_sec:>8.1f} {speedup:>7.1f}x")
+
+    print(f"\n{sections} sections; output identical: {'yes' if identical else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,11 @@ Usage:
     python run_conversion.py                    # Convert all policies
     python run_conversion.py --dry-run          # Preview what would be done
     python run_conversion.py --single <pdf>     # Convert a single PDF
+    python run_conversion.py --no-cache         # Re-extract PDFs from scratch
+    python run_conversion.py --concurrency 4 --tpm 30000   # Parallel, within quota
+    python run_conversion.py --backend hybrid   # Faster extraction for text-only pages
+    python run_conversion.py --converter rules  # Offline rule-based conversion (no API key)
+    python run_conversion.py --small-model gpt-4o-mini  # Cheap model for plain prose pages
 """
 
 import os
@@ -22,17 +27,32 @@ load_dotenv()
 
 def main():
     import argparse
+    from ingestion.pdf_extractor import BACKEND_NAMES, DEFAULT_BACKEND
 
     parser = argparse.ArgumentParser(description="Convert policy PDFs to markdown")
     parser.add_argument("--dry-run", action="store_true", help="Preview without converting")
     parser.add_argument("--single", type=str, help="Convert a single PDF file")
     parser.add_argument("--model", default="gpt-4o", help="OpenAI model (default: gpt-4o)")
+    parser.add_argument("--small-model", help="Smaller model for plain prose pages (default: --model for all)")
     parser.add_argument("--no-skip", action="store_true", help="Re-convert existing files")
+    parser.add_argument("--no-cache", action="store_true", help="Re-extract PDFs instead of using the extraction cache")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Max PDFs converted concurrently; each runs up to --parallel-parts requests (default: 1)")
+    parser.add_argument("--parallel-parts", type=int, default=4,
+                        help="Max parts of one PDF converted concurrently (default: 4)")
+    parser.add_argument("--max-requests", type=int,
+                        help="Max API requests in flight across all PDFs (default: --concurrency x --parallel-parts)")
+    parser.add_argument("--rpm", type=float, help="OpenAI requests-per-minute limit")
+    parser.add_argument("--tpm", type=float, help="OpenAI tokens-per-minute limit")
+    parser.add_argument("--backend", default=DEFAULT_BACKEND, choices=BACKEND_NAMES,
+                        help=f"PDF extraction engine (default: {DEFAULT_BACKEND})")
+    parser.add_argument("--converter", default="llm", choices=["llm", "rules", "draft"],
+                        help="llm, rules (offline, no API key) or draft (rules + LLM frontmatter)")
 
     args = parser.parse_args()
 
     # Check for API key
-    if not os.getenv("OPENAI_API_KEY") and not args.dry_run:
+    if not os.getenv("OPENAI_API_KEY") and not args.dry_run and args.converter != "rules":
         print("❌ Error: OPENAI_API_KEY not set")
         print("\nOptions:")
         print("  1. Create a .env file with: OPENAI_API_KEY=sk-your-key")
@@ -44,6 +64,7 @@ def main():
         # Convert single file
         from openai import OpenAI
         from ingestion.pdf_to_markdown import convert_pdf_to_markdown
+        from ingestion.extraction_cache import ExtractionCache
 
         pdf_path = Path(args.single)
         if not pdf_path.exists():
@@ -51,10 +72,14 @@ def main():
             sys.exit(1)
 
         output_dir = Path(__file__).parent / "data" / "policies_md"
-        client = OpenAI()
+        client = OpenAI() if args.converter != "rules" else None
+        cache = None if args.no_cache else ExtractionCache()
 
         print(f"Converting: {pdf_path.name}")
-        output_path = convert_pdf_to_markdown(pdf_path, output_dir, client, args.model)
+        output_path = convert_pdf_to_markdown(
+            pdf_path, output_dir, client, args.model, cache=cache, backend=args.backend,
+            converter=args.converter, small_model=args.small_model
+        )
         print(f"\n✅ Done! Output: {output_path}")
 
     else:
@@ -64,7 +89,16 @@ def main():
         results = convert_all_policies(
             model=args.model,
             skip_existing=not args.no_skip,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            use_cache=not args.no_cache,
+            concurrency=args.concurrency,
+            requests_per_minute=args.rpm,
+            tokens_per_minute=args.tpm,
+            backend=args.backend,
+            converter=args.converter,
+            small_model=args.small_model,
+            parallel_parts=args.parallel_parts,
+            max_requests=args.max_requests
         )
 
         if not args.dry_run:
@@ -12,6 +12,8 @@ Usage:
     python run_indexing.py --test       # Test search after building
     python run_indexing.py --no-graph   # Skip graph building
     python run_indexing.py --no-vector  # Skip vector embeddings
+    python run_indexing.py --workers 4  # Parse changed files in parallel
+    python run_indexing.py --incremental  # Only index added/changed/deleted files
 """
 
 import os
@@ -26,6 +28,33 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 load_dotenv()
 
 
+def test_search(bm25_index, vector_store):
+    """Run a test query against the BM25 index and vector store."""
+    print("\n" + "=" * 60)
+    print("TESTING SEARCH")
+    print("=" * 60)
+
+    test_query = "multi-factor authentication for privileged access"
+    print(f"\nTest query: '{test_query}'\n")
+
+    # BM25 results
+    print("--- BM25 Results ---")
+    bm25_results = bm25_index.search(test_query, top_k=3)
+    for chunk, score in bm25_results:
+        print(f"  [{chunk.section_id}] {chunk.section_title}")
+        print(f"    Score: {score:.2f}")
+        print()
+
+    # Vector results
+    if vector_store:
+        print("--- Vector Search Results ---")
+        vector_results = vector_store.search(test_query, top_k=3)
+        for result in vector_results:
+            print(f"  [{result['metadata']['section_id']}] {result['metadata']['section_title']}")
+            print(f"    Similarity: {result['similarity']:.3f}")
+            print()
+
+
 def main():
     import argparse
 
@@ -35,6 +64,18 @@ def main():
     parser.add_argument("--no-vector", action="store_true", help="Skip building vector embeddings")
     parser.add_argument("--model", default="text-embedding-3-small",
                         help="Embedding model (default: text-embedding-3-small)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Processes for parsing changed markdown files (default: 1)")
+    parser.add_argument("--no-parse-cache", action="store_true",
+                        help="Re-parse every markdown file instead of using the parse cache")
+    parser.add_argument("--stopwords", action="store_true",
+                        help="Drop common English stopwords (and 'shall') from BM25 terms")
+    parser.add_argument("--stem", action="store_true",
+                        help="Strip plural endings from BM25 terms (policies -> policy)")
+    parser.add_argument("--preserve-acronyms", action="store_true",
+                        help="Keep acronyms (MFA, CERT-In) whole and unstemmed in BM25 terms")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only index markdown files added, changed or deleted since the last build")
 
     args = parser.parse_args()
 
@@ -63,13 +104,57 @@ def main():
 
     # Import here to avoid ChromaDB/rank_bm25 conflict at module level
     from indexing.markdown_parser import parse_all_markdown_files
-    from indexing.index_builder import BM25Index, VectorStore, create_chunks_from_documents
+    from indexing.parse_cache import ParseCache
+    from indexing.index_builder import BUNDLE_FILENAME, BM25Index, VectorStore, create_chunks_from_documents
+    from indexing.tokenizer import TokenizerConfig
+    from indexing.incremental import build_manifest, update_indexes
+
+    tokenizer_config = TokenizerConfig(
+        stopwords=args.stopwords,
+        stemming=args.stem,
+        preserve_acronyms=args.preserve_acronyms
+    )
+    embedding_model = None if args.no_vector else args.model
+    parse_cache = None if args.no_parse_cache else ParseCache()
+
+    if args.incremental:
+        print("=" * 60)
+        print("UPDATING INDEXES (INCREMENTAL)")
+        print("=" * 60)
+        try:
+            changes = update_indexes(
+                markdown_dir,
+                index_dir,
+                tokenizer_config=tokenizer_config,
+                embedding_model=embedding_model,
+                graph=not args.no_graph,
+                cache=parse_cache
+            )
+        except ValueError as e:
+            print(f"[ERROR] {e}")
+            print("Run without --incremental for a full build")
+            sys.exit(1)
+
+        print("\n" + "=" * 60)
+        print("INDEXES UP TO DATE" if not changes.has_changes else "INCREMENTAL UPDATE COMPLETE!")
+        print("=" * 60)
+
+        if args.test:
+            bm25_index = BM25Index()
+            bm25_index.load_bundle(index_dir / BUNDLE_FILENAME)
+            vector_store = None
+            if embedding_model:
+                vector_store = VectorStore(index_dir / "chromadb")
+                vector_store.initialize()
+            test_search(bm25_index, vector_store)
+        return
 
     print("=" * 60)
     print("PARSING DOCUMENTS")
     print("=" * 60)
-    docs = parse_all_markdown_files(markdown_dir)
-    print(f"\nParsed {len(docs)} documents")
+    docs = parse_all_markdown_files(markdown_dir, workers=args.workers, cache=parse_cache)
+    print(f"\nParsed {len(docs)} documents"
+          + (f" ({parse_cache.hits} from cache)" if parse_cache else ""))
 
     print("\n" + "=" * 60)
     print("CREATING CHUNKS")
@@ -81,9 +166,9 @@ def main():
     print("\n" + "=" * 60)
     print("BUILDING BM25 INDEX")
     print("=" * 60)
-    bm25_index = BM25Index()
+    bm25_index = BM25Index(tokenizer_config=tokenizer_config)
     bm25_index.build(chunks)
-    bm25_index.save(index_dir / "bm25_index.pkl")
+    bm25_index.save_bundle(index_dir / BUNDLE_FILENAME)
     print("[OK] BM25 index saved")
 
     # Build ChromaDB vector store
@@ -96,7 +181,7 @@ def main():
 
         vector_store = VectorStore(index_dir / "chromadb")
         vector_store.initialize()
-        vector_store.build(chunks, embedding_model=args.model)
+        vector_store.build(chunks, embedding_model=embedding_model)
         print(f"[OK] ChromaDB vector store saved ({vector_store.collection.count()} entries)")
 
     # Build knowledge graph for GraphRAG
@@ -106,7 +191,7 @@ def main():
         print("=" * 60)
 
         from indexing.graph_builder import build_knowledge_graph
-        builder = build_knowledge_graph(markdown_dir, index_dir)
+        builder = build_knowledge_graph(markdown_dir, index_dir, documents=docs)
 
         stats = builder.get_stats()
         print(f"\nGraph Statistics:")
@@ -118,35 +203,18 @@ def main():
 
         print("\n[OK] Knowledge graph saved")
 
+    # Record what was indexed, for --incremental
+    build_manifest(
+        markdown_dir, docs, chunks, tokenizer_config, embedding_model, graph=not args.no_graph
+    ).save(index_dir)
+
     print("\n" + "=" * 60)
     print("INDEXING COMPLETE!")
     print("=" * 60)
 
     # Test search if requested
     if args.test:
-        print("\n" + "=" * 60)
-        print("TESTING SEARCH")
-        print("=" * 60)
-
-        test_query = "multi-factor authentication for privileged access"
-        print(f"\nTest query: '{test_query}'\n")
-
-        # BM25 results
-        print("--- BM25 Results ---")
-        bm25_results = bm25_index.search(test_query, top_k=3)
-        for chunk, score in bm25_results:
-            print(f"  [{chunk.section_id}] {chunk.section_title}")
-            print(f"    Score: {score:.2f}")
-            print()
-
-        # Vector results
-        if vector_store:
-            print("--- Vector Search Results ---")
-            vector_results = vector_store.search(test_query, top_k=3)
-            for result in vector_results:
-                print(f"  [{result['metadata']['section_id']}] {result['metadata']['section_title']}")
-                print(f"    Similarity: {result['similarity']:.3f}")
-                print()
+        test_search(bm25_index, vector_store)
 
 
 if __name__ == "__main__":
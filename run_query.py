@@ -8,6 +8,8 @@ Usage:
     python run_query.py                     # Interactive mode
     python run_query.py "requirement text"  # Single query
     python run_query.py --file reqs.txt     # Process file of requirements
+    python run_query.py --requirements data/requirements/cscrf_requirements.jsonl --ids GV.OC PR.AA.S1
+                                            # Bulk-map ingested CSCRF requirements
 """
 
 import os
@@ -30,7 +32,7 @@ def check_setup():
         sys.exit(1)
 
     index_dir = Path(__file__).parent / "data" / "indexes"
-    if not (index_dir / "bm25_index.pkl").exists():
+    if not any((index_dir / name).exists() for name in ("index.bundle", "bm25_index.pkl")):
         print("[ERROR] Indexes not found")
         print("Run `python run_indexing.py` first")
         sys.exit(1)
@@ -146,6 +148,40 @@ def process_file(mapper, filepath: str, use_hyde: bool = True, use_expand: bool
         print(format_compliance_result(result))
 
 
+def process_requirements(
+    mapper,
+    filepath: str,
+    id_prefixes: list[str] = None,
+    use_hyde: bool = True,
+    use_expand: bool = True
+):
+    """Process requirement records produced by run_regulation_ingest.py."""
+    from retrieval.compliance_mapper import format_compliance_result
+    from ingestion.regulation_parser import load_requirements
+
+    path = Path(filepath)
+    if not path.exists():
+        print(f"[ERROR] File not found: {filepath}")
+        print("Run `python run_regulation_ingest.py` first")
+        sys.exit(1)
+
+    records = load_requirements(path)
+    if id_prefixes:
+        records = [
+            r for r in records
+            if any(r.requirement_id.startswith(prefix) for prefix in id_prefixes)
+        ]
+
+    print(f"Processing {len(records)} requirements...\n")
+
+    for i, record in enumerate(records, 1):
+        print(f"\n[{i}/{len(records)}] {record.requirement_id} ({' > '.join(record.clause_path)})")
+        result = mapper.map_requirement(
+            record.text, top_k=10, use_hyde=use_hyde, use_expand=use_expand
+        )
+        print(format_compliance_result(result))
+
+
 def main():
     import argparse
 
@@ -161,6 +197,15 @@ def main():
         "--file", "-f",
         help="File containing requirements (one per line or separated by blank lines)"
     )
+    parser.add_argument(
+        "--requirements", "-r",
+        help="JSONL requirement records from run_regulation_ingest.py"
+    )
+    parser.add_argument(
+        "--ids",
+        nargs="+",
+        help="Only map requirements whose ID starts with one of these (e.g. GV.OC PR.AA.S1)"
+    )
     parser.add_argument(
         "--no-hyde",
         action="store_true",
@@ -180,7 +225,11 @@ def main():
     check_setup()
     mapper = load_mapper(use_expand=use_expand)
 
-    if args.file:
+    if args.requirements:
+        process_requirements(
+            mapper, args.requirements, args.ids, use_hyde=use_hyde, use_expand=use_expand
+        )
+    elif args.file:
         process_file(mapper, args.file, use_hyde=use_hyde, use_expand=use_expand)
     elif args.requirement:
         single_query(mapper, args.requirement, use_hyde=use_hyde, use_expand=use_expand)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Split the CSCRF regulation PDF into requirement records.
+
+Creates data/requirements/cscrf_requirements.jsonl with one record per
+standard (e.g. GV.OC.S1) and guideline (e.g. GV.PO.G1.9), ready for bulk
+mapping with `python run_query.py --requirements ...`.
+
+Usage:
+    python run_regulation_ingest.py                 # Ingest data/regulations/csrcf_document.pdf
+    python run_regulation_ingest.py --pdf other.pdf --output reqs.jsonl
+    python run_regulation_ingest.py --no-cache      # Re-extract the PDF from scratch
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+
+def main():
+    import argparse
+
+    project_root = Path(__file__).parent
+
+    parser = argparse.ArgumentParser(description="Ingest CSCRF requirements from the regulation PDF")
+    parser.add_argument(
+        "--pdf",
+        type=Path,
+        default=project_root / "data" / "regulations" / "csrcf_document.pdf",
+        help="Regulation PDF (default: data/regulations/csrcf_document.pdf)"
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=project_root / "data" / "requirements" / "cscrf_requirements.jsonl",
+        help="Output JSONL (default: data/requirements/cscrf_requirements.jsonl)"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Extraction processes (default: all CPUs)")
+    parser.add_argument("--no-cache", action="store_true", help="Re-extract instead of using the extraction cache")
+
+    args = parser.parse_args()
+
+    if not args.pdf.exists():
+        print(f"❌ File not found: {args.pdf}")
+        sys.exit(1)
+
+    from ingestion.regulation_parser import ingest_regulation
+    from ingestion.extraction_cache import ExtractionCache
+
+    records = ingest_regulation(
+        args.pdf,
+        args.output,
+        cache=None if args.no_cache else ExtractionCache(),
+        workers=args.workers
+    )
+
+    print(f"\n✅ {len(records)} requirements ready for bulk mapping:")
+    print(f"   python run_query.py --requirements {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Sparse BM25 Engine
+
+Okapi BM25 over a CSR term-document matrix. Each stored entry is the final
+BM25 weight of a term in a document (IDF and length normalization applied
+at build time), so scoring a query is a weighted bincount over the postings
+of its terms, and top-k selection is an argpartition instead of a full sort.
+
+Scores match rank_bm25.BM25Okapi (same k1, b, epsilon and IDF floor), which
+this engine replaces.
+"""
+
+from collections import Counter
+
+import numpy as np
+
+
+class SparseBM25:
+    """
+    BM25 index over a tokenized corpus.
+
+    Args:
+        tokenized_corpus: One token list per document
+        k1: Term frequency saturation
+        b: Length normalization strength
+        epsilon: Floor for negative IDFs, as a fraction of the average IDF
+    """
+
+    def __init__(
+        self,
+        tokenized_corpus: list[list[str]],
+        k1: float = 1.5,
+        b: float = 0.75,
+        epsilon: float = 0.25
+    ):
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+
+        self.vocabulary: dict[str, int] = {}
+        term_ids, doc_ids, term_freqs = self._postings(tokenized_corpus, first_doc=0)
+        self._build(
+            np.asarray(term_ids, dtype=np.int64),
+            np.asarray(doc_ids, dtype=np.int32),
+            np.asarray(term_freqs, dtype=np.int32),
+            np.fromiter((len(tokens) for tokens in tokenized_corpus), dtype=np.float64,
+                        count=len(tokenized_corpus))
+        )
+
+    def _postings(self, tokenized_corpus: list[list[str]], first_doc: int) -> tuple[list, list, list]:
+        """
+        Postings as (term, doc, tf) triples, in document order; new terms are
+        added to the vocabulary.
+
+        Returns:
+            Tuple of (term IDs, document IDs from first_doc, term frequencies)
+        """
+        term_ids, doc_ids, term_freqs = [], [], []
+        for doc_id, tokens in enumerate(tokenized_corpus, start=first_doc):
+            for token, tf in Counter(tokens).items():
+                term_ids.append(self.vocabulary.setdefault(token, len(self.vocabulary)))
+                doc_ids.append(doc_id)
+                term_freqs.append(tf)
+        return term_ids, doc_ids, term_freqs
+
+    def _build(self, term_ids: np.ndarray, doc_ids: np.ndarray, term_freqs: np.ndarray, doc_lengths: np.ndarray):
+        """Compute the matrix and statistics from postings (each term's in document order)."""
+        self.corpus_size = len(doc_lengths)
+        self.doc_lengths = doc_lengths
+        self.avgdl = float(self.doc_lengths.mean()) if self.corpus_size else 0.0
+        k1, b = self.k1, self.b
+
+        # Group postings by term (stable, so each row stays in document order)
+        order = np.argsort(term_ids, kind="stable")
+        doc_freqs = np.bincount(term_ids, minlength=len(self.vocabulary))
+        self.indptr = np.zeros(len(self.vocabulary) + 1, dtype=np.int64)
+        np.cumsum(doc_freqs, out=self.indptr[1:])
+        self.indices = doc_ids[order]
+        self.term_freqs = term_freqs[order]
+
+        self.idf = self._compute_idf(doc_freqs)
+
+        # Precompute idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * dl / avgdl))
+        norms = k1 * (1 - b + b * self.doc_lengths / self.avgdl) if self.avgdl else np.full(self.corpus_size, k1)
+        row_idf = np.repeat(self.idf, doc_freqs)
+        tf = self.term_freqs.astype(np.float64)
+        self.data = row_idf * tf * (k1 + 1) / (tf + norms[self.indices])
+
+    def updated(self, keep: np.ndarray, added_corpus: list[list[str]]) -> "SparseBM25":
+        """
+        Index with some documents removed and others appended, reusing the
+        postings of kept documents instead of re-tokenizing them. IDF and
+        length normalization are recomputed for the new corpus, so scores
+        equal those of an index built from scratch.
+
+        Args:
+            keep: Boolean mask over the current documents
+            added_corpus: One token list per appended document
+
+        Returns:
+            New SparseBM25; kept documents are renumbered in order, followed
+            by the appended ones
+        """
+        keep = np.asarray(keep, dtype=bool)
+        engine = SparseBM25.__new__(SparseBM25)
+        engine.k1, engine.b, engine.epsilon = self.k1, self.b, self.epsilon
+        engine.vocabulary = dict(self.vocabulary)
+
+        # Kept postings (term-major, documents ascending), then the new documents'
+        kept = keep[self.indices]
+        new_doc_ids = np.cumsum(keep, dtype=np.int64) - 1
+        row_terms = np.repeat(np.arange(len(self.indptr) - 1, dtype=np.int64), np.diff(self.indptr))
+        added_terms, added_docs, added_freqs = engine._postings(added_corpus, first_doc=int(keep.sum()))
+        term_ids = np.concatenate([row_terms[kept], np.asarray(added_terms, dtype=np.int64)])
+        doc_ids = np.concatenate([
+            new_doc_ids[self.indices[kept]].astype(np.int32), np.asarray(added_docs, dtype=np.int32)
+        ])
+        term_freqs = np.concatenate([self.term_freqs[kept], np.asarray(added_freqs, dtype=np.int32)])
+
+        # Drop terms that occurred only in removed documents
+        used = np.bincount(term_ids, minlength=len(engine.vocabulary)) > 0
+        if not used.all():
+            term_map = np.cumsum(used) - 1
+            term_ids = term_map[term_ids]
+            engine.vocabulary = {
+                term: int(term_map[i]) for term, i in engine.vocabulary.items() if used[i]
+            }
+
+        engine._build(term_ids, doc_ids, term_freqs, np.concatenate([
+            self.doc_lengths[keep],
+            np.fromiter((len(tokens) for tokens in added_corpus), dtype=np.float64, count=len(added_corpus))
+        ]))
+        return engine
+
+    def state(self) -> dict:
+        """
+        Fully computed index state, for persisting.
+
+        Returns:
+            Dict of parameters, vocabulary (terms in ID order) and arrays
+        """
+        return {
+            "k1": self.k1,
+            "b": self.b,
+            "epsilon": self.epsilon,
+            "avgdl": self.avgdl,
+            "terms": list(self.vocabulary),
+            "indptr": self.indptr,
+            "indices": self.indices,
+            "term_freqs": self.term_freqs,
+            "data": self.data,
+            "idf": self.idf,
+            "doc_lengths": self.doc_lengths
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "SparseBM25":
+        """Restore an index saved with state(), without recomputing anything."""
+        engine = cls.__new__(cls)
+        engine.k1 = state["k1"]
+        engine.b = state["b"]
+        engine.epsilon = state["epsilon"]
+        engine.avgdl = state["avgdl"]
+        engine.vocabulary = {term: i for i, term in enumerate(state["terms"])}
+        engine.indptr = state["indptr"]
+        engine.indices = state["indices"]
+        engine.term_freqs = state["term_freqs"]
+        engine.data = state["data"]
+        engine.idf = state["idf"]
+        engine.doc_lengths = state["doc_lengths"]
+        engine.corpus_size = len(engine.doc_lengths)
+        return engine
+
+    def _compute_idf(self, doc_freqs: np.ndarray) -> np.ndarray:
+        """IDF per term, with negatives (terms in over half the corpus) floored."""
+        idf = np.log(self.corpus_size - doc_freqs + 0.5) - np.log(doc_freqs + 0.5)
+        if len(idf):
+            average_idf = idf.sum() / len(idf)
+            idf[idf < 0] = self.epsilon * average_idf
+        return idf
+
+    def get_scores(self, query_tokens: list[str]) -> np.ndarray:
+        """
+        Score every document against a query.
+
+        Returns:
+            Array of BM25 scores, one per document (repeated query terms count
+            once per occurrence; unknown terms contribute nothing)
+        """
+        rows, counts = [], []
+        for token, count in Counter(query_tokens).items():
+            term_id = self.vocabulary.get(token)
+            if term_id is not None:
+                rows.append(term_id)
+                counts.append(count)
+
+        if not rows:
+            return np.zeros(self.corpus_size)
+        if len(rows) == 1:
+            start, end = self.indptr[rows[0]], self.indptr[rows[0] + 1]
+            scores = np.zeros(self.corpus_size)
+            scores[self.indices[start:end]] = self.data[start:end] * counts[0]
+            return scores
+
+        slices = [slice(self.indptr[row], self.indptr[row + 1]) for row in rows]
+        indices = np.concatenate([self.indices[s] for s in slices])
+        weights = np.concatenate([self.data[s] * count for s, count in zip(slices, counts)])
+        return np.bincount(indices, weights=weights, minlength=self.corpus_size)
+
+    def top_k(self, query_tokens: list[str], k: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Best-scoring documents for a query.
+
+        Ties are broken by document order, as a stable sort of all scores would.
+
+        Returns:
+            (document indices, scores), best first, at most k of each (none if k <= 0)
+        """
+        scores = self.get_scores(query_tokens)
+        best = select_top_k(scores, k)
+        return best, scores[best]
+
+
+def select_top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores, best first, ties in index order.
+
+    Uses argpartition, so only the selected k are sorted.
+    """
+    n = len(scores)
+    k = min(k, n)
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64)
+
+    if k < n:
+        kth = scores[np.argpartition(-scores, k - 1)[k - 1]]
+        # Everything above the k-th score, then the earliest documents tied with it
+        above = np.flatnonzero(scores > kth)
+        tied = np.flatnonzero(scores == kth)[:k - len(above)]
+        selected = np.concatenate([above, tied])
+    else:
+        selected = np.arange(n)
+
+    return selected[np.lexsort((selected, -scores[selected]))]
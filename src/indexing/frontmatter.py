@@ -0,0 +1,296 @@
+"""
+Frontmatter Loading and Validation
+
+Splits YAML frontmatter off a policy markdown document by locating the
+closing '---' fence with a plain string search (the block may itself be
+wrapped in a ```yaml code fence, as LLM-converted documents often are),
+parses it with libyaml's
+CSafeLoader when PyYAML was built with it (pure-Python SafeLoader
+otherwise), and validates it against schemas/policy_frontmatter.schema.json.
+
+The schema is compiled once into nested check functions, so validating a
+document is a walk over its frontmatter with no schema interpretation.
+Only the JSON Schema keywords the frontmatter schema uses are supported;
+compiling a schema with any other keyword raises ValueError.
+"""
+
+import datetime
+import json
+import mmap
+import re
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import yaml
+
+# libyaml bindings are optional in PyYAML builds
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Errors are appended to the list as "<path>: <message>"
+Validator = Callable[[Any, str, list], None]
+
+# Keywords that only document the schema
+ANNOTATION_KEYWORDS = {"$schema", "$id", "title", "description"}
+
+JSON_TYPES = {
+    "string": str,
+    "object": dict,
+    "array": list,
+    "boolean": bool,
+    "null": type(None),
+    "integer": int,
+    "number": (int, float)
+}
+
+# Frontmatter starts with one of these; the second is the fenced form
+#   ```yaml / --- / ... / --- / ```
+FRONTMATTER_OPENERS = ("---\n", "```yaml\n---\n")
+FRONTMATTER_CLOSE = "\n---\n"
+CODE_FENCE = "```"
+
+FORMAT_PATTERNS = {
+    "date": re.compile(r'^\d{4}-\d{2}-\d{2}$'),
+    "email": re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+}
+
+
+def default_schema_path() -> Path:
+    """Get the frontmatter schema location (schemas/policy_frontmatter.schema.json)."""
+    # Navigate up from src/indexing/frontmatter.py
+    project_root = Path(__file__).resolve().parent.parent.parent
+    return project_root / "schemas" / "policy_frontmatter.schema.json"
+
+
+def _type_name(value: Any) -> str:
+    for name, python_type in JSON_TYPES.items():
+        if isinstance(value, python_type) and not (isinstance(value, bool) and name in ("integer", "number")):
+            return name
+    return type(value).__name__
+
+
+def _is_type(value: Any, name: str, format_name: Optional[str]) -> bool:
+    if name in ("integer", "number") and isinstance(value, bool):
+        return False
+    if name == "string" and format_name == "date" and isinstance(value, datetime.date):
+        return True  # YAML loads unquoted YYYY-MM-DD as a date
+    return isinstance(value, JSON_TYPES[name])
+
+
+def compile_schema(schema: dict) -> Validator:
+    """
+    Compile a JSON Schema (the subset used by the frontmatter schema) into a
+    validator function.
+
+    Returns:
+        validate(value, path, errors), appending one message per violation
+    """
+    unsupported = set(schema) - ANNOTATION_KEYWORDS - {
+        "type", "enum", "pattern", "minLength", "minItems", "format",
+        "required", "properties", "items"
+    }
+    if unsupported:
+        raise ValueError(f"Unsupported schema keyword(s): {', '.join(sorted(unsupported))}")
+
+    types = schema.get("type")
+    if isinstance(types, str):
+        types = [types]
+    format_name = schema.get("format")
+    format_pattern = FORMAT_PATTERNS.get(format_name)
+    pattern = re.compile(schema["pattern"]) if "pattern" in schema else None
+    enum = schema.get("enum")
+    min_length = schema.get("minLength")
+    min_items = schema.get("minItems")
+    required = schema.get("required", [])
+    properties = {
+        name: compile_schema(subschema)
+        for name, subschema in schema.get("properties", {}).items()
+    }
+    items = compile_schema(schema["items"]) if "items" in schema else None
+
+    def validate(value: Any, path: str, errors: list):
+        if types and not any(_is_type(value, name, format_name) for name in types):
+            errors.append(f"{path}: expected {' or '.join(types)}, got {_type_name(value)}")
+            return
+
+        if enum is not None and value not in enum:
+            errors.append(f"{path}: {value!r} is not one of {enum}")
+
+        if isinstance(value, str):
+            if pattern and not pattern.search(value):
+                errors.append(f"{path}: {value!r} does not match {pattern.pattern}")
+            if min_length is not None and len(value) < min_length:
+                errors.append(f"{path}: shorter than {min_length} characters")
+            if format_pattern and not format_pattern.match(value):
+                errors.append(f"{path}: {value!r} is not a valid {format_name}")
+
+        elif isinstance(value, dict):
+            for name in required:
+                if name not in value:
+                    errors.append(f"{path}: missing required field '{name}'")
+            for name, validate_property in properties.items():
+                if name in value:
+                    validate_property(value[name], f"{path}.{name}", errors)
+
+        elif isinstance(value, list):
+            if min_items is not None and len(value) < min_items:
+                errors.append(f"{path}: fewer than {min_items} items")
+            if items:
+                for i, item in enumerate(value):
+                    items(item, f"{path}[{i}]", errors)
+
+    return validate
+
+
+@lru_cache(maxsize=None)
+def load_validator(schema_path: Optional[str | Path] = None) -> Validator:
+    """Compile the frontmatter schema (once per schema file)."""
+    with open(schema_path or default_schema_path(), encoding="utf-8") as f:
+        return compile_schema(json.load(f))
+
+
+@dataclass
+class FrontmatterResult:
+    """Frontmatter of one document, with where its body starts."""
+    frontmatter: dict
+    body_start: int  # Offset of the body in the content (0 without frontmatter)
+    found: bool  # A closed --- block was present
+    errors: list[str] = field(default_factory=list)  # Schema violations
+    load_seconds: float = 0.0
+    validate_seconds: float = 0.0
+
+
+def frontmatter_bounds(content: str | bytes | mmap.mmap) -> Optional[tuple[int, int, int]]:
+    """
+    Locate the frontmatter block without scanning the body.
+
+    Works on text and on bytes (including memory-mapped files), where the
+    offsets are byte offsets.
+
+    Returns:
+        Tuple of (YAML start, YAML end, body start), or None without a
+        closed frontmatter block
+    """
+    encode = (lambda text: text) if isinstance(content, str) else str.encode
+
+    for opener in FRONTMATTER_OPENERS:
+        if content[:len(opener)] == encode(opener):
+            break
+    else:
+        return None
+    start = len(opener)
+
+    # Find the closing --- (the block may be empty)
+    end = content.find(encode(FRONTMATTER_CLOSE), start - 1)
+    if end == -1:
+        return None
+    body_start = end + len(FRONTMATTER_CLOSE)
+
+    # Skip the line closing a ```yaml fence
+    if opener != FRONTMATTER_OPENERS[0] and content[body_start:body_start + 3] == encode(CODE_FENCE):
+        line_end = content.find(encode("\n"), body_start)
+        body_start = len(content) if line_end == -1 else line_end + 1
+
+    return start, max(start, end), body_start
+
+
+def split_frontmatter(content: str) -> tuple[Optional[str], int]:
+    """
+    Split the frontmatter off a document (see frontmatter_bounds).
+
+    Returns:
+        Tuple of (YAML text or None, offset where the body starts)
+    """
+    bounds = frontmatter_bounds(content)
+    if bounds is None:
+        return None, 0
+
+    start, end, body_start = bounds
+    return content[start:end], body_start
+
+
+def load_frontmatter(content: str, validator: Optional[Validator] = None) -> FrontmatterResult:
+    """
+    Parse (and optionally validate) a document's frontmatter.
+
+    Args:
+        content: Full markdown text
+        validator: Compiled schema from load_validator(); None skips validation
+
+    Returns:
+        FrontmatterResult; frontmatter is {} if absent or not valid YAML
+    """
+    start = time.perf_counter()
+    yaml_content, body_start = split_frontmatter(content)
+
+    errors = []
+    frontmatter = {}
+    if yaml_content is not None:
+        try:
+            frontmatter = yaml.load(yaml_content, Loader=YAML_LOADER) or {}
+        except yaml.YAMLError as e:
+            errors.append(f"frontmatter: invalid YAML: {e}")
+    loaded = time.perf_counter()
+
+    if validator is not None:
+        if yaml_content is None:
+            errors.append("frontmatter: missing (document must start with a --- or ```yaml block)")
+        elif not errors:
+            validator(frontmatter, "frontmatter", errors)
+
+    return FrontmatterResult(
+        frontmatter=frontmatter if isinstance(frontmatter, dict) else {},
+        body_start=body_start,
+        found=yaml_content is not None,
+        errors=errors,
+        load_seconds=loaded - start,
+        validate_seconds=time.perf_counter() - loaded
+    )
+
+
+def check_frontmatter_files(
+    directory: str | Path,
+    schema_path: Optional[str | Path] = None
+) -> dict[str, FrontmatterResult]:
+    """
+    Load and validate the frontmatter of every markdown file in a directory,
+    printing per-file timings and schema violations.
+
+    Returns:
+        Dict of filename → FrontmatterResult
+    """
+    validator = load_validator(schema_path)
+    results = {}
+
+    for md_path in sorted(Path(directory).glob("*.md")):
+        result = load_frontmatter(md_path.read_text(encoding="utf-8"), validator)
+        results[md_path.name] = result
+
+        status = "OK" if not result.errors else f"{len(result.errors)} error(s)"
+        print(f"{md_path.name}: load {result.load_seconds * 1000:.2f}ms, "
+              f"validate {result.validate_seconds * 1000:.2f}ms [{status}]")
+        for error in result.errors[:10]:
+            print(f"    - {error}")
+        if len(result.errors) > 10:
+            print(f"    ... and {len(result.errors) - 10} more")
+
+    total_load = sum(r.load_seconds for r in results.values())
+    total_validate = sum(r.validate_seconds for r in results.values())
+    valid = sum(1 for r in results.values() if not r.errors)
+    print(f"\n{valid}/{len(results)} valid; load {total_load * 1000:.1f}ms, "
+          f"validate {total_validate * 1000:.1f}ms total ({YAML_LOADER.__name__})")
+
+    return results
+
+
+# CLI for testing
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python -m indexing.frontmatter <markdown_directory> [schema.json]")
+        sys.exit(1)
+
+    check_frontmatter_files(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
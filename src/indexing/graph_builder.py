@@ -21,6 +21,28 @@ import networkx as nx
 from .markdown_parser import parse_all_markdown_files, ParsedDocument, Section
 
 
+# Frontmatter `entities` keys → entity node types
+FRONTMATTER_ENTITY_TYPES = {
+    "roles": "role",
+    "controls": "control",
+    "assets": "asset",
+    "processes": "process",
+    "external_parties": "external",
+    "frameworks": "framework"
+}
+
+# Section entity keys → entity node types
+SECTION_ENTITY_TYPES = {
+    "roles": "role",
+    "controls": "control",
+    "assets": "asset",
+    "processes": "process",
+    "external": "external",
+    "documents": "doc",
+    "frameworks": "framework"
+}
+
+
 @dataclass
 class GraphStats:
     """Statistics about the knowledge graph."""
@@ -119,15 +141,7 @@ class KnowledgeGraphBuilder:
         for entity_type, entity_list in frontmatter_entities.items():
             if isinstance(entity_list, list):
                 # Map frontmatter keys to our entity types
-                type_mapping = {
-                    "roles": "role",
-                    "controls": "control",
-                    "assets": "asset",
-                    "processes": "process",
-                    "external_parties": "external",
-                    "frameworks": "framework"
-                }
-                mapped_type = type_mapping.get(entity_type, entity_type.rstrip('s'))
+                mapped_type = FRONTMATTER_ENTITY_TYPES.get(entity_type, entity_type.rstrip('s'))
 
                 for entity_value in entity_list:
                     entity_node = self._add_entity_node(mapped_type, entity_value)
@@ -177,17 +191,7 @@ class KnowledgeGraphBuilder:
             section_entities = []
 
             # From parsed entities dict
-            entity_types = {
-                "roles": "role",
-                "controls": "control",
-                "assets": "asset",
-                "processes": "process",
-                "external": "external",
-                "documents": "doc",
-                "frameworks": "framework"
-            }
-
-            for entity_key, mapped_type in entity_types.items():
+            for entity_key, mapped_type in SECTION_ENTITY_TYPES.items():
                 for entity_value in section.entities.get(entity_key, []):
                     entity_node = self._add_entity_node(mapped_type, entity_value)
                     section_entities.append(entity_node)
@@ -216,6 +220,125 @@ class KnowledgeGraphBuilder:
                 topic_node = self._add_entity_node("topic", topic)
                 self.graph.add_edge(section_node, topic_node, edge_type="MAPS_TO")
 
+    def _section_owners(self, section_node: str) -> set[str]:
+        """Document nodes with a CONTAINS edge to a section node."""
+        return {
+            doc_node for doc_node in self.graph.predecessors(section_node)
+            if self.graph[doc_node][section_node].get("edge_type") == "CONTAINS"
+        }
+
+    def related_documents(self, document_ids: set[str]) -> set[str]:
+        """
+        Documents that share section nodes (same section ID) with the given
+        ones, transitively, including the given ones.
+        """
+        related = set(document_ids)
+        pending = list(document_ids)
+        while pending:
+            doc_node = f"doc:{pending.pop()}"
+            if not self.graph.has_node(doc_node):
+                continue
+            for node in self.graph.successors(doc_node):
+                if self.graph.nodes[node].get("node_type") != "section":
+                    continue
+                for owner in self._section_owners(node):
+                    document_id = self.graph.nodes[owner].get("document_id")
+                    if document_id and document_id not in related:
+                        related.add(document_id)
+                        pending.append(document_id)
+        return related
+
+    def remove_documents(self, documents: list[ParsedDocument]):
+        """
+        Undo add_document() for each document: remove their sections and
+        edges, their sections' co-occurrence counts, and entities nothing else
+        links to. A removed document that others reference is kept as a
+        placeholder node.
+
+        Each document must be the version that was added (e.g. from the parse
+        cache). Files with the same document ID share a document node, and
+        sections with the same ID share a section node, so all documents
+        sharing either must be removed together (see related_documents()).
+
+        Raises:
+            ValueError: If a document or section node is shared with a document
+                not being removed
+        """
+        removing = {f"doc:{doc.document_id}" for doc in documents}
+        section_nodes = {f"section:{section.section_id}" for doc in documents for section in doc.sections}
+
+        for doc_node in removing:
+            if not self.graph.has_node(doc_node):
+                continue
+            for node in self.graph.successors(doc_node):
+                if self.graph[doc_node][node].get("edge_type") == "CONTAINS" and node not in section_nodes:
+                    raise ValueError(
+                        f"{doc_node} also contains {node} from a document not being removed; "
+                        f"remove all documents with this ID together"
+                    )
+        for section_node in section_nodes:
+            if self.graph.has_node(section_node):
+                others = self._section_owners(section_node) - removing
+                if others:
+                    raise ValueError(
+                        f"{section_node} is shared with {', '.join(sorted(others))}; "
+                        f"remove them together"
+                    )
+
+        for doc in documents:
+            self._remove_document(doc)
+
+    def _remove_document(self, doc: ParsedDocument):
+        """Remove one document's contributions (see remove_documents())."""
+        doc_node = f"doc:{doc.document_id}"
+        touched = set()  # Nodes that may be left unconnected
+
+        for section in doc.sections:
+            section_node = f"section:{section.section_id}"
+            section_entities = [
+                self._normalize_entity_id(mapped_type, entity_value)
+                for entity_key, mapped_type in SECTION_ENTITY_TYPES.items()
+                for entity_value in section.entities.get(entity_key, [])
+            ]
+
+            # Take back this section's co-occurrence counts
+            for i, e1 in enumerate(section_entities):
+                for e2 in section_entities[i+1:]:
+                    if self.graph.has_edge(e1, e2):
+                        weight = self.graph[e1][e2].get("weight", 1) - 1
+                        if weight > 0:
+                            self.graph[e1][e2]["weight"] = weight
+                        else:
+                            self.graph.remove_edge(e1, e2)
+
+            touched.update(section_entities)
+            touched.update(self._normalize_entity_id("topic", topic) for topic in section.likely_maps_to)
+            if self.graph.has_node(section_node):
+                self.graph.remove_node(section_node)
+
+            for entity_node in self.section_to_entities.pop(section.section_id, set()):
+                sections = self.entity_to_sections.get(entity_node)
+                if sections is not None:
+                    sections.discard(section.section_id)
+                    if not sections:
+                        del self.entity_to_sections[entity_node]
+
+        if self.graph.has_node(doc_node):
+            touched.update(self.graph.successors(doc_node))
+            if self.graph.in_degree(doc_node):
+                # Still referenced: keep a placeholder, as for unindexed references
+                self.graph.remove_edges_from(list(self.graph.out_edges(doc_node)))
+                self.graph.nodes[doc_node].clear()
+                self.graph.nodes[doc_node].update(
+                    node_type="document", label=doc.title, document_id=doc.document_id
+                )
+            else:
+                self.graph.remove_node(doc_node)
+
+        for node in touched:
+            if self.graph.has_node(node) and self.graph.degree(node) == 0:
+                self.graph.remove_node(node)
+
     def build_from_documents(self, documents: list[ParsedDocument]):
         """Build the graph from a list of parsed documents."""
         for doc in documents:
@@ -300,19 +423,25 @@ class KnowledgeGraphBuilder:
         return builder
 
 
-def build_knowledge_graph(markdown_dir: str | Path, output_dir: str | Path) -> KnowledgeGraphBuilder:
+def build_knowledge_graph(
+    markdown_dir: str | Path,
+    output_dir: str | Path,
+    documents: Optional[list[ParsedDocument]] = None
+) -> KnowledgeGraphBuilder:
     """
     Build and save a knowledge graph from markdown policy documents.
 
     Args:
         markdown_dir: Directory containing markdown policy files
         output_dir: Directory to save the graph
+        documents: Documents already parsed from markdown_dir (parsed here if omitted)
 
     Returns:
         The KnowledgeGraphBuilder instance
     """
     # Parse all documents
-    documents = parse_all_markdown_files(markdown_dir)
+    if documents is None:
+        documents = parse_all_markdown_files(markdown_dir)
 
     # Build graph
     builder = KnowledgeGraphBuilder()
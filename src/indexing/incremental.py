@@ -0,0 +1,338 @@
+"""
+Incremental Index Updates
+
+Records what was indexed (a manifest of per-file content hashes and chunk
+IDs, written next to the indexes) and, on later runs, diffs the markdown
+directory against it and applies only the differences:
+
+- BM25: chunks of changed/deleted files are dropped and the new chunks
+  appended; kept chunks are not re-tokenized (BM25Index.update)
+- ChromaDB: only the new chunks are embedded (VectorStore.add_chunks)
+- Knowledge graph: the old versions of changed files (from the parse
+  cache) are removed and the new ones added (KnowledgeGraphBuilder)
+
+Settings that change every chunk's terms or embeddings (tokenizer,
+embedding model) cannot be updated incrementally; a full build is needed.
+"""
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from .graph_builder import KnowledgeGraphBuilder, build_knowledge_graph
+from .frontmatter import load_validator
+from .index_builder import (
+    BUNDLE_FILENAME, BM25Index, IndexedChunk, VectorStore, create_chunks_from_documents
+)
+from .markdown_parser import ParsedDocument, parse_all_markdown_files, parse_markdown_content
+from .parse_cache import ParseCache
+from .tokenizer import TokenizerConfig
+
+
+MANIFEST_FILENAME = "index_manifest.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class IndexedFile:
+    """Indexed state of one markdown file."""
+    sha256: str
+    document_id: str
+    chunk_ids: list[str]
+
+
+@dataclass
+class IndexManifest:
+    """What the indexes in a directory were built from."""
+    files: dict[str, IndexedFile]  # Filename → state
+    tokenizer: dict  # TokenizerConfig.to_dict() of the BM25 index
+    embedding_model: Optional[str] = None  # None: no vector store
+    graph: bool = False  # Knowledge graph built
+
+    def save(self, index_dir: str | Path):
+        path = Path(index_dir) / MANIFEST_FILENAME
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"version": MANIFEST_VERSION, **asdict(self)}, f, indent=2, ensure_ascii=False)
+        print(f"Index manifest saved to {path}")
+
+    @classmethod
+    def load(cls, index_dir: str | Path) -> Optional["IndexManifest"]:
+        """Load the manifest of an index directory (None if there is none)."""
+        path = Path(index_dir) / MANIFEST_FILENAME
+        if not path.exists():
+            return None
+
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.pop("version", 1) > MANIFEST_VERSION:
+            raise ValueError(f"{path.name} is newer than this code; run a full build")
+
+        data["files"] = {name: IndexedFile(**state) for name, state in data["files"].items()}
+        return cls(**data)
+
+
+@dataclass
+class IndexChanges:
+    """Markdown files that differ from the indexed state (filenames)."""
+    added: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+
+def hash_markdown_files(directory: str | Path) -> dict[str, str]:
+    """SHA-256 of each markdown file in a directory, by filename."""
+    return {
+        md_path.name: hashlib.sha256(md_path.read_bytes()).hexdigest()
+        for md_path in sorted(Path(directory).glob("*.md"))
+    }
+
+
+def diff_files(manifest: IndexManifest, hashes: dict[str, str]) -> IndexChanges:
+    """Compare current file hashes against the indexed state."""
+    changes = IndexChanges()
+    for name, sha256 in hashes.items():
+        indexed = manifest.files.get(name)
+        if indexed is None:
+            changes.added.append(name)
+        elif indexed.sha256 != sha256:
+            changes.updated.append(name)
+        else:
+            changes.unchanged.append(name)
+    changes.removed = sorted(set(manifest.files) - set(hashes))
+    return changes
+
+
+def build_manifest(
+    markdown_dir: str | Path,
+    documents: list[ParsedDocument],
+    chunks: list[IndexedChunk],
+    tokenizer_config: TokenizerConfig,
+    embedding_model: Optional[str],
+    graph: bool
+) -> IndexManifest:
+    """
+    Manifest of a full build.
+
+    Args:
+        markdown_dir: Directory the documents were parsed from
+        documents: Indexed documents
+        chunks: Indexed chunks
+        tokenizer_config: Tokenizer of the BM25 index
+        embedding_model: Model of the vector store (None if not built)
+        graph: Whether the knowledge graph was built
+    """
+    hashes = hash_markdown_files(markdown_dir)
+
+    # Chunks follow their documents in order; files may share a document ID
+    files = {}
+    position = 0
+    for doc in documents:
+        count = len(create_chunks_from_documents([doc]))
+        files[doc.filename] = IndexedFile(
+            sha256=hashes[doc.filename],
+            document_id=doc.document_id,
+            chunk_ids=[chunk.chunk_id for chunk in chunks[position:position + count]]
+        )
+        position += count
+
+    return IndexManifest(
+        files=files,
+        tokenizer=tokenizer_config.to_dict(),
+        embedding_model=embedding_model,
+        graph=graph
+    )
+
+
+def _parse_file(md_path: Path, cache: Optional[ParseCache]) -> tuple[ParsedDocument, str]:
+    """Parse a markdown file (via the cache if given), with the hash of the bytes parsed."""
+    data = md_path.read_bytes()
+    sha256 = hashlib.sha256(data).hexdigest()
+    doc = cache.get(md_path, sha256) if cache else None
+    if doc is None:
+        doc = parse_markdown_content(md_path, data.decode("utf-8"), validator=load_validator())
+        if cache:
+            cache.put(doc, sha256)
+    return doc, sha256
+
+
+def _update_graph(
+    markdown_dir: Path,
+    index_dir: Path,
+    manifest: IndexManifest,
+    replaced: list[str],
+    new_docs: dict[str, ParsedDocument],
+    cache: Optional[ParseCache]
+):
+    """Remove the indexed versions of replaced files from the graph and add the new ones."""
+    builder = None
+    if (index_dir / "knowledge_graph.pkl").exists():
+        builder = KnowledgeGraphBuilder.load(index_dir)
+
+    if builder is not None:
+        # The graph keys documents by document_id (cross-references resolve to
+        # it), so files with the same ID share one document node
+        for document_id in sorted({manifest.files[name].document_id for name in replaced}):
+            sharing = sorted(name for name, indexed in manifest.files.items() if indexed.document_id == document_id)
+            if len(sharing) > 1:
+                print(f"  [WARN] {len(sharing)} files share document_id {document_id} "
+                      f"({', '.join(sharing)}); their graph nodes are merged, so all are re-added")
+
+        # Files sharing a document or section node with a replaced file are
+        # removed and re-added with it
+        affected_ids = builder.related_documents({manifest.files[name].document_id for name in replaced})
+        affected = sorted(name for name, indexed in manifest.files.items() if indexed.document_id in affected_ids)
+
+        # Indexed versions come from the parse cache (by their old hash)
+        old_docs = {}
+        for name in affected:
+            old = cache.get(markdown_dir / name, manifest.files[name].sha256) if cache else None
+            if old is None:
+                print(f"Indexed version of {name} not in the parse cache; rebuilding the graph")
+                builder = None
+                break
+            old_docs[name] = old
+
+    if builder is not None:
+        try:
+            builder.remove_documents(list(old_docs.values()))
+        except ValueError as e:
+            print(f"Cannot update the graph incrementally ({e}); rebuilding it")
+            builder = None
+
+    if builder is None:
+        documents = parse_all_markdown_files(markdown_dir, cache=cache)
+        build_knowledge_graph(markdown_dir, index_dir, documents=documents)
+        return
+
+    # Unchanged affected files are re-added as they were
+    readd = {name: doc for name, doc in old_docs.items() if name not in replaced}
+    readd.update(new_docs)
+    for name in sorted(readd):
+        print(f"Adding to graph: {readd[name].title}")
+        builder.add_document(readd[name])
+
+    print(f"Graph updated: {builder.graph.number_of_nodes()} nodes, {builder.graph.number_of_edges()} edges")
+    builder.save(index_dir)
+
+
+def update_indexes(
+    markdown_dir: str | Path,
+    index_dir: str | Path,
+    tokenizer_config: Optional[TokenizerConfig] = None,
+    embedding_model: Optional[str] = "text-embedding-3-small",
+    graph: bool = True,
+    cache: Optional[ParseCache] = None
+) -> IndexChanges:
+    """
+    Bring the indexes in index_dir up to date with markdown_dir, processing
+    only added, changed and deleted files.
+
+    Args:
+        markdown_dir: Directory containing markdown policy files
+        index_dir: Directory of a full build (with its manifest)
+        tokenizer_config: BM25 tokenizer settings; must match the index
+        embedding_model: Embedding model; must match the vector store
+            (None if it was built without one)
+        graph: Whether the knowledge graph was built (must match)
+        cache: Parse cache; needed to update the graph without a rebuild
+
+    Returns:
+        The changes applied
+
+    Raises:
+        ValueError: If there is no manifest or the settings differ from the
+            indexed ones (a full build is needed)
+    """
+    markdown_dir = Path(markdown_dir)
+    index_dir = Path(index_dir)
+    tokenizer_config = tokenizer_config or TokenizerConfig()
+
+    manifest = IndexManifest.load(index_dir)
+    if manifest is None:
+        raise ValueError(f"No {MANIFEST_FILENAME} in {index_dir}; run a full build first")
+    if TokenizerConfig.from_dict(manifest.tokenizer) != tokenizer_config:
+        raise ValueError(f"Tokenizer settings differ from the index ({manifest.tokenizer}); run a full build")
+    if embedding_model != manifest.embedding_model:
+        def describe(model: Optional[str]) -> str:
+            return f"embedding model {model!r}" if model else "no vector store"
+        raise ValueError(
+            f"Index was built with {describe(manifest.embedding_model)}, not "
+            f"{describe(embedding_model)}; run a full build"
+        )
+    if graph != manifest.graph:
+        raise ValueError(f"Index was built {'with' if manifest.graph else 'without'} the knowledge graph; "
+                         f"run a full build")
+
+    changes = diff_files(manifest, hash_markdown_files(markdown_dir))
+    print(f"{len(changes.added)} added, {len(changes.updated)} changed, "
+          f"{len(changes.removed)} deleted, {len(changes.unchanged)} unchanged")
+    if not changes.has_changes:
+        return changes
+
+    # Parse new versions; files that fail keep their indexed state
+    new_docs = {}
+    hashes = {}
+    for name in changes.added + changes.updated:
+        print(f"Parsing: {name}")
+        try:
+            new_docs[name], hashes[name] = _parse_file(markdown_dir / name, cache)
+        except Exception as e:
+            print(f"  [ERROR] {e}")
+            continue
+        print(f"  [OK] {len(new_docs[name].sections)} sections")
+    changes.added = [name for name in changes.added if name in new_docs]
+    changes.updated = [name for name in changes.updated if name in new_docs]
+    replaced = changes.updated + changes.removed
+
+    # New chunks must not reuse IDs of chunks that stay
+    removed_chunk_ids = {chunk_id for name in replaced for chunk_id in manifest.files[name].chunk_ids}
+    taken_ids = {
+        chunk_id for indexed in manifest.files.values() for chunk_id in indexed.chunk_ids
+    } - removed_chunk_ids
+    new_chunks = {}
+    for name in sorted(new_docs):
+        new_chunks[name] = create_chunks_from_documents([new_docs[name]], taken_ids)
+        taken_ids.update(chunk.chunk_id for chunk in new_chunks[name])
+    added_chunks = [chunk for name in sorted(new_chunks) for chunk in new_chunks[name]]
+
+    # New IDs are dropped too, so a rerun after an interrupted update (indexes
+    # written, manifest not) replaces its chunks instead of duplicating them
+    stale_ids = removed_chunk_ids | {chunk.chunk_id for chunk in added_chunks}
+
+    print("\n=== Updating BM25 Index ===")
+    bm25_index = BM25Index()
+    bm25_index.load_bundle(index_dir / BUNDLE_FILENAME)
+    bm25_index.update(stale_ids, added_chunks)
+    bm25_index.save_bundle(index_dir / BUNDLE_FILENAME)
+
+    if embedding_model is not None:
+        print("\n=== Updating Vector Store ===")
+        vector_store = VectorStore(index_dir / "chromadb")
+        vector_store.initialize()
+        vector_store.delete_chunks(sorted(stale_ids))
+        vector_store.add_chunks(added_chunks, embedding_model)
+        print(f"Vector store updated: {len(removed_chunk_ids)} chunks removed, {len(added_chunks)} added")
+
+    if graph:
+        print("\n=== Updating Knowledge Graph ===")
+        _update_graph(markdown_dir, index_dir, manifest, replaced, new_docs, cache)
+
+    for name in replaced:
+        del manifest.files[name]
+    for name, doc in new_docs.items():
+        manifest.files[name] = IndexedFile(
+            sha256=hashes[name],
+            document_id=doc.document_id,
+            chunk_ids=[chunk.chunk_id for chunk in new_chunks[name]]
+        )
+    manifest.files = dict(sorted(manifest.files.items()))
+    manifest.save(index_dir)
+
+    return changes
@@ -9,15 +9,40 @@ Creates:
 import os
 import json
 import pickle
+from collections.abc import Sequence
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from typing import Optional
 
-from rank_bm25 import BM25Okapi
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 
+from .bm25_engine import SparseBM25
+from .index_bundle import StringColumn, pack_strings, read_bundle, write_bundle
 from .markdown_parser import ParsedDocument, Section, parse_all_markdown_files
+from .tokenizer import Tokenizer, TokenizerConfig
+
+
+# Version of the saved BM25 index layout; bump when state() changes.
+# Files without a version hold only the tokenized corpus (statistics are
+# recomputed when they are loaded); version 2 has no tokenizer settings
+# (always the default tokenizer).
+BM25_INDEX_VERSION = 3
+
+# Memory-mapped BM25 index and chunk store (see index_bundle), in the index
+# directory; load_retriever prefers it to bm25_index.pkl
+BUNDLE_FILENAME = "index.bundle"
+
+# SparseBM25.state() arrays stored as-is in the bundle
+BM25_BUNDLE_ARRAYS = ("indptr", "indices", "term_freqs", "data", "idf", "doc_lengths")
+
+# IndexedChunk fields stored as text blobs; the rest go in a JSON record per chunk
+CHUNK_TEXT_FIELDS = ("content", "content_for_embedding")
+
+# IndexedChunk fields also stored as their own columns, so the lookup maps can
+# be built at load time without decoding every record
+CHUNK_KEY_FIELDS = ("chunk_id", "section_id")
 
 
 @dataclass
@@ -51,15 +76,23 @@ class IndexedChunk:
         }
 
 
-def create_chunks_from_documents(documents: list[ParsedDocument]) -> list[IndexedChunk]:
+def create_chunks_from_documents(
+    documents: list[ParsedDocument],
+    taken_ids: Optional[set[str]] = None
+) -> list[IndexedChunk]:
     """
     Create indexable chunks from parsed documents.
 
     Each section becomes a chunk. Very short sections are skipped.
+
+    Args:
+        documents: Parsed documents
+        taken_ids: Chunk IDs already in use (e.g. by an index being updated);
+            new chunks get different IDs
     """
     chunks = []
     min_content_length = 50  # Skip very short sections
-    seen_ids = set()  # Track IDs to ensure uniqueness
+    seen_ids = set(taken_ids or ())  # Track IDs to ensure uniqueness
 
     for doc in documents:
         section_counter = 0
@@ -102,38 +135,109 @@ def create_chunks_from_documents(documents: list[ParsedDocument]) -> list[Indexe
     return chunks
 
 
+class BundleChunks(Sequence):
+    """
+    Chunks of a memory-mapped bundle, decoded into IndexedChunk objects on
+    first access (and kept).
+    """
+
+    def __init__(self, records: StringColumn, texts: dict[str, StringColumn]):
+        self.records = records
+        self.texts = texts
+        self._chunks: list[Optional[IndexedChunk]] = [None] * len(records)
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        chunk = self._chunks[i]
+        if chunk is None:
+            fields = json.loads(self.records[i])
+            for name, column in self.texts.items():
+                fields[name] = column[i]
+            chunk = self._chunks[i] = IndexedChunk(**fields)
+        return chunk
+
+
 class BM25Index:
-    """BM25 index for lexical search."""
+    """
+    BM25 index for lexical search.
 
-    def __init__(self):
-        self.bm25: Optional[BM25Okapi] = None
+    Args:
+        tokenizer_config: Tokenizer settings used to build the index (default:
+            lowercase alphanumeric tokens); a loaded index uses the settings
+            it was built with
+    """
+
+    def __init__(self, tokenizer_config: Optional[TokenizerConfig] = None):
+        self.bm25: Optional[SparseBM25] = None
         self.chunks: list[IndexedChunk] = []
-        self.tokenized_corpus: list[list[str]] = []
+        self.chunk_rows: dict[str, int] = {}
+        self.section_rows: dict[str, list[int]] = {}
+        self.tokenizer = Tokenizer(tokenizer_config)
+
+    def _index_rows(self, chunk_ids: Sequence[str], section_ids: Sequence[str]):
+        """Map chunk_id → row and section_id → rows (in index order)."""
+        self.chunk_rows = {chunk_id: row for row, chunk_id in enumerate(chunk_ids)}
+        self.section_rows = {}
+        for row, section_id in enumerate(section_ids):
+            self.section_rows.setdefault(section_id, []).append(row)
+
+    def _index_chunks(self):
+        """Rebuild the lookup maps from self.chunks."""
+        self._index_rows(
+            [chunk.chunk_id for chunk in self.chunks],
+            [chunk.section_id for chunk in self.chunks]
+        )
+
+    def get_chunk(self, chunk_id: str) -> Optional[IndexedChunk]:
+        """Look up a chunk by ID (None if it is not in the index)."""
+        row = self.chunk_rows.get(chunk_id)
+        return None if row is None else self.chunks[row]
+
+    def section_chunks(self, section_id: str) -> list[IndexedChunk]:
+        """Chunks of a section, in index order."""
+        return [self.chunks[row] for row in self.section_rows.get(section_id, ())]
 
     def build(self, chunks: list[IndexedChunk]):
         """Build BM25 index from chunks."""
         self.chunks = chunks
+        self._index_chunks()
 
         # Tokenize corpus
-        self.tokenized_corpus = [
-            self._tokenize(chunk.content)
-            for chunk in chunks
-        ]
+        tokenize = self.tokenizer.tokenize
+        tokenized_corpus = [tokenize(chunk.content) for chunk in chunks]
 
-        # Build BM25 index
-        self.bm25 = BM25Okapi(self.tokenized_corpus)
+        # Build BM25 index (CSR term-document matrix of precomputed weights)
+        self.bm25 = SparseBM25(tokenized_corpus)
 
         print(f"BM25 index built with {len(chunks)} chunks")
 
-    def _tokenize(self, text: str) -> list[str]:
-        """Simple tokenization - lowercase and split."""
-        # Lowercase
-        text = text.lower()
-        # Remove special chars but keep alphanumeric and spaces
-        text = ''.join(c if c.isalnum() or c.isspace() else ' ' for c in text)
-        # Split and filter empty
-        tokens = [t for t in text.split() if len(t) > 1]
-        return tokens
+    def update(self, removed_chunk_ids: set[str], added_chunks: list[IndexedChunk]):
+        """
+        Remove chunks and append new ones, tokenizing only the new chunks
+        (statistics are recomputed for the whole corpus).
+
+        Args:
+            removed_chunk_ids: Chunks to drop (e.g. of changed or deleted documents)
+            added_chunks: Chunks to append (e.g. of added or changed documents)
+        """
+        if self.bm25 is None:
+            raise ValueError("Index not built. Call build() first.")
+
+        keep = np.fromiter(
+            (chunk.chunk_id not in removed_chunk_ids for chunk in self.chunks),
+            dtype=bool, count=len(self.chunks)
+        )
+        tokenize = self.tokenizer.tokenize
+        self.bm25 = self.bm25.updated(keep, [tokenize(chunk.content) for chunk in added_chunks])
+        self.chunks = [chunk for chunk, kept in zip(self.chunks, keep) if kept] + list(added_chunks)
+        self._index_chunks()
+
+        print(f"BM25 index updated: {int((~keep).sum())} chunks removed, "
+              f"{len(added_chunks)} added ({len(self.chunks)} total)")
 
     def search(self, query: str, top_k: int = 10) -> list[tuple[IndexedChunk, float]]:
         """
@@ -145,36 +249,125 @@ class BM25Index:
         if self.bm25 is None:
             raise ValueError("Index not built. Call build() first.")
 
-        tokenized_query = self._tokenize(query)
-        scores = self.bm25.get_scores(tokenized_query)
+        # Repeated queries (e.g. the same requirement text) hit the token cache
+        tokenized_query = self.tokenizer.tokenize_query(query)
 
-        # Get top-k results
-        scored_chunks = list(zip(self.chunks, scores))
-        scored_chunks.sort(key=lambda x: x[1], reverse=True)
+        # Get top-k results (argpartition; only the k best are sorted)
+        indices, scores = self.bm25.top_k(tokenized_query, top_k)
 
-        return scored_chunks[:top_k]
+        return [(self.chunks[i], float(score)) for i, score in zip(indices, scores)]
 
     def save(self, filepath: str | Path):
-        """Save index to disk."""
+        """Save index to disk, with its computed statistics (vocabulary, postings, IDF, lengths)."""
         filepath = Path(filepath)
         data = {
+            "version": BM25_INDEX_VERSION,
             "chunks": [asdict(c) for c in self.chunks],
-            "tokenized_corpus": self.tokenized_corpus
+            "tokenizer": self.tokenizer.config.to_dict(),
+            "bm25": self.bm25.state()
         }
         with open(filepath, "wb") as f:
-            pickle.dump(data, f)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
         print(f"BM25 index saved to {filepath}")
 
+    def save_bundle(self, filepath: str | Path):
+        """
+        Save index and chunks as a memory-mapped bundle (flat arrays for the
+        postings and statistics, UTF-8 blobs with offsets for the terms and
+        chunk text).
+        """
+        filepath = Path(filepath)
+        state = self.bm25.state()
+
+        # Tokens never contain whitespace, so the vocabulary is one string
+        terms = "\n".join(state["terms"])
+        arrays = {name: state[name] for name in BM25_BUNDLE_ARRAYS}
+        arrays["terms"] = pack_strings([terms])[0]
+
+        records = []
+        for chunk in self.chunks:
+            fields = asdict(chunk)
+            for name in CHUNK_TEXT_FIELDS:
+                del fields[name]
+            records.append(json.dumps(fields, ensure_ascii=False))
+        arrays["chunk_records"], arrays["chunk_record_offsets"] = pack_strings(records)
+        for name in CHUNK_TEXT_FIELDS:
+            arrays[f"chunk_{name}"], arrays[f"chunk_{name}_offsets"] = pack_strings(
+                [getattr(chunk, name) for chunk in self.chunks]
+            )
+        for name in CHUNK_KEY_FIELDS:
+            arrays[f"{name}s"], arrays[f"{name}_offsets"] = pack_strings(
+                [getattr(chunk, name) for chunk in self.chunks]
+            )
+
+        header = {
+            "index_version": BM25_INDEX_VERSION,
+            "chunk_count": len(self.chunks),
+            "term_count": len(state["terms"]),
+            "bm25": {name: state[name] for name in ("k1", "b", "epsilon", "avgdl")},
+            "tokenizer": self.tokenizer.config.to_dict()
+        }
+        write_bundle(filepath, header, arrays)
+        print(f"BM25 index bundle saved to {filepath}")
+
+    def load_bundle(self, filepath: str | Path):
+        """Open a bundle saved with save_bundle() (arrays are mapped, not read)."""
+        bundle = read_bundle(filepath)
+        header, arrays = bundle.header, bundle.arrays
+        if header["index_version"] > BM25_INDEX_VERSION:
+            raise ValueError(
+                f"{bundle.path.name} holds BM25 index version {header['index_version']}; this code "
+                f"reads up to {BM25_INDEX_VERSION}. Re-run `python run_indexing.py`."
+            )
+
+        terms = arrays["terms"].tobytes().decode("utf-8")
+        state = {
+            **header["bm25"],
+            "terms": terms.split("\n") if header["term_count"] else [],
+            **{name: arrays[name] for name in BM25_BUNDLE_ARRAYS}
+        }
+        self.bm25 = SparseBM25.from_state(state)
+        self.tokenizer = Tokenizer(TokenizerConfig.from_dict(header.get("tokenizer")))
+        self.chunks = BundleChunks(
+            StringColumn(arrays["chunk_records"], arrays["chunk_record_offsets"]),
+            {
+                name: StringColumn(arrays[f"chunk_{name}"], arrays[f"chunk_{name}_offsets"])
+                for name in CHUNK_TEXT_FIELDS
+            }
+        )
+        if all(f"{name}s" in arrays for name in CHUNK_KEY_FIELDS):
+            self._index_rows(*(
+                StringColumn(arrays[f"{name}s"], arrays[f"{name}_offsets"])
+                for name in CHUNK_KEY_FIELDS
+            ))
+        else:
+            self._index_chunks()  # Bundles written before the key columns existed
+        print(f"BM25 index loaded: {len(self.chunks)} chunks (memory-mapped bundle)")
+
     def load(self, filepath: str | Path):
         """Load index from disk."""
         filepath = Path(filepath)
         with open(filepath, "rb") as f:
             data = pickle.load(f)
 
+        version = data.get("version", 1)
+        if version > BM25_INDEX_VERSION:
+            raise ValueError(
+                f"{filepath.name} is BM25 index version {version}; this code reads up to "
+                f"{BM25_INDEX_VERSION}. Re-run `python run_indexing.py`."
+            )
+
         self.chunks = [IndexedChunk(**c) for c in data["chunks"]]
-        self.tokenized_corpus = data["tokenized_corpus"]
-        self.bm25 = BM25Okapi(self.tokenized_corpus)
-        print(f"BM25 index loaded: {len(self.chunks)} chunks")
+        self._index_chunks()
+        self.tokenizer = Tokenizer(TokenizerConfig.from_dict(data.get("tokenizer")))
+        if version == 1:
+            # Older indexes saved only tokens; recompute the statistics
+            self.bm25 = SparseBM25(data["tokenized_corpus"])
+            print(f"BM25 index loaded: {len(self.chunks)} chunks "
+                  f"(old format, statistics recomputed; re-run indexing to upgrade)")
+        else:
+            self.bm25 = SparseBM25.from_state(data["bm25"])
+            print(f"BM25 index loaded: {len(self.chunks)} chunks")
 
 
 class VectorStore:
@@ -222,6 +415,16 @@ class VectorStore:
                 self.collection.delete(ids=all_ids)
 
         print(f"Building vector store with {len(chunks)} chunks...")
+        self.add_chunks(chunks, embedding_model)
+
+        print(f"Vector store built with {len(chunks)} chunks")
+
+    def add_chunks(self, chunks: list[IndexedChunk], embedding_model: str = "text-embedding-3-small"):
+        """Embed chunks with OpenAI and add them to the collection."""
+        if self.collection is None:
+            self.initialize()
+        if not chunks:
+            return
 
         # Prepare data for ChromaDB
         ids = [chunk.chunk_id for chunk in chunks]
@@ -257,7 +460,12 @@ class VectorStore:
             metadatas=metadatas
         )
 
-        print(f"Vector store built with {len(chunks)} chunks")
+    def delete_chunks(self, chunk_ids: list[str]):
+        """Remove chunks from the collection (IDs not present are ignored)."""
+        if self.collection is None:
+            self.initialize()
+        if chunk_ids:
+            self.collection.delete(ids=list(chunk_ids))
 
     def search(
         self,
@@ -383,7 +591,7 @@ def build_all_indexes(
     print("\n=== Building BM25 Index ===")
     bm25_index = BM25Index()
     bm25_index.build(chunks)
-    bm25_index.save(index_dir / "bm25_index.pkl")
+    bm25_index.save_bundle(index_dir / BUNDLE_FILENAME)
 
     # Build vector store
     print("\n=== Building Vector Store ===")
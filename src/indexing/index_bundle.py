@@ -0,0 +1,153 @@
+"""
+Memory-Mapped Index Bundle
+
+A single-file, versioned container for flat arrays, opened with mmap so
+that loading copies nothing: arrays are NumPy views of the mapped file,
+pages are read on first access, and processes opening the same bundle
+share them through the page cache.
+
+Layout:
+    MAGIC (8 bytes) | version (uint32 LE) | header size (uint32 LE)
+    header: UTF-8 JSON (metadata, plus dtype/shape/offset of each array)
+    arrays: raw little-endian data, each starting on an ALIGNMENT boundary
+
+Strings are stored as one UTF-8 blob (uint8 array) with an int64 offsets
+array; StringColumn decodes individual strings on access.
+"""
+
+import json
+import mmap
+import os
+import struct
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+
+MAGIC = b"POLIDX\x00\x01"
+BUNDLE_VERSION = 1
+ALIGNMENT = 64
+
+_PREAMBLE = struct.Struct("<8sII")
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def pack_strings(strings: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Encode strings as one UTF-8 blob.
+
+    Returns:
+        Tuple of (blob as uint8 array, int64 byte offsets, len(strings) + 1)
+    """
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+class StringColumn(Sequence):
+    """Read-only sequence of strings backed by a blob and offsets (see pack_strings)."""
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        self.blob = blob
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("string index out of range")
+        return self.blob[self.offsets[i]:self.offsets[i + 1]].tobytes().decode("utf-8")
+
+
+@dataclass
+class Bundle:
+    """An opened bundle: header metadata and zero-copy array views."""
+    path: Path
+    version: int
+    header: dict
+    arrays: dict[str, np.ndarray]
+
+
+def write_bundle(path: str | Path, header: dict, arrays: dict[str, np.ndarray]):
+    """
+    Write a bundle atomically (a temporary file renamed over `path`, so
+    processes that have the old bundle mapped keep a consistent view).
+
+    Args:
+        path: Output file
+        header: JSON-serializable metadata
+        arrays: Named arrays (stored little-endian, C order)
+    """
+    path = Path(path)
+    table = {}
+    offset = 0
+    prepared = {}
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        array = array.astype(array.dtype.newbyteorder("<"), copy=False)
+        table[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        prepared[name] = array
+        offset = _align(offset + array.nbytes)
+
+    header_bytes = json.dumps({**header, "arrays": table}, ensure_ascii=False).encode("utf-8")
+    data_start = _align(_PREAMBLE.size + len(header_bytes))
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_PREAMBLE.pack(MAGIC, BUNDLE_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for name, array in prepared.items():
+            f.seek(data_start + table[name]["offset"])
+            f.write(array.tobytes())
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, path)
+
+
+def read_bundle(path: str | Path) -> Bundle:
+    """
+    Open a bundle with mmap.
+
+    Returns:
+        Bundle whose arrays are read-only views of the mapped file
+
+    Raises:
+        ValueError: If the file is not a bundle or has a newer version
+    """
+    path = Path(path)
+    with open(path, "rb") as f:
+        # Empty files cannot be mapped
+        if os.fstat(f.fileno()).st_size < _PREAMBLE.size:
+            raise ValueError(f"{path.name} is not an index bundle")
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, header_size = _PREAMBLE.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError(f"{path.name} is not an index bundle")
+    if version > BUNDLE_VERSION:
+        raise ValueError(
+            f"{path.name} is bundle version {version}; this code reads up to {BUNDLE_VERSION}"
+        )
+
+    header = json.loads(buffer[_PREAMBLE.size:_PREAMBLE.size + header_size].decode("utf-8"))
+    data_start = _align(_PREAMBLE.size + header_size)
+
+    arrays = {}
+    for name, spec in header.pop("arrays").items():
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"], dtype=np.int64))
+        arrays[name] = np.frombuffer(
+            buffer, dtype=dtype, count=count, offset=data_start + spec["offset"]
+        ).reshape(spec["shape"])
+
+    return Bundle(path=path, version=version, header=header, arrays=arrays)
@@ -8,16 +8,37 @@ Parses structured markdown files and extracts:
 - Cross-references
 """
 
+import hashlib
+import mmap
+import os
 import re
-import yaml
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Iterator, Optional
 
+from .frontmatter import Validator, frontmatter_bounds, load_frontmatter, load_validator
 
-@dataclass
+if TYPE_CHECKING:
+    from .parse_cache import ParseCache
+
+
+# Bump when parse output changes so cached parses are invalidated
+PARSER_VERSION = "3"
+
+# Files at least this large are parsed by streaming them through mmap, so
+# the whole document is never held as one string (or as a list of lines)
+STREAMING_THRESHOLD_BYTES = 8 * 1024 * 1024
+
+
+@dataclass(slots=True)
 class Section:
-    """Represents a section from a policy document."""
+    """
+    Represents a section from a policy document.
+
+    Slotted: corpora with tens of thousands of sections hold no
+    per-instance __dict__.
+    """
     section_id: str
     title: str
     level: int  # 1 = #, 2 = ##, 3 = ###, etc.
@@ -55,224 +76,410 @@ class Section:
 
 @dataclass
 class ParsedDocument:
-    """Represents a fully parsed policy document."""
+    """
+    Represents a fully parsed policy document.
+
+    The full markdown is only kept in raw_content when parsing was asked to
+    keep it (every section already holds its own content); get_raw_content()
+    re-reads it from filepath otherwise.
+    """
     filepath: Path
     filename: str
     document_id: str
     title: str
     frontmatter: dict
     sections: list[Section]
-    raw_content: str
+    raw_content: Optional[str] = field(default=None, repr=False)
+    frontmatter_errors: Optional[list[str]] = None  # Schema violations; None if not validated
+
+    # (section count, section_id -> Section), built on first lookup and
+    # rebuilt if sections are added or removed afterwards
+    _section_index: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
     def get_all_entities(self) -> dict:
         """Get all entities from frontmatter."""
         return self.frontmatter.get("entities", {})
 
-    def get_section_by_id(self, section_id: str) -> Optional[Section]:
-        """Find a section by its ID."""
-        for section in self.sections:
-            if section.section_id == section_id:
-                return section
-        return None
+    def get_raw_content(self) -> str:
+        """Get the full markdown, re-reading it from filepath if it was not kept."""
+        if self.raw_content is not None:
+            return self.raw_content
+        return self.filepath.read_text(encoding="utf-8")
 
-
-def parse_frontmatter(content: str) -> tuple[dict, str]:
+    def get_section_by_id(self, section_id: str) -> Optional[Section]:
+        """Find a section by its ID (the first one, if IDs repeat)."""
+        if self._section_index is None or self._section_index[0] != len(self.sections):
+            index = {}
+            for section in self.sections:
+                index.setdefault(section.section_id, section)
+            self._section_index = (len(self.sections), index)
+        return self._section_index[1].get(section_id)
+
+
+def _load_document_frontmatter(
+    content: str,
+    validator: Optional[Validator]
+) -> tuple[dict, int, Optional[list[str]]]:
     """
-    Extract YAML frontmatter from markdown content.
+    Load a document's frontmatter, validating it if a validator is given.
 
     Returns:
-        Tuple of (frontmatter_dict, remaining_content)
+        Tuple of (frontmatter_dict, offset where the body starts, errors or
+        None if not validated)
     """
-    if not content.startswith("---"):
-        return {}, content
-
-    # Find the closing ---
-    match = re.match(r'^---\n(.*?)\n---\n(.*)$', content, re.DOTALL)
-    if not match:
-        return {}, content
-
-    yaml_content = match.group(1)
-    remaining = match.group(2)
+    result = load_frontmatter(content, validator)
+    if validator is None:
+        for error in result.errors:  # Only invalid YAML without a validator
+            print(f"Warning: {error}")
+        return result.frontmatter, result.body_start, None
+    return result.frontmatter, result.body_start, result.errors
+
+
+# One entity annotation: [[type:entity]]
+ENTITY_PATTERN = re.compile(r'\[\[(role|control|asset|process|external|doc|framework):([^\]]+)\]\]')
+
+SECTION_ID_PATTERN = re.compile(r'<!--\s*section_id:\s*([^\s>]+)\s*-->')
+RELEVANCE_PATTERN = re.compile(r'<!--\s*compliance_relevance:\s*(\w+)\s*-->')
+MAPS_TO_PATTERN = re.compile(r'<!--\s*likely_maps_to:\s*\[([^\]]+)\]\s*-->')
+
+# Annotation type → key in the entities dict
+ENTITY_TYPES = {
+    "role": "roles",
+    "control": "controls",
+    "asset": "assets",
+    "process": "processes",
+    "external": "external",
+    "doc": "documents",
+    "framework": "frameworks"
+}
+
+# A line that parses as a heading: 1-6 '#', whitespace, then some text
+_HEADING_AHEAD = r'#{1,6}[^\S\n].'
+
+# Non-empty text up to the next ']'. It may wrap onto following lines but
+# never onto a heading line, so a match always stays inside the section it
+# starts in (as when sections were split before being searched).
+_BRACKETED = r'(?!\])[^\]\n]*(?:\n(?!' + _HEADING_AHEAD + r')[^\]\n]*)*'
+
+# Everything parse_sections looks for, in one pattern. Every alternative
+# starts with a literal character ('#', '<' or '['), which lets the regex
+# engine skip straight to candidate positions. A heading's first '#' must
+# start a line; the lookbehind checks that without a leading '^'.
+SCAN_PATTERN = re.compile(
+    r'#(?<![^\n]#)(?P<hashes>#{0,5})[^\S\n]+(?P<title>.+)$'
+    r'|<!--\s*(?:section_id:\s*(?P<section_id>[^\s>]+)'
+    r'|compliance_relevance:\s*(?P<compliance_relevance>\w+)'
+    r'|likely_maps_to:\s*\[(?P<maps_to>' + _BRACKETED + r')\])\s*-->'
+    r'|\[\[(?P<entity_type>role|control|asset|process|external|doc|framework):'
+    r'(?P<entity>' + _BRACKETED + r')\]\]',
+    re.MULTILINE
+)
+
+# A whole line that is a heading (lines never contain "\n")
+HEADING_LINE_PATTERN = re.compile(r'(#{1,6})[^\S\n]+(.+)')
+
+_SLUG_STRIP_PATTERN = re.compile(r'[^\w\s]')
+_SLUG_SPACE_PATTERN = re.compile(r'\s+')
+
+
+def _empty_entities() -> dict:
+    return {
+        "roles": [],
+        "controls": [],
+        "assets": [],
+        "processes": [],
+        "external": [],
+        "documents": [],
+        "frameworks": []
+    }
 
-    try:
-        frontmatter = yaml.safe_load(yaml_content) or {}
-    except yaml.YAMLError as e:
-        print(f"Warning: Failed to parse YAML frontmatter: {e}")
-        frontmatter = {}
 
-    return frontmatter, remaining
+def _parse_maps_to(items: str) -> list[str]:
+    return [item.strip().strip('"\'') for item in items.split(",")]
 
 
 def extract_section_metadata(content: str) -> dict:
     """Extract metadata from HTML comments in section content."""
     metadata = {}
 
-    # Extract section_id
-    section_id_match = re.search(r'<!--\s*section_id:\s*([^\s>]+)\s*-->', content)
+    section_id_match = SECTION_ID_PATTERN.search(content)
     if section_id_match:
         metadata["section_id"] = section_id_match.group(1)
 
-    # Extract compliance_relevance
-    relevance_match = re.search(r'<!--\s*compliance_relevance:\s*(\w+)\s*-->', content)
+    relevance_match = RELEVANCE_PATTERN.search(content)
     if relevance_match:
         metadata["compliance_relevance"] = relevance_match.group(1)
 
-    # Extract likely_maps_to
-    maps_match = re.search(r'<!--\s*likely_maps_to:\s*\[([^\]]+)\]\s*-->', content)
+    maps_match = MAPS_TO_PATTERN.search(content)
     if maps_match:
-        items = maps_match.group(1)
-        metadata["likely_maps_to"] = [
-            item.strip().strip('"\'')
-            for item in items.split(",")
-        ]
+        metadata["likely_maps_to"] = _parse_maps_to(maps_match.group(1))
 
     return metadata
 
 
 def extract_entities_from_content(content: str) -> dict:
     """Extract entity annotations from content."""
-    entities = {
-        "roles": [],
-        "controls": [],
-        "assets": [],
-        "processes": [],
-        "external": [],
-        "documents": [],
-        "frameworks": []
-    }
-
-    # Pattern: [[type:entity]]
-    pattern = r'\[\[(role|control|asset|process|external|doc|framework):([^\]]+)\]\]'
-
-    for match in re.finditer(pattern, content):
-        entity_type = match.group(1)
-        entity_value = match.group(2).strip()
-
-        type_mapping = {
-            "role": "roles",
-            "control": "controls",
-            "asset": "assets",
-            "process": "processes",
-            "external": "external",
-            "doc": "documents",
-            "framework": "frameworks"
-        }
+    entities = _empty_entities()
 
-        key = type_mapping.get(entity_type, entity_type)
-        if entity_value not in entities[key]:
-            entities[key].append(entity_value)
+    for match in ENTITY_PATTERN.finditer(content):
+        values = entities[ENTITY_TYPES[match.group(1)]]
+        value = match.group(2).strip()
+        if value not in values:
+            values.append(value)
 
     return entities
 
 
+def _record_annotation(match: re.Match, metadata: dict, entities: dict):
+    """Add a non-heading SCAN_PATTERN match to a section's metadata or entities."""
+    kind = match.lastgroup
+    if kind == "entity":
+        values = entities[ENTITY_TYPES[match.group("entity_type")]]
+        value = match.group("entity").strip()
+        if value not in values:
+            values.append(value)
+    elif kind not in metadata:
+        if kind == "maps_to":
+            metadata["likely_maps_to"] = _parse_maps_to(match.group(kind))
+        else:
+            metadata[kind] = match.group(kind)
+
+
+def _build_section(
+    level: int,
+    title: str,
+    section_path: str,
+    content: str,
+    metadata: dict,
+    entities: dict,
+    document_id: str,
+    document_title: str
+) -> Optional[Section]:
+    """Create a finished section, or None if it has neither title nor content."""
+    if not (content or title):  # Only add non-empty
+        return None
+
+    section_id = metadata.get("section_id")
+    if section_id is None:
+        # Generate section_id from document_id and title
+        title_slug = _SLUG_STRIP_PATTERN.sub('', title)
+        title_slug = _SLUG_SPACE_PATTERN.sub('-', title_slug.strip().lower())[:20]
+        section_id = f"{document_id}-{title_slug}"
+
+    return Section(
+        section_id=section_id,
+        title=title,
+        level=level,
+        content=content,
+        compliance_relevance=metadata.get("compliance_relevance"),
+        likely_maps_to=metadata.get("likely_maps_to", []),
+        entities=entities,
+        document_id=document_id,
+        document_title=document_title,
+        section_path=section_path
+    )
+
+
+def _push_heading(section_stack: list, level: int, title: str) -> str:
+    """Update the heading stack and return the new section's path."""
+    while section_stack and section_stack[-1][0] >= level:
+        section_stack.pop()
+    section_stack.append((level, title))
+    return " > ".join(t for _, t in section_stack)
+
+
 def parse_sections(content: str, document_id: str, document_title: str) -> list[Section]:
     """
     Parse markdown content into sections.
 
-    Uses heading hierarchy to create sections.
+    Uses heading hierarchy to create sections. Headings, metadata comments
+    and entity annotations are all found in a single sweep of SCAN_PATTERN;
+    each section's content is sliced out of `content` once its end is known.
     """
+    section_stack = []  # Track hierarchy for section_path
+
+    # Headings as (level, title, section_path, start, content_start, metadata, entities)
+    headings = []
+    metadata = entities = None
+
+    for match in SCAN_PATTERN.finditer(content):
+        if match.lastgroup == "title":
+            level = len(match.group("hashes")) + 1  # Plus the leading "#"
+            title = match.group("title").strip()
+            metadata = {}
+            entities = _empty_entities()
+            headings.append((
+                level, title, _push_heading(section_stack, level, title),
+                match.start(), match.end() + 1, metadata, entities
+            ))
+        elif metadata is not None:  # Text before the first heading belongs to no section
+            _record_annotation(match, metadata, entities)
+
+    # Each section's content runs up to the line break before the next heading
+    ends = [heading[3] - 1 for heading in headings[1:]] + [len(content)]
+
     sections = []
+    for (level, title, section_path, _, start, metadata, entities), end in zip(headings, ends):
+        section = _build_section(
+            level, title, section_path, content[start:end].strip(),
+            metadata, entities, document_id, document_title
+        )
+        if section is not None:
+            sections.append(section)
+
+    return sections
+
 
-    # Split by headers (##, ###, ####, etc.)
-    # Keep the header with the content
-    header_pattern = r'^(#{1,6})\s+(.+?)$'
+def iter_sections(lines: Iterator[str], document_id: str, document_title: str) -> Iterator[Section]:
+    """
+    Parse markdown body lines into sections, yielding each as it completes.
 
-    lines = content.split('\n')
-    current_section = None
-    current_content = []
+    Equivalent to parse_sections("\n".join(lines), ...), but only the
+    current section's lines are held in memory.
+    """
     section_stack = []  # Track hierarchy for section_path
+    heading = None  # (level, title, section_path) of the section being read
+    buffer = []
 
-    for line in lines:
-        header_match = re.match(header_pattern, line)
-
-        if header_match:
-            # Save previous section if exists
-            if current_section is not None:
-                current_section.content = '\n'.join(current_content).strip()
-                if current_section.content or current_section.title:  # Only add non-empty
-                    sections.append(current_section)
-
-            # Parse new header
-            level = len(header_match.group(1))
-            title = header_match.group(2).strip()
-
-            # Update section stack for path
-            while section_stack and section_stack[-1][0] >= level:
-                section_stack.pop()
-            section_stack.append((level, title))
-
-            # Build section path
-            section_path = " > ".join(t for _, t in section_stack)
-
-            # Create new section
-            current_section = Section(
-                section_id="",  # Will be filled from content
-                title=title,
-                level=level,
-                content="",
-                document_id=document_id,
-                document_title=document_title,
-                section_path=section_path
-            )
-            current_content = []
+    def finish() -> Optional[Section]:
+        content = "\n".join(buffer).strip()
+        metadata = {}
+        entities = _empty_entities()
+        for match in SCAN_PATTERN.finditer(content):
+            _record_annotation(match, metadata, entities)
+        return _build_section(*heading, content, metadata, entities, document_id, document_title)
 
-        else:
-            current_content.append(line)
+    for line in lines:
+        match = HEADING_LINE_PATTERN.match(line) if line.startswith("#") else None
+        if match is None:
+            if heading is not None:
+                buffer.append(line)
+            continue
+
+        if heading is not None:
+            section = finish()
+            if section is not None:
+                yield section
+
+        level = len(match.group(1))
+        title = match.group(2).strip()
+        heading = (level, title, _push_heading(section_stack, level, title))
+        buffer = []
 
     # Don't forget the last section
-    if current_section is not None:
-        current_section.content = '\n'.join(current_content).strip()
-        if current_section.content or current_section.title:
-            sections.append(current_section)
-
-    # Post-process sections: extract metadata and entities
-    for section in sections:
-        # Extract metadata from HTML comments
-        metadata = extract_section_metadata(section.content)
-
-        if "section_id" in metadata:
-            section.section_id = metadata["section_id"]
-        else:
-            # Generate section_id from document_id and title
-            title_slug = re.sub(r'[^\w\s]', '', section.title)
-            title_slug = re.sub(r'\s+', '-', title_slug.strip().lower())[:20]
-            section.section_id = f"{document_id}-{title_slug}"
+    if heading is not None:
+        section = finish()
+        if section is not None:
+            yield section
 
-        section.compliance_relevance = metadata.get("compliance_relevance")
-        section.likely_maps_to = metadata.get("likely_maps_to", [])
 
-        # Extract entities
-        section.entities = extract_entities_from_content(section.content)
+def _mmap_frontmatter(
+    mapped: mmap.mmap,
+    validator: Optional[Validator]
+) -> tuple[dict, int, Optional[list[str]]]:
+    """
+    Load the frontmatter at the start of a mapped file; only the frontmatter
+    block is decoded.
 
-    return sections
+    Returns:
+        As _load_document_frontmatter, with a byte offset for the body
+    """
+    bounds = frontmatter_bounds(mapped)
+    body_start = bounds[2] if bounds else 0
+    frontmatter, _, errors = _load_document_frontmatter(mapped[:body_start].decode("utf-8"), validator)
+    return frontmatter, body_start, errors
 
 
-def parse_markdown_file(filepath: str | Path) -> ParsedDocument:
+def _mmap_lines(mapped: mmap.mmap, start: int) -> Iterator[str]:
+    """Decode a mapped file line by line from `start`, without line breaks."""
+    mapped.seek(start)
+    for raw in iter(mapped.readline, b""):
+        yield (raw[:-1] if raw.endswith(b"\n") else raw).decode("utf-8")
+
+
+def _document_identity(filepath: Path, frontmatter: dict) -> tuple[str, str]:
+    """Document ID and title from frontmatter, falling back to the filename."""
+    return (
+        frontmatter.get("document_id", filepath.stem[:3].upper()),
+        frontmatter.get("title", filepath.stem)
+    )
+
+
+def iter_markdown_sections(filepath: str | Path) -> Iterator[Section]:
     """
-    Parse a structured markdown policy document.
+    Yield the sections of a markdown policy document one at a time.
+
+    The file is read through mmap and only the current section is held in
+    memory; document ID and title come from the frontmatter, as with
+    parse_markdown_file.
 
     Args:
         filepath: Path to the markdown file
 
-    Returns:
-        ParsedDocument with all extracted information
+    Yields:
+        Sections in document order
     """
     filepath = Path(filepath)
 
     if not filepath.exists():
         raise FileNotFoundError(f"File not found: {filepath}")
+    if filepath.stat().st_size == 0:
+        return  # Empty files cannot be mapped
+
+    with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        frontmatter, body_start, _ = _mmap_frontmatter(mapped, None)
+        document_id, title = _document_identity(filepath, frontmatter)
+        yield from iter_sections(_mmap_lines(mapped, body_start), document_id, title)
+
+
+def _parse_markdown_streaming(filepath: Path, validator: Optional[Validator] = None) -> ParsedDocument:
+    """parse_markdown_file for large (non-empty) files, via mmap and iter_sections."""
+    with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        frontmatter, body_start, errors = _mmap_frontmatter(mapped, validator)
+        document_id, title = _document_identity(filepath, frontmatter)
+        sections = list(iter_sections(_mmap_lines(mapped, body_start), document_id, title))
+
+    return ParsedDocument(
+        filepath=filepath,
+        filename=filepath.name,
+        document_id=document_id,
+        title=title,
+        frontmatter=frontmatter,
+        sections=sections,
+        frontmatter_errors=errors
+    )
+
+
+def parse_markdown_content(
+    filepath: str | Path,
+    content: str,
+    keep_raw_content: bool = False,
+    validator: Optional[Validator] = None
+) -> ParsedDocument:
+    """
+    Parse the already-read content of a structured markdown policy document.
 
-    content = filepath.read_text(encoding="utf-8")
+    Args:
+        filepath: Path the content was read from (used for naming fallbacks)
+        content: Full markdown text
+        keep_raw_content: Keep `content` on the result (otherwise
+            ParsedDocument.get_raw_content() re-reads it from filepath)
+        validator: Frontmatter schema from frontmatter.load_validator();
+            violations are kept in frontmatter_errors (None skips validation)
+
+    Returns:
+        ParsedDocument with all extracted information
+    """
+    filepath = Path(filepath)
 
     # Extract frontmatter
-    frontmatter, body = parse_frontmatter(content)
+    frontmatter, body_start, errors = _load_document_frontmatter(content, validator)
 
     # Get document identifiers
-    document_id = frontmatter.get("document_id", filepath.stem[:3].upper())
-    title = frontmatter.get("title", filepath.stem)
+    document_id, title = _document_identity(filepath, frontmatter)
 
     # Parse sections
-    sections = parse_sections(body, document_id, title)
+    sections = parse_sections(content[body_start:], document_id, title)
 
     return ParsedDocument(
         filepath=filepath,
@@ -281,41 +488,164 @@ def parse_markdown_file(filepath: str | Path) -> ParsedDocument:
         title=title,
         frontmatter=frontmatter,
         sections=sections,
-        raw_content=content
+        raw_content=content if keep_raw_content else None,
+        frontmatter_errors=errors
     )
 
 
-def parse_all_markdown_files(directory: str | Path) -> list[ParsedDocument]:
+def parse_markdown_file(
+    filepath: str | Path,
+    keep_raw_content: bool = False,
+    validator: Optional[Validator] = None
+) -> ParsedDocument:
+    """
+    Parse a structured markdown policy document.
+
+    Args:
+        filepath: Path to the markdown file
+        keep_raw_content: Keep the full markdown on the result
+        validator: Optional frontmatter schema (see parse_markdown_content)
+
+    Returns:
+        ParsedDocument with all extracted information
+    """
+    filepath = Path(filepath)
+
+    if not filepath.exists():
+        raise FileNotFoundError(f"File not found: {filepath}")
+
+    # Large files are streamed instead of being read into memory at once
+    if not keep_raw_content and filepath.stat().st_size >= STREAMING_THRESHOLD_BYTES:
+        return _parse_markdown_streaming(filepath, validator)
+
+    return parse_markdown_content(filepath, filepath.read_text(encoding="utf-8"), keep_raw_content, validator)
+
+
+def _parse_checked(md_path: Path, content: Optional[str], validate: bool) -> ParsedDocument:
+    """
+    Parse for parse_all_markdown_files (picklable for workers); without
+    content, the file is parsed by parse_markdown_file (streamed if large).
+    """
+    validator = load_validator() if validate else None
+    if content is None:
+        return parse_markdown_file(md_path, validator=validator)
+    return parse_markdown_content(md_path, content, validator=validator)
+
+
+def _mapped_sha256(filepath: Path) -> str:
+    """SHA-256 of a (non-empty) file, hashed from a memory map instead of a copy."""
+    with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return hashlib.sha256(mapped).hexdigest()
+
+
+def _print_frontmatter_errors(doc: ParsedDocument):
+    if doc.frontmatter_errors:
+        print(f"  [WARN] {len(doc.frontmatter_errors)} frontmatter error(s)")
+        for error in doc.frontmatter_errors:
+            print(f"    - {error}")
+
+
+def parse_all_markdown_files(
+    directory: str | Path,
+    workers: Optional[int] = 1,
+    cache: Optional["ParseCache"] = None,
+    validate: bool = True
+) -> list[ParsedDocument]:
     """
     Parse all markdown files in a directory.
 
     Args:
         directory: Path to directory containing markdown files
+        workers: Number of worker processes for files that need parsing.
+            1 parses in this process; None uses all available cores.
+        cache: Optional parse cache; files whose bytes were parsed before
+            (by the same PARSER_VERSION) are loaded from it instead
+        validate: Validate frontmatter against the policy frontmatter
+            schema, printing violations (kept in frontmatter_errors). Cached
+            documents parsed without validation are re-parsed.
 
     Returns:
-        List of ParsedDocument objects
+        List of ParsedDocument objects, in filename order
     """
     directory = Path(directory)
 
     if not directory.is_dir():
         raise NotADirectoryError(f"Not a directory: {directory}")
 
-    documents = []
     md_files = sorted(directory.glob("*.md"))
 
     # Skip conversion log
     md_files = [f for f in md_files if f.name != "conversion_log.json"]
 
+    documents = {}
+    pending = {}  # Files to parse: path -> (content, sha256); no content for large files
+
     for md_path in md_files:
-        print(f"Parsing: {md_path.name}")
         try:
-            doc = parse_markdown_file(md_path)
-            documents.append(doc)
-            print(f"  [OK] {len(doc.sections)} sections extracted")
-        except Exception as e:
+            if md_path.stat().st_size >= STREAMING_THRESHOLD_BYTES:
+                # Large files are never read whole; they are hashed and parsed through mmap
+                content = None
+                sha256 = _mapped_sha256(md_path) if cache else None
+            else:
+                data = md_path.read_bytes()
+                content = data.decode("utf-8")
+                sha256 = hashlib.sha256(data).hexdigest() if cache else None
+            doc = cache.get(md_path, sha256) if cache else None
+            if doc is None or (validate and doc.frontmatter_errors is None):
+                pending[md_path] = (content, sha256)
+            else:
+                documents[md_path] = doc
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Parsing: {md_path.name}")
             print(f"  [ERROR] {e}")
 
-    return documents
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers > 1 and len(pending) > 1:
+        # Parse in worker processes; results are collected in filename order
+        executor = ProcessPoolExecutor(max_workers=min(workers, len(pending)))
+        futures = {
+            md_path: executor.submit(_parse_checked, md_path, content, validate)
+            for md_path, (content, _) in pending.items()
+        }
+
+        def parse(md_path: Path, content: str) -> ParsedDocument:
+            return futures[md_path].result()
+    else:
+        executor = None
+
+        def parse(md_path: Path, content: str) -> ParsedDocument:
+            return _parse_checked(md_path, content, validate)
+
+    try:
+        for md_path in md_files:
+            if md_path in documents:
+                print(f"Parsing: {md_path.name}")
+                print(f"  [OK] {len(documents[md_path].sections)} sections (cached)")
+                _print_frontmatter_errors(documents[md_path])
+                continue
+            if md_path not in pending:
+                continue
+
+            print(f"Parsing: {md_path.name}")
+            content, sha256 = pending[md_path]
+            try:
+                doc = parse(md_path, content)
+            except Exception as e:
+                print(f"  [ERROR] {e}")
+                continue
+
+            documents[md_path] = doc
+            print(f"  [OK] {len(doc.sections)} sections extracted")
+            _print_frontmatter_errors(doc)
+            if cache:
+                cache.put(doc, sha256)
+    finally:
+        if executor:
+            executor.shutdown()
+
+    return [documents[md_path] for md_path in md_files if md_path in documents]
 
 
 # CLI for testing
@@ -0,0 +1,129 @@
+"""
+Content-Addressed Parse Cache
+
+Stores ParsedDocument results on disk keyed by the SHA-256 of the markdown
+bytes (plus the parser version), so repeat indexing only re-parses files
+that changed. Entries are pickled tuples: document fields once, then one
+compact row per section (document_id/title are not repeated per section).
+"""
+
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Optional
+
+from .markdown_parser import PARSER_VERSION, ParsedDocument, Section
+
+
+def default_cache_dir() -> Path:
+    """Get the default cache location (data/cache/parsed)."""
+    # Navigate up from src/indexing/parse_cache.py
+    project_root = Path(__file__).resolve().parent.parent.parent
+    return project_root / "data" / "cache" / "parsed"
+
+
+class ParseCache:
+    """On-disk cache of parsed markdown documents, keyed by content hash."""
+
+    def __init__(self, cache_dir: Optional[str | Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, sha256: str) -> Path:
+        return self.cache_dir / f"{sha256}-v{PARSER_VERSION}.pkl"
+
+    def get(self, filepath: str | Path, sha256: str) -> Optional[ParsedDocument]:
+        """
+        Look up a cached parse of a markdown file.
+
+        Args:
+            filepath: Path to the markdown file
+            sha256: SHA-256 of the file's bytes
+
+        Returns:
+            The cached ParsedDocument, or None on a miss
+        """
+        filepath = Path(filepath)
+        entry_path = self._entry_path(sha256)
+
+        if not entry_path.exists():
+            self.misses += 1
+            return None
+
+        try:
+            with open(entry_path, "rb") as f:
+                document_id, title, frontmatter, frontmatter_errors, raw_content, rows = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError) as e:
+            print(f"Warning: Ignoring corrupt parse cache entry {entry_path.name}: {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+
+        # Filename/path come from the caller: identical bytes may live under
+        # several names.
+        return ParsedDocument(
+            filepath=filepath,
+            filename=filepath.name,
+            document_id=document_id,
+            title=title,
+            frontmatter=frontmatter,
+            sections=[
+                Section(
+                    section_id=section_id,
+                    title=section_title,
+                    level=level,
+                    content=content,
+                    compliance_relevance=relevance,
+                    likely_maps_to=maps_to,
+                    entities=entities,
+                    document_id=document_id,
+                    document_title=title,
+                    section_path=section_path
+                )
+                for section_id, section_title, level, content, relevance, maps_to, entities, section_path in rows
+            ],
+            raw_content=raw_content,
+            frontmatter_errors=frontmatter_errors
+        )
+
+    def put(self, document: ParsedDocument, sha256: str) -> Path:
+        """
+        Store a parsed document.
+
+        Args:
+            document: ParsedDocument to cache
+            sha256: Content hash of the markdown it was parsed from
+
+        Returns:
+            Path to the cache entry
+        """
+        entry_path = self._entry_path(sha256)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        data = (
+            document.document_id,
+            document.title,
+            document.frontmatter,
+            document.frontmatter_errors,
+            document.raw_content,
+            [
+                (
+                    section.section_id, section.title, section.level, section.content,
+                    section.compliance_relevance, section.likely_maps_to, section.entities,
+                    section.section_path
+                )
+                for section in document.sections
+            ]
+        )
+
+        # Write atomically (temp name unique per process and thread) so concurrent
+        # writers never see or clobber a partial entry
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, entry_path)
+
+        return entry_path
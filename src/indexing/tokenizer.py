@@ -0,0 +1,139 @@
+"""
+Tokenizer for BM25 Indexing and Search
+
+One tokenizer is shared by index building and querying so both sides
+produce the same terms. The default configuration reproduces the original
+tokenization (lowercase, runs of letters/digits, at least two characters);
+stopword removal, light stemming and acronym preservation are optional and
+recorded with the saved index.
+
+ASCII text (most chunks) is tokenized with str.translate and str.split;
+other text goes through one precompiled regex with the same semantics.
+"""
+
+import re
+import string
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Optional
+
+
+# Function words too common in policy text to help ranking ("shall" appears
+# in nearly every requirement and control)
+STOPWORDS = frozenset("""
+a about above after again all also an and any are as at be because been before
+being below between both but by can could did do does doing during each either
+for from further had has have having here how if in into is it its itself more
+most no nor not of off on once only or other our out over own same shall should
+so some such than that the their them then there these they this those through
+to under until up upon very was we were what when where whether which while who
+whom why will with within would
+""".split())
+
+# Uppercase abbreviations, optionally hyphenated: MFA, SEBI, CERT-In, ISO-27001
+ACRONYM_PATTERN = re.compile(r'(?<![\w-])([A-Z][A-Z0-9]{1,4}(?:-[A-Z0-9][A-Za-z0-9]*)*)(?![\w-])')
+
+# Every ASCII punctuation character becomes a separator
+_ASCII_SEPARATORS = str.maketrans({c: " " for c in string.punctuation})
+
+# Maximal query-token cache entries per tokenizer
+QUERY_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class TokenizerConfig:
+    """Tokenizer settings (saved with the index, so queries match it)."""
+    stopwords: bool = False  # Drop STOPWORDS
+    stemming: bool = False  # Strip plural endings (S-stemmer)
+    preserve_acronyms: bool = False  # Keep MFA, CERT-In, ... whole and unstemmed
+    min_length: int = 2  # Shorter tokens are dropped
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict]) -> "TokenizerConfig":
+        return cls(**data) if data else cls()
+
+
+def stem(word: str) -> str:
+    """
+    Light plural stemming (Harman's S-stemmer): policies → policy,
+    processes → processe, controls → control; "ss"/"us" endings are kept.
+    """
+    if len(word) <= 3:
+        return word
+    if word.endswith("ies") and not word.endswith(("eies", "aies")):
+        return word[:-3] + "y"
+    if word.endswith("es") and not word.endswith(("aes", "ees", "oes")):
+        return word[:-1]
+    if word.endswith("s") and not word.endswith(("us", "ss")):
+        return word[:-1]
+    return word
+
+
+class Tokenizer:
+    """
+    Text → terms for BM25.
+
+    Args:
+        config: Tokenizer settings (default: the original tokenization)
+    """
+
+    def __init__(self, config: Optional[TokenizerConfig] = None):
+        self.config = config or TokenizerConfig()
+        self._word_pattern = re.compile(rf'[^\W_]{{{self.config.min_length},}}')
+        self._normalized: dict[str, str] = {}  # Word → term after stopwords/stemming
+        self.tokenize_query = lru_cache(maxsize=QUERY_CACHE_SIZE)(self._tokenize_query)
+
+    def _words(self, text: str) -> list[str]:
+        """Lowercased runs of letters/digits of at least min_length characters."""
+        text = text.lower()
+        if text.isascii():
+            min_length = self.config.min_length
+            return [w for w in text.translate(_ASCII_SEPARATORS).split() if len(w) >= min_length]
+        return self._word_pattern.findall(text)
+
+    def _normalize(self, words: list[str]) -> list[str]:
+        """Apply stopword removal and stemming (memoized per word)."""
+        if not (self.config.stopwords or self.config.stemming):
+            return words
+
+        normalized = self._normalized
+        terms = []
+        for word in words:
+            term = normalized.get(word)
+            if term is None:
+                if self.config.stopwords and word in STOPWORDS:
+                    term = ""
+                else:
+                    term = stem(word) if self.config.stemming else word
+                normalized[word] = term
+            if term:
+                terms.append(term)
+        return terms
+
+    def tokenize(self, text: str) -> list[str]:
+        """Tokenize document (or query) text."""
+        if not self.config.preserve_acronyms:
+            return self._normalize(self._words(text))
+
+        # Split around acronyms: even items are text, odd items acronyms,
+        # which bypass stopwords and stemming ("IT" is not "it")
+        tokens = []
+        for i, piece in enumerate(ACRONYM_PATTERN.split(text)):
+            if i % 2:
+                tokens.append(piece.lower())
+            elif piece:
+                tokens.extend(self._normalize(self._words(piece)))
+        return tokens
+
+    def _tokenize_query(self, query: str) -> tuple[str, ...]:
+        return tuple(self.tokenize(query))
+
+    def __getstate__(self):
+        # The cache wraps a bound method; rebuild it on unpickling
+        return {"config": self.config}
+
+    def __setstate__(self, state):
+        self.__init__(state["config"])
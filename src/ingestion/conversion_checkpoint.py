@@ -0,0 +1,75 @@
+"""
+Conversion Checkpoints
+
+Keeps the output of each conversion request on disk so a crashed or
+interrupted conversion can resume without paying for completed parts again.
+
+Each part is streamed to `<key>.partial` as tokens arrive and renamed to
+`<key>.md` once the response completes; a response cut off at max_tokens
+is discarded instead. The key hashes the model and the full prompt, so a
+checkpoint is only reused for an identical request.
+"""
+
+import hashlib
+import shutil
+from pathlib import Path
+from typing import Optional
+
+
+def default_checkpoint_root() -> Path:
+    """Get the default checkpoint location (data/cache/conversion_checkpoints)."""
+    # Navigate up from src/ingestion/conversion_checkpoint.py
+    project_root = Path(__file__).resolve().parent.parent.parent
+    return project_root / "data" / "cache" / "conversion_checkpoints"
+
+
+class ConversionCheckpoint:
+    """Per-document directory of completed (and in-progress) part outputs."""
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+
+    @classmethod
+    def for_pdf(cls, pdf_sha256: str, root: Optional[str | Path] = None) -> "ConversionCheckpoint":
+        """Checkpoint directory for a PDF, keyed by its content hash."""
+        root = Path(root) if root else default_checkpoint_root()
+        return cls(root / pdf_sha256)
+
+    @staticmethod
+    def part_key(part: int, model: str, system_prompt: str, user_prompt: str) -> str:
+        """Key identifying one request's output."""
+        digest = hashlib.sha256()
+        for value in (model, system_prompt, user_prompt):
+            digest.update(value.encode("utf-8"))
+            digest.update(b"\0")
+        return f"part-{part:04d}-{digest.hexdigest()[:16]}"
+
+    def load(self, key: str) -> Optional[str]:
+        """Return the completed output for a part, or None if not finished."""
+        path = self.directory / f"{key}.md"
+        if path.exists():
+            return path.read_text(encoding="utf-8")
+        return None
+
+    def partial_path(self, key: str) -> Path:
+        """Path to stream an in-progress part into."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return self.directory / f"{key}.partial"
+
+    def commit(self, key: str):
+        """Mark a streamed part as complete."""
+        self.partial_path(key).replace(self.directory / f"{key}.md")
+
+    def discard(self, key: str):
+        """Delete a part's in-progress output (e.g. a truncated response)."""
+        (self.directory / f"{key}.partial").unlink(missing_ok=True)
+
+    def completed_parts(self) -> int:
+        """Number of parts already completed."""
+        if not self.directory.exists():
+            return 0
+        return sum(1 for _ in self.directory.glob("part-*.md"))
+
+    def clear(self):
+        """Remove the checkpoint once the final markdown has been saved."""
+        shutil.rmtree(self.directory, ignore_errors=True)
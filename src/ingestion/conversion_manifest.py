@@ -0,0 +1,138 @@
+"""
+Conversion Manifest
+
+Persistent record of which PDF produced which markdown file, so batch
+conversion can decide whether to skip a PDF with a dictionary lookup instead
+of scanning the markdown corpus. Each entry stores the PDF's content hash,
+so a PDF that keeps its name but changes its bytes is re-converted.
+"""
+
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Optional
+
+
+MANIFEST_FILENAME = "conversion_manifest.json"
+
+# Matches the frontmatter `filename:` field written by the converter
+FILENAME_PATTERN = re.compile(r'^filename:\s*["\']?(.+?)["\']?\s*$', re.MULTILINE)
+
+
+class ConversionManifest:
+    """
+    Maps PDF filename → {sha256, markdown, model, prompt_version, converted_at, parts}.
+
+    `parts` describes how the PDF was split into conversion requests (page
+    range, per-page hashes, the section IDs each request produced and the
+    model that produced them), which lets a revised PDF be re-converted part
+    by part.
+    """
+
+    def __init__(self, output_dir: str | Path):
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / MANIFEST_FILENAME
+        self.entries: dict[str, dict] = {}
+
+    @classmethod
+    def load(cls, output_dir: str | Path) -> "ConversionManifest":
+        """
+        Load the manifest for an output directory.
+
+        If no manifest exists yet, one is bootstrapped from the markdown files
+        already in the directory (a single pass over their frontmatter).
+        """
+        manifest = cls(output_dir)
+        if manifest.path.exists():
+            with open(manifest.path, encoding="utf-8") as f:
+                manifest.entries = json.load(f).get("entries", {})
+        else:
+            manifest._bootstrap()
+        return manifest
+
+    def _bootstrap(self):
+        """Adopt markdown files converted before the manifest existed."""
+        for md_file in sorted(self.output_dir.glob("*.md")):
+            with open(md_file, encoding="utf-8") as f:
+                preview = f.read(500)
+            match = FILENAME_PATTERN.search(preview)
+            if match:
+                self.entries[match.group(1)] = {
+                    "sha256": None,  # Unknown until the PDF is next seen
+                    "markdown": md_file.name,
+                    "model": None,
+                    "prompt_version": None,
+                    "converted_at": None,
+                    "parts": []
+                }
+
+    def lookup(self, pdf_name: str, sha256: str, model: str, prompt_version: str) -> Optional[dict]:
+        """
+        Find an up-to-date conversion for a PDF.
+
+        Returns the manifest entry if the PDF was converted from the same bytes
+        with the same model and prompt (or rules) version and its markdown
+        still exists, otherwise None. Bootstrapped entries (no recorded hash
+        or signature) are adopted with the current hash on first lookup.
+        """
+        entry = self.entries.get(pdf_name)
+        if entry is None or not (self.output_dir / entry["markdown"]).exists():
+            return None
+
+        if entry["sha256"] is None:
+            entry["sha256"] = sha256
+        elif entry["sha256"] != sha256:
+            return None
+
+        if entry["model"] is not None and (
+            entry["model"] != model or entry["prompt_version"] != prompt_version
+        ):
+            return None
+
+        return entry
+
+    def previous(self, pdf_name: str, model: str, prompt_version: str) -> Optional[dict]:
+        """
+        Get the last conversion of a PDF regardless of its hash, for
+        incremental re-conversion.
+
+        Only returned if it has part records, its markdown still exists and it
+        was produced with the same model and prompts (splicing output from a
+        different model or prompt into it would mix styles).
+        """
+        entry = self.entries.get(pdf_name)
+        if entry is None or not (self.output_dir / entry["markdown"]).exists():
+            return None
+        if not entry.get("parts") or entry["model"] != model or entry["prompt_version"] != prompt_version:
+            return None
+        return entry
+
+    def record(
+        self,
+        pdf_name: str,
+        sha256: str,
+        markdown_name: str,
+        model: str,
+        prompt_version: str,
+        parts: Optional[list[dict]] = None
+    ):
+        """Record a completed conversion."""
+        self.entries[pdf_name] = {
+            "sha256": sha256,
+            "markdown": markdown_name,
+            "model": model,
+            "prompt_version": prompt_version,
+            "converted_at": datetime.now().isoformat(),
+            "parts": parts or []
+        }
+
+    def save(self):
+        """Write the manifest atomically."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"entries": self.entries}, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
@@ -9,13 +9,22 @@ import sys
 import json
 import time
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Optional
 
 from openai import OpenAI
 
-from .pdf_extractor import extract_all_pdfs, ExtractedDocument
-from .pdf_to_markdown import convert_to_markdown, save_markdown
+from .pdf_extractor import BACKEND_NAMES, DEFAULT_BACKEND, extract_all_pdfs, extract_pdf, ExtractedDocument
+from .extraction_cache import ExtractionCache, file_sha256
+from .conversion_manifest import ConversionManifest
+from .pdf_to_markdown import (
+    PROMPT_VERSION, convert_to_markdown_incremental, convert_with_rules,
+    converter_signature, save_markdown
+)
+from .rate_limiter import RateLimiter
+from .model_router import ModelCascade
+from .conversion_checkpoint import ConversionCheckpoint
 
 
 def get_project_root() -> Path:
@@ -30,7 +39,16 @@ def convert_all_policies(
     output_dir: Optional[Path] = None,
     model: str = "gpt-4o",
     skip_existing: bool = True,
-    dry_run: bool = False
+    dry_run: bool = False,
+    use_cache: bool = True,
+    concurrency: int = 1,
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None,
+    backend: str = DEFAULT_BACKEND,
+    converter: str = "llm",
+    small_model: Optional[str] = None,
+    parallel_parts: int = 4,
+    max_requests: Optional[int] = None
 ) -> dict:
     """
     Convert all PDF policies to structured markdown.
@@ -39,8 +57,24 @@ def convert_all_policies(
         input_dir: Directory containing PDFs (default: data/policies)
         output_dir: Directory for markdown output (default: data/policies_md)
         model: OpenAI model to use
-        skip_existing: Skip files that already have a markdown version
+        skip_existing: Skip PDFs whose current bytes were already converted
+            with the same converter, model and prompts (tracked in
+            conversion_manifest.json)
         dry_run: If True, only show what would be done
+        use_cache: Reuse cached PDF extractions (data/cache/extraction)
+        concurrency: Max PDFs being converted at the same time (each sends
+            up to `parallel_parts` requests at once)
+        requests_per_minute: OpenAI RPM quota to stay under (None = unlimited)
+        tokens_per_minute: OpenAI TPM quota to stay under (None = unlimited)
+        backend: PDF extraction engine ("pdfplumber", "pdfium" or "hybrid")
+        converter: "llm" (full LLM conversion), "rules" (rule-based, no API
+            calls, seconds for the whole corpus) or "draft" (rule-based body,
+            LLM-corrected frontmatter)
+        small_model: Model for plain prose pages; `model` is then kept for
+            pages with tables or dense structure (None = `model` for all pages)
+        parallel_parts: Max parts of one PDF converted at the same time
+        max_requests: Max API requests in flight across all PDFs (None =
+            concurrency × parallel_parts)
 
     Returns:
         Summary dict with results
@@ -56,15 +90,17 @@ def convert_all_policies(
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Check for API key
+    # Check for API key (rule-based conversion makes no API calls)
+    needs_api = not dry_run and converter != "rules"
     api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key and not dry_run:
+    if not api_key and needs_api:
         print("Error: OPENAI_API_KEY environment variable not set")
         print("Set it with: export OPENAI_API_KEY='your-key-here'")
         sys.exit(1)
 
     # Initialize client
-    client = OpenAI(api_key=api_key) if not dry_run else None
+    client = OpenAI(api_key=api_key) if needs_api else None
+    cache = ExtractionCache() if use_cache else None
 
     # Get all PDFs
     pdf_files = sorted(input_dir.glob("*.pdf"))
@@ -78,32 +114,35 @@ def convert_all_policies(
         "skipped": [],
         "failed": [],
         "start_time": datetime.now().isoformat(),
-        "model": model
+        "model": model,
+        "converter": converter,
+        "small_model": small_model,
+        "concurrency": concurrency,
+        "parallel_parts": parallel_parts,
+        "max_requests": max_requests
     }
+    cascade = ModelCascade(model, small_model)
+    record_model, record_version = converter_signature(converter, model)
+    if converter == "llm":
+        record_model = cascade.signature
 
-    # Check existing markdown files
-    existing_md = {f.stem.lower(): f for f in output_dir.glob("*.md")}
+    # Load the conversion manifest once; skip checks are lookups against it
+    manifest = ConversionManifest.load(output_dir)
+    pending = []
 
     for i, pdf_path in enumerate(pdf_files, 1):
-        pdf_name = pdf_path.stem
         print(f"\n[{i}/{len(pdf_files)}] {pdf_path.name}")
+        pdf_hash = file_sha256(pdf_path)
 
-        # Check if already converted
+        # Check if already converted from these exact bytes, the same way
         if skip_existing:
-            # Check if any markdown file references this PDF
-            should_skip = False
-            for md_file in output_dir.glob("*.md"):
-                content_preview = md_file.read_text(encoding="utf-8")[:500]
-                if pdf_path.name in content_preview:
-                    should_skip = True
-                    print(f"  ⏭ Skipping (already exists: {md_file.name})")
-                    results["skipped"].append({
-                        "pdf": pdf_path.name,
-                        "existing_md": md_file.name
-                    })
-                    break
-
-            if should_skip:
+            entry = manifest.lookup(pdf_path.name, pdf_hash, record_model, record_version)
+            if entry is not None:
+                print(f"  ⏭ Skipping (already exists: {entry['markdown']})")
+                results["skipped"].append({
+                    "pdf": pdf_path.name,
+                    "existing_md": entry["markdown"]
+                })
                 continue
 
         if dry_run:
@@ -114,44 +153,117 @@ def convert_all_policies(
             })
             continue
 
-        try:
-            # Extract PDF
-            print(f"  📄 Extracting text...")
-            from .pdf_extractor import extract_pdf
-            document = extract_pdf(pdf_path)
-            print(f"     {document.total_pages} pages extracted")
-
-            # Convert to markdown
-            print(f"  🤖 Converting with {model}...")
-            start_time = time.time()
-            markdown = convert_to_markdown(document, client, model)
-            elapsed = time.time() - start_time
-            print(f"     Conversion took {elapsed:.1f}s")
-
-            # Save markdown
-            output_path = save_markdown(markdown, output_dir)
-            print(f"  ✅ Saved: {output_path.name}")
-
-            results["converted"].append({
-                "pdf": pdf_path.name,
-                "markdown": output_path.name,
-                "pages": document.total_pages,
-                "time_seconds": round(elapsed, 1)
-            })
+        if converter == "llm":
+            # A revised PDF converted earlier with the same model and prompts is
+            # re-converted incrementally, part by part
+            previous = manifest.previous(pdf_path.name, record_model, PROMPT_VERSION) if skip_existing else None
+        else:
+            # Rule-based output replaces the earlier file, keeping its document ID
+            entry = manifest.entries.get(pdf_path.name)
+            previous = entry if entry and (output_dir / entry["markdown"]).exists() else None
+
+        incremental = converter == "llm" and previous
+        print(f"  📝 Queued for {'incremental ' if incremental else ''}conversion")
+        pending.append((pdf_path, pdf_hash, previous))
+
+    rate_limiter = RateLimiter(requests_per_minute, tokens_per_minute, max_requests)
+
+    def convert_one(pdf_path: Path, pdf_hash: str, previous: Optional[dict]) -> dict:
+        """Extract and convert one PDF (runs on a scheduler thread)."""
+        name = pdf_path.name
+
+        # Extract PDF
+        if cache:
+            document, from_cache = cache.get_or_extract(pdf_path, sha256=pdf_hash, backend=backend)
+        else:
+            document, from_cache = extract_pdf(pdf_path, backend=backend), False
+        if from_cache:
+            print(f"  📄 [{name}] {document.total_pages} pages extracted (from cache)")
+        else:
+            print(f"  📄 [{name}] {document.total_pages} pages extracted "
+                  f"({document.fast_path_pages} skipped table extraction)")
+
+        existing_path = output_dir / previous["markdown"] if previous else None
+        start_time = time.time()
+
+        if converter == "llm":
+            # Convert to markdown, resuming any parts finished by an earlier run
+            checkpoint = ConversionCheckpoint.for_pdf(pdf_hash)
+            resumed = checkpoint.completed_parts()
+            print(f"  🤖 [{name}] Converting with {cascade.signature}..."
+                  + (f" (resuming, {resumed} part(s) done)" if resumed else ""))
+            markdown, parts = convert_to_markdown_incremental(
+                document, client, model,
+                rate_limiter=rate_limiter,
+                max_parallel_parts=parallel_parts,
+                checkpoint=checkpoint,
+                previous_parts=previous["parts"] if previous else None,
+                existing_markdown=existing_path.read_text(encoding="utf-8") if previous else None,
+                cascade=cascade
+            )
+            checkpoint.clear()
+        else:
+            print(f"  📐 [{name}] Converting with rules"
+                  + (f" (frontmatter by {model})..." if converter == "draft" else "..."))
+            markdown = convert_with_rules(document, existing_path, client, model, rate_limiter)
+            parts = []
+        elapsed = time.time() - start_time
+
+        # Save markdown (a revision overwrites the file it was spliced into)
+        output_path = save_markdown(markdown, existing_path or output_dir)
+        print(f"  ✅ [{name}] Saved: {output_path.name} ({elapsed:.1f}s)")
+
+        return {
+            "pdf": name,
+            "markdown": output_path.name,
+            "pages": document.total_pages,
+            "time_seconds": round(elapsed, 1),
+            "parts": parts
+        }
+
+    if pending:
+        in_flight = max(1, concurrency) * max(1, parallel_parts)
+        if max_requests:
+            in_flight = min(in_flight, max_requests)
+        print(f"\nConverting {len(pending)} PDFs with up to {concurrency} in flight "
+              f"(at most {in_flight} API requests at once)...")
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            future_to_job = {
+                executor.submit(convert_one, *job): job
+                for job in pending
+            }
+
+            # Results are recorded on this thread, so the manifest needs no lock
+            for future in as_completed(future_to_job):
+                pdf_path, pdf_hash, _ = future_to_job[future]
+                try:
+                    converted = future.result()
+                except Exception as e:
+                    print(f"  ❌ [{pdf_path.name}] Error: {e}")
+                    results["failed"].append({
+                        "pdf": pdf_path.name,
+                        "error": str(e)
+                    })
+                    continue
 
-            # Rate limiting - be nice to the API
-            if i < len(pdf_files):
-                time.sleep(1)
+                parts = converted.pop("parts")
+                manifest.record(
+                    pdf_path.name, pdf_hash, converted["markdown"], record_model, record_version, parts
+                )
+                manifest.save()
+                results["converted"].append(converted)
 
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-            results["failed"].append({
-                "pdf": pdf_path.name,
-                "error": str(e)
-            })
+    # Persist hashes adopted for files converted before the manifest existed
+    if not dry_run:
+        manifest.save()
 
     # Summary
     results["end_time"] = datetime.now().isoformat()
+    if cache is not None:
+        results["extraction_cache"] = {"hits": cache.hits, "misses": cache.misses}
+    if converter == "llm" and not dry_run:
+        results["tiers"] = cascade.summary()
     print("\n" + "=" * 60)
     print("CONVERSION SUMMARY")
     print("=" * 60)
@@ -160,6 +272,11 @@ def convert_all_policies(
     print(f"Skipped:        {len(results['skipped'])}")
     print(f"Failed:         {len(results['failed'])}")
 
+    for tier, stats in results.get("tiers", {}).items():
+        print(f"{tier.capitalize() + ':':<15} {stats['model']}: {stats['parts']} part(s), "
+              f"{stats['pages']} pages, {stats['seconds']}s, "
+              f"{stats['prompt_tokens']} in / {stats['completion_tokens']} out tokens")
+
     if results["failed"]:
         print("\nFailed files:")
         for f in results["failed"]:
@@ -196,6 +313,11 @@ def main():
         default="gpt-4o",
         help="OpenAI model to use (default: gpt-4o)"
     )
+    parser.add_argument(
+        "--small-model",
+        help="Smaller model for plain prose pages; --model handles tables and "
+             "dense structure (default: --model for all pages)"
+    )
     parser.add_argument(
         "--no-skip",
         action="store_true",
@@ -206,6 +328,53 @@ def main():
         action="store_true",
         help="Show what would be done without converting"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-extract PDFs instead of using the extraction cache"
+    )
+    parser.add_argument(
+        "--concurrency", "-c",
+        type=int,
+        default=1,
+        help="Max PDFs converted concurrently; each runs up to --parallel-parts "
+             "requests at once (default: 1)"
+    )
+    parser.add_argument(
+        "--parallel-parts",
+        type=int,
+        default=4,
+        help="Max parts of one PDF converted concurrently (default: 4)"
+    )
+    parser.add_argument(
+        "--max-requests",
+        type=int,
+        help="Max API requests in flight across all PDFs "
+             "(default: --concurrency x --parallel-parts)"
+    )
+    parser.add_argument(
+        "--rpm",
+        type=float,
+        help="Requests-per-minute limit for the OpenAI API"
+    )
+    parser.add_argument(
+        "--tpm",
+        type=float,
+        help="Tokens-per-minute limit for the OpenAI API"
+    )
+    parser.add_argument(
+        "--backend",
+        default=DEFAULT_BACKEND,
+        choices=BACKEND_NAMES,
+        help=f"PDF extraction engine (default: {DEFAULT_BACKEND})"
+    )
+    parser.add_argument(
+        "--converter",
+        default="llm",
+        choices=["llm", "rules", "draft"],
+        help="llm: full LLM conversion; rules: offline rule-based conversion; "
+             "draft: rule-based body with LLM-corrected frontmatter (default: llm)"
+    )
 
     args = parser.parse_args()
 
@@ -214,7 +383,16 @@ def main():
         output_dir=args.output_dir,
         model=args.model,
         skip_existing=not args.no_skip,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        use_cache=not args.no_cache,
+        concurrency=args.concurrency,
+        requests_per_minute=args.rpm,
+        tokens_per_minute=args.tpm,
+        backend=args.backend,
+        converter=args.converter,
+        small_model=args.small_model,
+        parallel_parts=args.parallel_parts,
+        max_requests=args.max_requests
     )
 
 
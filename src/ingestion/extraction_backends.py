@@ -0,0 +1,234 @@
+"""
+PDF Extraction Backends
+
+Engines that turn a PDF into ExtractedPage objects for extract_pdf:
+
+- pdfplumber: layout-aware text plus table extraction (default, most accurate)
+- pdfium:     text only via the C PDFium library (pypdfium2); much faster,
+              but never extracts tables
+- hybrid:     pdfium for pages without any vector drawing (which therefore
+              cannot contain ruled tables), pdfplumber for the rest
+
+Backends are looked up by name so worker processes can be told which one to
+use without pickling engine objects.
+
+PDFium is not thread-safe, so every pypdfium2 call runs under one
+module-level lock (conversions extract on scheduler threads).
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import pdfplumber
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # Installed with pdfplumber>=0.10, but optional here
+    pdfium = None
+
+from .pdf_extractor import DEFAULT_BACKEND, ExtractedPage
+
+# Serializes all PDFium use within the process
+_PDFIUM_LOCK = threading.Lock()
+
+
+class ExtractionBackend(ABC):
+    """Base class for extraction engines."""
+
+    name = ""
+
+    @abstractmethod
+    def document_info(self, filepath: Path) -> tuple[int, dict]:
+        """Return (total_pages, metadata) for a PDF."""
+
+    @abstractmethod
+    def extract_pages(
+        self,
+        filepath: Path,
+        start: int,
+        stop: int,
+        force_tables: bool = False
+    ) -> list[ExtractedPage]:
+        """Extract pages [start, stop) (0-based indices)."""
+
+    def extract_all(
+        self,
+        filepath: Path,
+        force_tables: bool = False
+    ) -> tuple[list[ExtractedPage], int, dict]:
+        """Extract every page; returns (pages, total_pages, metadata)."""
+        total_pages, metadata = self.document_info(filepath)
+        return self.extract_pages(filepath, 0, total_pages, force_tables), total_pages, metadata
+
+
+# --- pdfplumber ---
+
+def _may_contain_table(page) -> bool:
+    """
+    Cheap pre-check for extract_tables().
+
+    pdfplumber's default "lines" table strategy builds cells only from ruling
+    lines and rectangle/curve edges, and a cell needs at least two horizontal
+    and two vertical edges. A page without them cannot yield a table, so the
+    (expensive) table finder can be skipped.
+    """
+    objects = page.objects
+    if not (objects.get("line") or objects.get("rect") or objects.get("curve")):
+        return False
+    return len(page.horizontal_edges) >= 2 and len(page.vertical_edges) >= 2
+
+
+def _extract_plumber_page(page, page_number: int, force_tables: bool = False) -> ExtractedPage:
+    """Extract text and tables from a single pdfplumber page."""
+    # Extract text
+    text = page.extract_text() or ""
+
+    # Extract tables (only where ruling lines make a table possible)
+    tables = []
+    tables_scanned = force_tables or _may_contain_table(page)
+    if tables_scanned:
+        extracted_tables = page.extract_tables()
+        if extracted_tables:
+            tables = extracted_tables
+
+    return ExtractedPage(
+        page_number=page_number,
+        text=text,
+        tables=tables,
+        tables_scanned=tables_scanned
+    )
+
+
+class PdfplumberBackend(ExtractionBackend):
+    """Layout-aware text and table extraction with pdfplumber."""
+
+    name = "pdfplumber"
+
+    def document_info(self, filepath: Path) -> tuple[int, dict]:
+        with pdfplumber.open(filepath) as pdf:
+            return len(pdf.pages), pdf.metadata or {}
+
+    def extract_pages(self, filepath, start, stop, force_tables=False):
+        with pdfplumber.open(filepath) as pdf:
+            return [
+                _extract_plumber_page(pdf.pages[idx], idx + 1, force_tables)
+                for idx in range(start, stop)
+            ]
+
+    def extract_all(self, filepath, force_tables=False):
+        # Open once instead of separately for info and pages
+        with pdfplumber.open(filepath) as pdf:
+            pages = [
+                _extract_plumber_page(page, page_num, force_tables)
+                for page_num, page in enumerate(pdf.pages, start=1)
+            ]
+            return pages, len(pdf.pages), pdf.metadata or {}
+
+
+# --- pdfium ---
+
+def _open_pdfium(filepath: Path):
+    if pdfium is None:
+        raise ImportError("The pdfium backend requires pypdfium2: pip install pypdfium2")
+    return pdfium.PdfDocument(str(filepath))
+
+
+def _pdfium_page_text(page) -> str:
+    """Extract a page's text with PDFium, normalizing line endings."""
+    textpage = page.get_textpage()
+    try:
+        text = textpage.get_text_range()
+    finally:
+        textpage.close()
+    return text.replace("\r\n", "\n").replace("\r", "\n").strip()
+
+
+def _has_vector_drawing(page) -> bool:
+    """True if the page has any path objects (lines, boxes, shapes)."""
+    paths = page.get_objects(filter=(pdfium.raw.FPDF_PAGEOBJ_PATH,))
+    return next(paths, None) is not None
+
+
+class PdfiumBackend(ExtractionBackend):
+    """Fast text-only extraction with PDFium. Tables are not extracted."""
+
+    name = "pdfium"
+
+    def document_info(self, filepath: Path) -> tuple[int, dict]:
+        with _PDFIUM_LOCK:
+            pdf = _open_pdfium(filepath)
+            try:
+                return len(pdf), pdf.get_metadata_dict(skip_empty=True)
+            finally:
+                pdf.close()
+
+    def extract_pages(self, filepath, start, stop, force_tables=False):
+        with _PDFIUM_LOCK:
+            pdf = _open_pdfium(filepath)
+            try:
+                pages = []
+                for idx in range(start, stop):
+                    page = pdf[idx]
+                    try:
+                        pages.append(ExtractedPage(
+                            page_number=idx + 1,
+                            text=_pdfium_page_text(page),
+                            tables_scanned=False
+                        ))
+                    finally:
+                        page.close()
+                return pages
+            finally:
+                pdf.close()
+
+
+class HybridBackend(PdfiumBackend):
+    """
+    Chooses the engine per page: PDFium for pages with no vector drawing,
+    pdfplumber (with table extraction) for everything else.
+    """
+
+    name = "hybrid"
+
+    def extract_pages(self, filepath, start, stop, force_tables=False):
+        # PDFium pass (under the lock): text of pages without vector drawing
+        pages = {}
+        with _PDFIUM_LOCK:
+            pdf = _open_pdfium(filepath)
+            try:
+                for idx in range(start, stop):
+                    page = pdf[idx]
+                    try:
+                        if not (force_tables or _has_vector_drawing(page)):
+                            pages[idx] = ExtractedPage(
+                                page_number=idx + 1,
+                                text=_pdfium_page_text(page),
+                                tables_scanned=False
+                            )
+                    finally:
+                        page.close()
+            finally:
+                pdf.close()
+
+        # pdfplumber for the rest
+        remaining = [idx for idx in range(start, stop) if idx not in pages]
+        if remaining:
+            with pdfplumber.open(filepath) as plumber_pdf:
+                for idx in remaining:
+                    pages[idx] = _extract_plumber_page(plumber_pdf.pages[idx], idx + 1, force_tables)
+
+        return [pages[idx] for idx in range(start, stop)]
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (PdfplumberBackend, PdfiumBackend, HybridBackend)
+}
+
+
+def get_backend(name: str = DEFAULT_BACKEND) -> ExtractionBackend:
+    """Get an extraction backend by name."""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown extraction backend: {name} (choose from {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
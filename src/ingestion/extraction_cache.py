@@ -0,0 +1,165 @@
+"""
+Content-Addressed Extraction Cache
+
+Stores ExtractedDocument results on disk keyed by the SHA-256 of the PDF bytes
+(plus the extraction backend and extractor version), so byte-identical PDFs
+are never extracted twice. Entries are gzip-compressed JSON with pages stored as
+compact [page_number, text, tables, tables_scanned] rows.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from .pdf_extractor import DEFAULT_BACKEND, EXTRACTOR_VERSION, ExtractedDocument, ExtractedPage, extract_pdf
+
+
+def file_sha256(filepath: str | Path, block_size: int = 1 << 20) -> str:
+    """Hash a file's contents without reading it into memory at once."""
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def default_cache_dir() -> Path:
+    """Get the default cache location (data/cache/extraction)."""
+    # Navigate up from src/ingestion/extraction_cache.py
+    project_root = Path(__file__).resolve().parent.parent.parent
+    return project_root / "data" / "cache" / "extraction"
+
+
+class ExtractionCache:
+    """On-disk cache of extracted PDFs, keyed by content hash."""
+
+    def __init__(self, cache_dir: Optional[str | Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, sha256: str, backend: str) -> Path:
+        return self.cache_dir / f"{sha256}-{backend}-v{EXTRACTOR_VERSION}.json.gz"
+
+    def get(
+        self,
+        filepath: str | Path,
+        sha256: Optional[str] = None,
+        backend: str = DEFAULT_BACKEND
+    ) -> Optional[ExtractedDocument]:
+        """
+        Look up a cached extraction for a PDF.
+
+        Args:
+            filepath: Path to the PDF file
+            sha256: Precomputed content hash (computed from the file if omitted)
+            backend: Extraction backend the cached result must come from
+
+        Returns:
+            The cached ExtractedDocument, or None on a miss
+        """
+        filepath = Path(filepath)
+        sha256 = sha256 or file_sha256(filepath)
+        entry_path = self._entry_path(sha256, backend)
+
+        if not entry_path.exists():
+            self.misses += 1
+            return None
+
+        try:
+            with gzip.open(entry_path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring corrupt cache entry {entry_path.name}: {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+
+        # Filename/path come from the caller: identical bytes may live under
+        # several names.
+        return ExtractedDocument(
+            filename=filepath.name,
+            filepath=filepath,
+            pages=[
+                ExtractedPage(
+                    page_number=number, text=text, tables=tables, tables_scanned=scanned
+                )
+                for number, text, tables, scanned in data["pages"]
+            ],
+            total_pages=data["total_pages"],
+            metadata=data["metadata"]
+        )
+
+    def get_or_extract(
+        self,
+        filepath: str | Path,
+        sha256: Optional[str] = None,
+        backend: str = DEFAULT_BACKEND
+    ) -> tuple[ExtractedDocument, bool]:
+        """
+        Look up a PDF's extraction, extracting and storing it on a miss.
+
+        Args:
+            filepath: Path to the PDF file
+            sha256: Precomputed content hash (computed from the file if omitted)
+            backend: Extraction backend to use
+
+        Returns:
+            Tuple of (document, whether it came from the cache)
+        """
+        sha256 = sha256 or file_sha256(filepath)
+        document = self.get(filepath, sha256=sha256, backend=backend)
+        if document is not None:
+            return document, True
+
+        document = extract_pdf(filepath, backend=backend)
+        self.put(document, sha256=sha256, backend=backend)
+        return document, False
+
+    def put(
+        self,
+        document: ExtractedDocument,
+        sha256: Optional[str] = None,
+        backend: str = DEFAULT_BACKEND
+    ) -> Path:
+        """
+        Store an extracted document.
+
+        Args:
+            document: ExtractedDocument to cache
+            sha256: Precomputed content hash of document.filepath
+            backend: Extraction backend that produced the document
+
+        Returns:
+            Path to the cache entry
+        """
+        sha256 = sha256 or file_sha256(document.filepath)
+        entry_path = self._entry_path(sha256, backend)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        data = {
+            "extractor_version": EXTRACTOR_VERSION,
+            "backend": backend,
+            "sha256": sha256,
+            "total_pages": document.total_pages,
+            # PDF metadata can hold pdfminer objects; store their string form
+            "metadata": json.loads(json.dumps(document.metadata, default=str)),
+            "pages": [
+                [page.page_number, page.text, page.tables, page.tables_scanned]
+                for page in document.pages
+            ]
+        }
+
+        # Write atomically (temp name unique per process and thread) so concurrent
+        # writers never see or clobber a partial entry
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, entry_path)
+
+        return entry_path
@@ -0,0 +1,194 @@
+"""
+Model Cascade Routing
+
+Classifies extracted pages by structural complexity so conversion can send
+plain prose to a small, fast model and reserve the large model for pages
+with tables, dense heading structure or unusually long text. Per-tier
+request time and token usage are accumulated for the conversion log.
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+from .pdf_extractor import ExtractedDocument, ExtractedPage
+from .tokens import count_tokens
+
+
+SIMPLE = "simple"
+COMPLEX = "complex"
+
+# Numbered heading lines such as "4.2 Access Control" or "3. Scope"
+HEADING_LINE_PATTERN = re.compile(r'^\d{1,2}(?:\.\d{1,2}){0,4}\.?\s+[A-Z]')
+
+# Pages where at least this fraction of lines are numbered headings carry
+# most of the section structure (and section IDs) of the document
+HEADING_DENSITY_THRESHOLD = 0.25
+
+# Pages longer than this are dense layouts (small print, multi-column text)
+LONG_PAGE_TOKENS = 1200
+
+# Title, version-control and approval pages, which feed the frontmatter
+FRONTMATTER_PAGES = 3
+
+# Runs of simple pages shorter than this go with their complex neighbours:
+# a separate request pays for the system prompt again, which outweighs what
+# the small model saves on one or two pages
+MIN_SIMPLE_RUN = 3
+
+
+@dataclass
+class PageProfile:
+    """Structural features of one extracted page."""
+    page_number: int
+    tokens: int
+    tables: int  # Tables with at least two filled cells in some row
+    lines: int
+    heading_lines: int
+
+    @property
+    def heading_density(self) -> float:
+        return self.heading_lines / self.lines if self.lines else 0.0
+
+    def reasons(self) -> list[str]:
+        """Why the page needs the large model (empty for plain prose)."""
+        reasons = []
+        if self.page_number <= FRONTMATTER_PAGES:
+            reasons.append("frontmatter")
+        if self.tables:
+            reasons.append("tables")
+        if self.heading_density >= HEADING_DENSITY_THRESHOLD:
+            reasons.append("headings")
+        if self.tokens > LONG_PAGE_TOKENS:
+            reasons.append("length")
+        return reasons
+
+    @property
+    def tier(self) -> str:
+        return COMPLEX if self.reasons() else SIMPLE
+
+
+def profile_page(page: ExtractedPage, model: str = "gpt-4o") -> PageProfile:
+    """Measure the features used to route a page."""
+    lines = [line for line in page.text.split("\n") if line.strip()]
+    tables = sum(
+        1 for table in page.tables
+        if any(sum(1 for cell in row if cell and cell.strip()) >= 2 for row in table)
+    )
+    return PageProfile(
+        page_number=page.page_number,
+        tokens=count_tokens(page.get_text(), model),
+        tables=tables,
+        lines=len(lines),
+        heading_lines=sum(1 for line in lines if HEADING_LINE_PATTERN.match(line))
+    )
+
+
+def classify_pages(document: ExtractedDocument, model: str = "gpt-4o") -> dict[int, str]:
+    """
+    Assign each page a tier, absorbing short simple runs into complex ones.
+
+    Returns:
+        Dict of page number → SIMPLE or COMPLEX
+    """
+    tiers = [profile_page(page, model).tier for page in document.pages]
+
+    start = 0
+    while start < len(tiers):
+        end = start
+        while end < len(tiers) and tiers[end] == tiers[start]:
+            end += 1
+        if tiers[start] == SIMPLE and end - start < MIN_SIMPLE_RUN:
+            tiers[start:end] = [COMPLEX] * (end - start)
+        start = end
+
+    return {page.page_number: tier for page, tier in zip(document.pages, tiers)}
+
+
+def split_runs(document: ExtractedDocument, page_tiers: dict[int, str]) -> list[list[ExtractedPage]]:
+    """Split a document's pages into consecutive runs of the same tier."""
+    runs = []
+    for page in document.pages:
+        if runs and page_tiers[runs[-1][-1].page_number] == page_tiers[page.page_number]:
+            runs[-1].append(page)
+        else:
+            runs.append([page])
+    return runs
+
+
+class ModelCascade:
+    """
+    Routes conversion requests to a large or small model and accounts for
+    time and tokens per tier.
+
+    Args:
+        large_model: Model for complex pages (and everything, without small_model)
+        small_model: Model for plain prose pages (None = no cascade)
+    """
+
+    def __init__(self, large_model: str = "gpt-4o", small_model: Optional[str] = None):
+        self.models = {COMPLEX: large_model, SIMPLE: small_model or large_model}
+        self.enabled = small_model is not None and small_model != large_model
+        self._lock = threading.Lock()
+        self.stats = {
+            tier: {
+                "model": model,
+                "parts": 0,
+                "pages": 0,
+                "requests": 0,
+                "seconds": 0.0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0
+            }
+            for tier, model in self.models.items()
+        }
+
+    @property
+    def signature(self) -> str:
+        """Model name recorded in the manifest ("small/large" for a cascade)."""
+        if not self.enabled:
+            return self.models[COMPLEX]
+        return f"{self.models[SIMPLE]}/{self.models[COMPLEX]}"
+
+    def model_for(self, tier: str) -> str:
+        return self.models[tier]
+
+    def classify(self, document: ExtractedDocument) -> Optional[dict[int, str]]:
+        """Page tiers for a document, or None if every page uses one model."""
+        if not self.enabled:
+            return None
+        return classify_pages(document, self.models[COMPLEX])
+
+    def route(self, group: list[ExtractedPage], page_tiers: Optional[dict[int, str]]) -> str:
+        """Tier of a page group: complex if any of its pages is."""
+        if page_tiers is None:
+            return COMPLEX
+        if any(page_tiers[page.page_number] == COMPLEX for page in group):
+            return COMPLEX
+        return SIMPLE
+
+    def record_request(self, tier: str, usage):
+        """Account one API response's token usage."""
+        with self._lock:
+            stats = self.stats[tier]
+            stats["requests"] += 1
+            stats["prompt_tokens"] += usage.prompt_tokens
+            stats["completion_tokens"] += usage.completion_tokens
+
+    def record_part(self, tier: str, pages: int, seconds: float):
+        """Account one converted part (including any retries)."""
+        with self._lock:
+            stats = self.stats[tier]
+            stats["parts"] += 1
+            stats["pages"] += pages
+            stats["seconds"] += seconds
+
+    def summary(self) -> dict:
+        """Per-tier totals for the conversion log (a single "all" tier without a cascade)."""
+        with self._lock:
+            totals = {
+                tier: {**stats, "seconds": round(stats["seconds"], 1)}
+                for tier, stats in self.stats.items()
+            }
+        return totals if self.enabled else {"all": totals[COMPLEX]}
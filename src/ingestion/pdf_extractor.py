@@ -1,14 +1,34 @@
 """
 PDF Text Extraction Module
 
-Extracts text and tables from policy PDF documents using pdfplumber.
-Preserves structure as much as possible for downstream LLM processing.
+Extracts text and tables from policy PDF documents using pdfplumber (or a
+faster backend from extraction_backends). Preserves structure as much as
+possible for downstream LLM processing.
 """
 
-import pdfplumber
+import hashlib
+import os
+import time
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
+
+if TYPE_CHECKING:
+    from .extraction_cache import ExtractionCache
+
+
+# Bump when extraction output changes so cached extractions are invalidated
+EXTRACTOR_VERSION = "2"
+
+# Extraction engines (see extraction_backends, which imports this module, so
+# it is only imported inside functions here)
+DEFAULT_BACKEND = "pdfplumber"
+BACKEND_NAMES = ("pdfplumber", "pdfium", "hybrid")
+
+# Below this many pages the cost of spawning workers (and of each worker
+# re-opening the PDF) outweighs the parallel speedup.
+MIN_PAGES_FOR_PARALLEL = 8
 
 
 @dataclass
@@ -17,6 +37,23 @@ class ExtractedPage:
     page_number: int
     text: str
     tables: list[list[list[str]]] = field(default_factory=list)
+    # False when the page had no ruling lines, so full table extraction was skipped
+    tables_scanned: bool = True
+
+    def get_text(self) -> str:
+        """Get the page text with a page marker and tables, as sent to the LLM."""
+        page_text = f"\n--- Page {self.page_number} ---\n{self.text}"
+
+        # Add tables
+        for table_idx, table in enumerate(self.tables):
+            page_text += f"\n[Table {table_idx + 1}]\n"
+            page_text += format_table_as_text(table)
+
+        return page_text
+
+    def content_hash(self) -> str:
+        """Hash of the page's text and tables, used to detect revised pages."""
+        return hashlib.sha256(self.get_text().encode("utf-8")).hexdigest()
 
 
 @dataclass
@@ -28,6 +65,11 @@ class ExtractedDocument:
     total_pages: int
     metadata: dict = field(default_factory=dict)
 
+    @property
+    def fast_path_pages(self) -> int:
+        """Number of pages where table extraction was skipped by the pre-check."""
+        return sum(1 for page in self.pages if not page.tables_scanned)
+
     def get_full_text(self, include_page_markers: bool = True) -> str:
         """Get all text concatenated, optionally with page markers."""
         parts = []
@@ -43,39 +85,68 @@ class ExtractedDocument:
 
         return "\n".join(parts)
 
+    def _group_pages(self, page_sizes: list[int], max_size: int) -> list[list[ExtractedPage]]:
+        """Pack consecutive pages into groups whose sizes sum to at most max_size."""
+        groups = []
+        current_group = []
+        current_size = 0
+
+        for page, page_size in zip(self.pages, page_sizes):
+            if current_size + page_size > max_size and current_group:
+                # Save current group and start new one
+                groups.append(current_group)
+                current_group = [page]
+                current_size = page_size
+            else:
+                current_group.append(page)
+                current_size += page_size
+
+        # Don't forget the last group
+        if current_group:
+            groups.append(current_group)
+
+        return groups
+
+    def get_page_groups(self, max_chars: int = 15000) -> list[list[ExtractedPage]]:
+        """
+        Group consecutive pages into chunks of at most max_chars characters
+        (a single oversized page forms its own group).
+        """
+        return self._group_pages([len(page.get_text()) for page in self.pages], max_chars)
+
+    def get_token_page_groups(
+        self,
+        max_tokens: int,
+        count_tokens: Callable[[str], int]
+    ) -> list[list[ExtractedPage]]:
+        """
+        Group consecutive pages into chunks of at most max_tokens tokens, as
+        counted by count_tokens (a single oversized page forms its own group).
+        """
+        return self._group_pages([count_tokens(page.get_text()) for page in self.pages], max_tokens)
+
     def get_text_chunks(self, max_chars: int = 15000) -> list[str]:
         """
         Split document into chunks for LLM processing.
         Tries to split on page boundaries.
         """
-        chunks = []
-        current_chunk = []
-        current_size = 0
-
-        for page in self.pages:
-            page_text = f"\n--- Page {page.page_number} ---\n{page.text}"
+        return [
+            "\n".join(page.get_text() for page in group)
+            for group in self.get_page_groups(max_chars)
+        ]
 
-            # Add tables
-            for table_idx, table in enumerate(page.tables):
-                page_text += f"\n[Table {table_idx + 1}]\n"
-                page_text += format_table_as_text(table)
-
-            page_size = len(page_text)
 
-            if current_size + page_size > max_chars and current_chunk:
-                # Save current chunk and start new one
-                chunks.append("\n".join(current_chunk))
-                current_chunk = [page_text]
-                current_size = page_size
-            else:
-                current_chunk.append(page_text)
-                current_size += page_size
-
-        # Don't forget the last chunk
-        if current_chunk:
-            chunks.append("\n".join(current_chunk))
+@dataclass
+class ExtractionResult:
+    """Outcome of extracting one PDF during a directory run."""
+    filepath: Path
+    document: Optional[ExtractedDocument] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0  # Seconds spent extracting this file
 
-        return chunks
+    @property
+    def ok(self) -> bool:
+        return self.document is not None
 
 
 def format_table_as_text(table: list[list[str]]) -> str:
@@ -115,12 +186,59 @@ def format_table_as_text(table: list[list[str]]) -> str:
     return "\n".join(lines)
 
 
-def extract_pdf(filepath: str | Path) -> ExtractedDocument:
+def _extract_page_range(
+    filepath: Path,
+    start: int,
+    stop: int,
+    force_tables: bool = False,
+    backend: str = DEFAULT_BACKEND
+) -> list[ExtractedPage]:
+    """
+    Extract pages [start, stop) from a PDF (0-based indices).
+
+    Runs inside a worker process, so it re-opens the PDF itself rather than
+    receiving parser objects (which cannot be pickled).
+    """
+    from .extraction_backends import get_backend
+    return get_backend(backend).extract_pages(filepath, start, stop, force_tables)
+
+
+def _page_ranges(total_pages: int, workers: int) -> list[tuple[int, int]]:
+    """
+    Shard page indices into contiguous ranges.
+
+    Creates roughly two shards per worker so a worker that finishes a light
+    range early can pick up another one instead of idling.
+    """
+    num_shards = min(total_pages, workers * 2)
+    shard_size = -(-total_pages // num_shards)  # Ceiling division
+    return [
+        (start, min(start + shard_size, total_pages))
+        for start in range(0, total_pages, shard_size)
+    ]
+
+
+def extract_pdf(
+    filepath: str | Path,
+    workers: Optional[int] = 1,
+    cache: Optional["ExtractionCache"] = None,
+    force_tables: bool = False,
+    backend: str = DEFAULT_BACKEND
+) -> ExtractedDocument:
     """
     Extract text and tables from a PDF file.
 
     Args:
         filepath: Path to the PDF file
+        workers: Number of worker processes for page extraction. 1 extracts
+            serially; None uses all available cores. Small documents are
+            always extracted serially.
+        cache: Optional ExtractionCache; a byte-identical PDF that was
+            extracted before is loaded from it instead of re-parsed
+        force_tables: Run full table extraction on every page instead of
+            skipping pages without ruling lines
+        backend: Extraction engine: "pdfplumber" (default), "pdfium"
+            (fast, text only) or "hybrid" (engine chosen per page)
 
     Returns:
         ExtractedDocument containing all extracted content
@@ -133,29 +251,41 @@ def extract_pdf(filepath: str | Path) -> ExtractedDocument:
     if not filepath.suffix.lower() == ".pdf":
         raise ValueError(f"Not a PDF file: {filepath}")
 
-    pages = []
+    from .extraction_backends import get_backend
+    engine = get_backend(backend)
 
-    with pdfplumber.open(filepath) as pdf:
-        metadata = pdf.metadata or {}
-        total_pages = len(pdf.pages)
+    sha256 = None
+    # The cache holds default extractions; forced full-table runs bypass it
+    if cache is not None and not force_tables:
+        from .extraction_cache import file_sha256
+        sha256 = file_sha256(filepath)
+        cached = cache.get(filepath, sha256=sha256, backend=backend)
+        if cached is not None:
+            return cached
 
-        for page_num, page in enumerate(pdf.pages, start=1):
-            # Extract text
-            text = page.extract_text() or ""
+    if workers is None:
+        workers = os.cpu_count() or 1
 
-            # Extract tables
-            tables = []
-            extracted_tables = page.extract_tables()
-            if extracted_tables:
-                tables = extracted_tables
+    parallel = False
+    if workers > 1:
+        total_pages, metadata = engine.document_info(filepath)
+        parallel = total_pages >= MIN_PAGES_FOR_PARALLEL
 
-            pages.append(ExtractedPage(
-                page_number=page_num,
-                text=text,
-                tables=tables
-            ))
-
-    return ExtractedDocument(
+    if not parallel:
+        pages, total_pages, metadata = engine.extract_all(filepath, force_tables)
+    else:
+        pages = []
+        ranges = _page_ranges(total_pages, workers)
+        with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+            futures = [
+                executor.submit(_extract_page_range, filepath, start, stop, force_tables, backend)
+                for start, stop in ranges
+            ]
+            # Futures are collected in submission order, so pages stay in order
+            for future in futures:
+                pages.extend(future.result())
+
+    document = ExtractedDocument(
         filename=filepath.name,
         filepath=filepath,
         pages=pages,
@@ -163,16 +293,94 @@ def extract_pdf(filepath: str | Path) -> ExtractedDocument:
         metadata=metadata
     )
 
+    if sha256 is not None:
+        cache.put(document, sha256=sha256, backend=backend)
+
+    return document
+
+
+def _extract_pdf_timed(
+    filepath: Path,
+    backend: str = DEFAULT_BACKEND,
+    force_tables: bool = False
+) -> tuple[ExtractedDocument, float]:
+    """Extract a PDF and measure how long it took (runs in a worker process)."""
+    start = time.perf_counter()
+    document = extract_pdf(filepath, force_tables=force_tables, backend=backend)
+    return document, time.perf_counter() - start
+
+
+def iter_extract_pdfs(
+    directory: str | Path,
+    workers: Optional[int] = None,
+    ordered: bool = False,
+    backend: str = DEFAULT_BACKEND,
+    force_tables: bool = False
+) -> Iterator[ExtractionResult]:
+    """
+    Extract all PDFs in a directory concurrently, one file per worker process.
+
+    Results are yielded as soon as each file finishes, so the caller can start
+    on the first documents while larger ones are still extracting. A failure
+    in one file is reported on its ExtractionResult and does not stop the run.
+
+    Args:
+        directory: Path to directory containing PDFs
+        workers: Number of worker processes (None = all available cores)
+        ordered: Yield results in filename order instead of completion order
+        backend: Extraction engine (see extract_pdf)
+        force_tables: Run full table extraction on every page (see extract_pdf)
+
+    Yields:
+        ExtractionResult for every PDF in the directory
+    """
+    directory = Path(directory)
+
+    if not directory.is_dir():
+        raise NotADirectoryError(f"Not a directory: {directory}")
+
+    pdf_files = sorted(directory.glob("*.pdf"))
+    if not pdf_files:
+        return
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=max(1, min(workers, len(pdf_files)))) as executor:
+        future_to_path = {
+            executor.submit(_extract_pdf_timed, pdf_path, backend, force_tables): pdf_path
+            for pdf_path in pdf_files
+        }
+        futures = future_to_path if ordered else as_completed(future_to_path)
+
+        for future in futures:
+            pdf_path = future_to_path[future]
+            try:
+                document, elapsed = future.result()
+            except Exception as e:
+                yield ExtractionResult(filepath=pdf_path, error=str(e))
+            else:
+                yield ExtractionResult(filepath=pdf_path, document=document, elapsed=elapsed)
+
 
-def extract_all_pdfs(directory: str | Path) -> list[ExtractedDocument]:
+def extract_all_pdfs(
+    directory: str | Path,
+    workers: Optional[int] = 1,
+    backend: str = DEFAULT_BACKEND,
+    force_tables: bool = False
+) -> list[ExtractedDocument]:
     """
     Extract all PDFs from a directory.
 
     Args:
         directory: Path to directory containing PDFs
+        workers: Number of worker processes. 1 extracts files one at a time;
+            None uses all available cores.
+        backend: Extraction engine (see extract_pdf)
+        force_tables: Run full table extraction on every page (see extract_pdf)
 
     Returns:
-        List of ExtractedDocument objects
+        List of ExtractedDocument objects, in filename order
     """
     directory = Path(directory)
 
@@ -180,14 +388,30 @@ def extract_all_pdfs(directory: str | Path) -> list[ExtractedDocument]:
         raise NotADirectoryError(f"Not a directory: {directory}")
 
     documents = []
+
+    if workers is None or workers > 1:
+        for result in iter_extract_pdfs(
+            directory, workers=workers, ordered=True, backend=backend, force_tables=force_tables
+        ):
+            print(f"Extracting: {result.filepath.name}")
+            if result.ok:
+                documents.append(result.document)
+                doc = result.document
+                print(f"  ✓ {doc.total_pages} pages extracted "
+                      f"({doc.fast_path_pages} table fast path, {result.elapsed:.1f}s)")
+            else:
+                print(f"  ✗ Error: {result.error}")
+        return documents
+
     pdf_files = sorted(directory.glob("*.pdf"))
 
     for pdf_path in pdf_files:
         print(f"Extracting: {pdf_path.name}")
         try:
-            doc = extract_pdf(pdf_path)
+            doc, elapsed = _extract_pdf_timed(pdf_path, backend, force_tables)
             documents.append(doc)
-            print(f"  ✓ {doc.total_pages} pages extracted")
+            print(f"  ✓ {doc.total_pages} pages extracted "
+                  f"({doc.fast_path_pages} table fast path, {elapsed:.1f}s)")
         except Exception as e:
             print(f"  ✗ Error: {e}")
 
@@ -196,22 +420,52 @@ def extract_all_pdfs(directory: str | Path) -> list[ExtractedDocument]:
 
 # CLI for testing
 if __name__ == "__main__":
-    import sys
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Extract text and tables from policy PDFs")
+    parser.add_argument("path", type=Path, help="PDF file or directory of PDFs")
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=1,
+        help="Worker processes for page extraction (default: 1, 0 = all cores)"
+    )
+    parser.add_argument(
+        "--backend", "-b",
+        default=DEFAULT_BACKEND,
+        choices=BACKEND_NAMES,
+        help=f"Extraction engine (default: {DEFAULT_BACKEND})"
+    )
+    parser.add_argument(
+        "--force-tables",
+        action="store_true",
+        help="Run full table extraction on every page (disable the ruling-line pre-check)"
+    )
+    parser.add_argument(
+        "--file-workers",
+        type=int,
+        default=1,
+        help="Worker processes for extracting a directory, one file each (default: 1, 0 = all cores)"
+    )
 
-    if len(sys.argv) < 2:
-        print("Usage: python pdf_extractor.py <pdf_path_or_directory>")
-        sys.exit(1)
+    args = parser.parse_args()
 
-    path = Path(sys.argv[1])
+    path = args.path
+    workers = args.workers or None
 
     if path.is_file():
-        doc = extract_pdf(path)
+        doc = extract_pdf(
+            path, workers=workers, force_tables=args.force_tables, backend=args.backend
+        )
         print(f"\nExtracted {doc.total_pages} pages from {doc.filename}")
+        print(f"Table fast path: {doc.fast_path_pages}/{doc.total_pages} pages skipped extract_tables()")
         print("\n" + "="*50)
         print(doc.get_full_text()[:2000])
         print("...")
     elif path.is_dir():
-        docs = extract_all_pdfs(path)
+        docs = extract_all_pdfs(
+            path, workers=args.file_workers or None, backend=args.backend, force_tables=args.force_tables
+        )
         print(f"\nExtracted {len(docs)} documents")
     else:
         print(f"Path not found: {path}")
@@ -5,15 +5,36 @@ Uses OpenAI GPT-4o to convert extracted PDF text into structured markdown
 following the policy extraction schema.
 """
 
+import dataclasses
 import json
 import re
+import time
+import yaml
 from pathlib import Path
-from typing import Optional
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+from openai import APIConnectionError, InternalServerError, OpenAI, RateLimitError
 
-from .pdf_extractor import ExtractedDocument, extract_pdf
+from .pdf_extractor import DEFAULT_BACKEND, ExtractedDocument, ExtractedPage, extract_pdf
+from .extraction_cache import ExtractionCache, file_sha256
+from .conversion_manifest import ConversionManifest
+from .rate_limiter import RateLimiter
+from .tokens import count_tokens, input_token_budget
+from .conversion_checkpoint import ConversionCheckpoint
+from .model_router import COMPLEX, ModelCascade, split_runs
+from .rule_converter import RULES_VERSION, convert_document_rules, read_frontmatter
 
 
+# Bump when SYSTEM_PROMPT or the user prompts change meaningfully; recorded
+# in the conversion manifest alongside each converted file.
+PROMPT_VERSION = "1"
+
+SECTION_ID_PATTERN = re.compile(r'<!--\s*section_id:\s*([^\s>]+)\s*-->')
+
+# API errors worth retrying a part for (APITimeoutError is an APIConnectionError);
+# anything else, including a truncated response, fails the part at once
+TRANSIENT_API_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
 # System prompt for the conversion
 SYSTEM_PROMPT = """You are an expert document converter specializing in information security policies.
 
@@ -177,11 +198,167 @@ Remember to:
 5. Extract all metadata for the frontmatter"""
 
 
+FRONTMATTER_PROMPT_TEMPLATE = """Correct the YAML frontmatter of a converted policy document.
+
+The markdown body was produced by a rule-based converter and is kept as is. Its draft
+frontmatter was filled in by pattern matching and may be incomplete or wrong.
+
+**Original Filename:** {filename}
+
+**Draft Frontmatter:**
+{draft}
+
+**Document Control Pages:**
+{content}
+
+**Section Outline:**
+{outline}
+
+---
+
+Output ONLY the complete YAML frontmatter between --- markers, following the schema.
+Keep document_id unchanged. Fill owner, approvers, dates, scope and tags from the
+document control pages; keep the draft's entities and add any that are missing."""
+
+
+class TruncatedResponseError(Exception):
+    """A response stopped at max_tokens; `content` holds the partial output."""
+
+    def __init__(self, max_tokens: int, content: str):
+        super().__init__(f"response hit max_tokens={max_tokens} and was truncated")
+        self.max_tokens = max_tokens
+        self.content = content
+
+
+def _send_request(
+    client: OpenAI,
+    model: str,
+    user_prompt: str,
+    max_tokens: int,
+    stream_to: Optional[Path] = None
+) -> tuple[str, object, Optional[str]]:
+    """Send one chat request; returns (content, usage or None, finish_reason)."""
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt}
+    ]
+
+    if stream_to is None:
+        response = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=0.1  # Low temperature for consistency
+        )
+        choice = response.choices[0]
+        return choice.message.content, response.usage, choice.finish_reason
+
+    stream = client.chat.completions.create(
+        model=model,
+        messages=messages,
+        max_tokens=max_tokens,
+        temperature=0.1,
+        stream=True,
+        stream_options={"include_usage": True}
+    )
+    usage = None
+    finish_reason = None
+    pieces = []
+    with open(stream_to, "w", encoding="utf-8") as f:
+        for chunk in stream:
+            if chunk.usage:
+                usage = chunk.usage
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                pieces.append(delta)
+                f.write(delta)
+                f.flush()
+            finish_reason = chunk.choices[0].finish_reason or finish_reason
+    return "".join(pieces), usage, finish_reason
+
+
+def _create_completion(
+    client: OpenAI,
+    model: str,
+    user_prompt: str,
+    max_tokens: int,
+    rate_limiter: Optional[RateLimiter] = None,
+    stream_to: Optional[Path] = None,
+    on_usage: Optional[Callable] = None
+) -> str:
+    """
+    Send one conversion request, waiting on the rate limiter if given.
+
+    With `stream_to`, the response is streamed and each delta is appended to
+    that file as it arrives, so partial output is on disk immediately.
+    `on_usage` is called with the response's token usage, when reported.
+
+    Raises:
+        TruncatedResponseError: If the response stopped at max_tokens
+    """
+    estimated = count_tokens(SYSTEM_PROMPT, model) + count_tokens(user_prompt, model) + max_tokens
+    if rate_limiter:
+        rate_limiter.acquire(estimated)
+    try:
+        content, usage, finish_reason = _send_request(client, model, user_prompt, max_tokens, stream_to)
+    finally:
+        if rate_limiter:
+            rate_limiter.release()
+
+    if rate_limiter and usage:
+        rate_limiter.record_usage(estimated, usage.total_tokens)
+    if on_usage and usage:
+        on_usage(usage)
+
+    if finish_reason == "length":
+        raise TruncatedResponseError(max_tokens, content)
+
+    return content
+
+
+def _run_part(
+    client: OpenAI,
+    model: str,
+    prompt: str,
+    max_tokens: int,
+    rate_limiter: Optional[RateLimiter],
+    checkpoint: Optional[ConversionCheckpoint],
+    part: int,
+    on_usage: Optional[Callable] = None
+) -> str:
+    """Run one request, reusing or streaming into its checkpoint if given."""
+    if checkpoint is None:
+        return _create_completion(client, model, prompt, max_tokens, rate_limiter, on_usage=on_usage)
+
+    key = ConversionCheckpoint.part_key(part, model, SYSTEM_PROMPT, prompt)
+    completed = checkpoint.load(key)
+    if completed is not None:
+        print(f"     Part {part}: resumed from checkpoint")
+        return completed
+
+    try:
+        content = _create_completion(
+            client, model, prompt, max_tokens, rate_limiter,
+            stream_to=checkpoint.partial_path(key),
+            on_usage=on_usage
+        )
+    except TruncatedResponseError:
+        # Never checkpoint a truncated part; the next attempt starts over
+        checkpoint.discard(key)
+        raise
+    checkpoint.commit(key)
+    return content
+
+
 def convert_to_markdown(
     document: ExtractedDocument,
     client: OpenAI,
     model: str = "gpt-4o",
-    max_tokens: int = 16000
+    max_tokens: int = 16000,
+    rate_limiter: Optional[RateLimiter] = None,
+    checkpoint: Optional[ConversionCheckpoint] = None
 ) -> str:
     """
     Convert an extracted PDF document to structured markdown using OpenAI.
@@ -191,142 +368,427 @@ def convert_to_markdown(
         client: OpenAI client instance
         model: Model to use for conversion
         max_tokens: Max tokens for response
+        rate_limiter: Optional RPM/TPM limiter shared across concurrent conversions
+        checkpoint: Optional checkpoint; responses are streamed into it and
+            completed parts are reused on a rerun
 
     Returns:
         Structured markdown string
     """
-    # Get full text content
-    content = document.get_full_text(include_page_markers=True)
-
-    # Check if content is too large - if so, process in chunks
-    if len(content) > 100000:  # Roughly 25k tokens
-        return convert_large_document(document, client, model, max_tokens)
+    # If the predicted output would not fit in max_tokens, process in parts
+    groups = plan_page_groups(document, model, max_tokens)
+    if len(groups) > 1:
+        return convert_large_document(
+            document, client, model, max_tokens, rate_limiter, checkpoint=checkpoint, groups=groups
+        )
 
     user_prompt = USER_PROMPT_TEMPLATE.format(
         filename=document.filename,
-        content=content
+        content=document.get_full_text(include_page_markers=True)
     )
 
-    response = client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": user_prompt}
-        ],
-        max_tokens=max_tokens,
-        temperature=0.1  # Low temperature for consistency
-    )
+    return _run_part(client, model, user_prompt, max_tokens, rate_limiter, checkpoint, part=1)
+
+
+def _build_part_prompt(document: ExtractedDocument, chunk: str, part: int, total: int) -> str:
+    """Build the user prompt for one part of a large document (1-based part)."""
+    if part == 1:
+        # First chunk: Extract frontmatter + convert content
+        return f"""Convert this PDF content to structured markdown.
+This is PART 1 of {total} parts. Extract the YAML frontmatter from the document metadata visible here.
+
+**Filename:** {document.filename}
+
+**Content:**
+{chunk}
+
+Output the frontmatter AND the converted content for this section."""
+
+    # Subsequent chunks: Just convert content
+    return f"""Continue converting this PDF content to structured markdown.
+This is PART {part} of {total}. Do NOT include frontmatter - just continue the content.
+
+**Content:**
+{chunk}
+
+Continue the markdown content, maintaining section IDs and entity annotations."""
+
+
+def _convert_part(
+    client: OpenAI,
+    model: str,
+    prompt: str,
+    max_tokens: int,
+    rate_limiter: Optional[RateLimiter],
+    checkpoint: Optional[ConversionCheckpoint],
+    part: int,
+    retries: int,
+    on_usage: Optional[Callable] = None
+) -> str:
+    """
+    Convert one part, retrying it on its own after transient API errors
+    (rate limits, timeouts, connection and server errors).
+    """
+    for attempt in range(retries + 1):
+        try:
+            return _run_part(client, model, prompt, max_tokens, rate_limiter, checkpoint, part, on_usage)
+        except TRANSIENT_API_ERRORS as e:
+            if attempt == retries:
+                raise
+            delay = 2 ** attempt
+            print(f"     Part {part} failed ({e}); retrying in {delay}s...")
+            time.sleep(delay)
+
+
+def _strip_frontmatter(part: str) -> str:
+    """Remove accidental frontmatter from a continuation part."""
+    if part.startswith("---"):
+        # Find the end of frontmatter and take content after
+        end_match = re.search(r'\n---\n', part[3:])
+        if end_match:
+            part = part[end_match.end() + 3:]
+    return part
+
+
+def _combine_parts(result_parts: list[str]) -> str:
+    """Join converted parts in order, dropping frontmatter from parts 2..N."""
+    combined = result_parts[0]
+    for part in result_parts[1:]:
+        combined += "\n\n" + _strip_frontmatter(part)
+
+    return combined
 
-    return response.choices[0].message.content
+
+def _convert_parts(
+    client: OpenAI,
+    model: str,
+    prompts: dict[int, str],
+    max_tokens: int,
+    rate_limiter: Optional[RateLimiter],
+    checkpoint: Optional[ConversionCheckpoint],
+    max_parallel_parts: int,
+    part_retries: int,
+    cascade: Optional[ModelCascade] = None,
+    routes: Optional[dict[int, tuple[str, int]]] = None
+) -> dict[int, str]:
+    """
+    Convert parts concurrently; `prompts` maps 1-based part number → prompt.
+
+    With a cascade, `routes` maps part number → (tier, page count); each part
+    is sent to its tier's model and its time and tokens are accounted there.
+    """
+    def convert(part: int, prompt: str) -> str:
+        if cascade is None:
+            return _convert_part(
+                client, model, prompt, max_tokens, rate_limiter, checkpoint, part, part_retries
+            )
+        tier, pages = routes[part]
+        start_time = time.time()
+        output = _convert_part(
+            client, cascade.model_for(tier), prompt, max_tokens, rate_limiter, checkpoint,
+            part, part_retries, on_usage=lambda usage: cascade.record_request(tier, usage)
+        )
+        cascade.record_part(tier, pages, time.time() - start_time)
+        return output
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_parallel_parts, len(prompts)))) as executor:
+        futures = {
+            part: executor.submit(convert, part, prompt)
+            for part, prompt in prompts.items()
+        }
+        return {part: future.result() for part, future in futures.items()}
 
 
 def convert_large_document(
     document: ExtractedDocument,
     client: OpenAI,
     model: str = "gpt-4o",
-    max_tokens: int = 16000
+    max_tokens: int = 16000,
+    rate_limiter: Optional[RateLimiter] = None,
+    max_parallel_parts: int = 4,
+    part_retries: int = 2,
+    checkpoint: Optional[ConversionCheckpoint] = None,
+    groups: Optional[list[list[ExtractedPage]]] = None
 ) -> str:
     """
     Convert a large document by processing in chunks and combining.
-    First pass extracts frontmatter, subsequent passes convert content.
-    """
-    chunks = document.get_text_chunks(max_chars=50000)
+    Part 1 extracts frontmatter, later parts convert content only.
 
-    # First chunk: Extract frontmatter + convert content
-    first_chunk_prompt = f"""Convert this PDF content to structured markdown.
-This is PART 1 of {len(chunks)} parts. Extract the YAML frontmatter from the document metadata visible here.
+    Parts do not depend on each other, so up to `max_parallel_parts` are
+    converted at once and reassembled in order; a part that hits a transient
+    API error is retried on its own up to `part_retries` times. With a checkpoint, parts finished
+    by an earlier (interrupted) run are reused instead of re-requested.
+    `groups` are the parts' pages if already planned (see plan_page_groups).
+    """
+    if groups is None:
+        groups = plan_page_groups(document, model, max_tokens)
+    chunks = ["\n".join(page.get_text() for page in group) for group in groups]
+    prompts = {
+        part: _build_part_prompt(document, chunk, part, len(chunks))
+        for part, chunk in enumerate(chunks, start=1)
+    }
 
-**Filename:** {document.filename}
+    outputs = _convert_parts(
+        client, model, prompts, max_tokens, rate_limiter,
+        checkpoint, max_parallel_parts, part_retries
+    )
 
-**Content:**
-{chunks[0]}
+    return _combine_parts([outputs[part] for part in sorted(outputs)])
 
-Output the frontmatter AND the converted content for this section."""
 
-    response = client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": first_chunk_prompt}
-        ],
-        max_tokens=max_tokens,
-        temperature=0.1
-    )
+def plan_page_groups(
+    document: ExtractedDocument,
+    model: str = "gpt-4o",
+    max_tokens: int = 16000,
+    previous_parts: Optional[list[dict]] = None,
+    page_tiers: Optional[dict[int, str]] = None
+) -> list[list[ExtractedPage]]:
+    """
+    Decide which pages go into which conversion request.
 
-    result_parts = [response.choices[0].message.content]
+    Pages are counted in tokens and packed so each request's predicted output
+    (see tokens.input_token_budget) fills but does not exceed max_tokens.
+    A document that fits in one request is returned as a single group.
+    With `page_tiers` (see model_router.classify_pages), groups never mix
+    tiers, so each can be sent to its own model.
 
-    # Subsequent chunks: Just convert content
-    for i, chunk in enumerate(chunks[1:], start=2):
-        chunk_prompt = f"""Continue converting this PDF content to structured markdown.
-This is PART {i} of {len(chunks)}. Do NOT include frontmatter - just continue the content.
+    A revision with the same page count keeps the previous part boundaries,
+    so an edit on one page does not shift every later part.
+    """
+    if previous_parts and previous_parts[-1]["pages"][1] == len(document.pages):
+        by_number = {page.page_number: page for page in document.pages}
+        return [
+            [by_number[number] for number in range(first, last + 1)]
+            for first, last in (part["pages"] for part in previous_parts)
+        ]
+
+    budget = input_token_budget(max_tokens)
+    if page_tiers is None:
+        return document.get_token_page_groups(budget, lambda text: count_tokens(text, model))
+
+    groups = []
+    for run in split_runs(document, page_tiers):
+        run_document = dataclasses.replace(document, pages=run, total_pages=len(run))
+        groups.extend(run_document.get_token_page_groups(budget, lambda text: count_tokens(text, model)))
+    return groups
+
+
+def _part_record(pages: list[ExtractedPage], output: str, model: str) -> dict:
+    """Describe one converted part for the conversion manifest."""
+    return {
+        "pages": [pages[0].page_number, pages[-1].page_number],
+        "page_hashes": [page.content_hash() for page in pages],
+        "section_ids": SECTION_ID_PATTERN.findall(output),
+        "model": model
+    }
 
-**Content:**
-{chunk}
 
-Continue the markdown content, maintaining section IDs and entity annotations."""
+def _part_offsets(markdown: str, parts: list[dict]) -> Optional[list[int]]:
+    """
+    Locate where each previously converted part starts in the saved markdown.
 
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": chunk_prompt}
-            ],
-            max_tokens=max_tokens,
-            temperature=0.1
+    Each part after the first is anchored at the heading that precedes its
+    first section_id comment. Returns None if any part cannot be anchored.
+    """
+    offsets = [0]
+    for part in parts[1:]:
+        if not part["section_ids"]:
+            return None
+        anchor = re.search(
+            r'<!--\s*section_id:\s*' + re.escape(part["section_ids"][0]) + r'\s*-->',
+            markdown[offsets[-1]:]
         )
+        if not anchor:
+            return None
+        anchor_pos = offsets[-1] + anchor.start()
+        heading = markdown.rfind("\n#", offsets[-1], anchor_pos)
+        if heading == -1:
+            return None
+        offsets.append(heading + 1)
+    offsets.append(len(markdown))
+    return offsets
+
+
+def convert_to_markdown_incremental(
+    document: ExtractedDocument,
+    client: OpenAI,
+    model: str = "gpt-4o",
+    max_tokens: int = 16000,
+    rate_limiter: Optional[RateLimiter] = None,
+    checkpoint: Optional[ConversionCheckpoint] = None,
+    previous_parts: Optional[list[dict]] = None,
+    existing_markdown: Optional[str] = None,
+    max_parallel_parts: int = 4,
+    part_retries: int = 2,
+    cascade: Optional[ModelCascade] = None
+) -> tuple[str, list[dict]]:
+    """
+    Convert a document, re-converting only page groups that changed.
 
-        result_parts.append(response.choices[0].message.content)
+    Given the part records from the previous conversion (as stored in the
+    conversion manifest) and the markdown it produced, pages are hashed and
+    compared group by group. Unchanged groups keep their existing markdown;
+    changed groups are re-converted and spliced in at the section IDs where
+    their old output began. Without usable previous state, every group is
+    converted, which is equivalent to convert_to_markdown.
 
-    # Combine parts (remove any duplicate frontmatter from later parts)
-    combined = result_parts[0]
-    for part in result_parts[1:]:
-        # Remove any accidental frontmatter
-        if part.startswith("---"):
-            # Find the end of frontmatter and take content after
-            end_match = re.search(r'\n---\n', part[3:])
-            if end_match:
-                part = part[end_match.end() + 3:]
-        combined += "\n\n" + part
+    With a model cascade, plain prose pages are grouped apart from complex
+    ones and converted with the cascade's small model.
 
-    return combined
+    Returns:
+        Tuple of (markdown, part_records) to store for the next revision
 
+    Raises:
+        ValueError: If the document has no pages
+    """
+    if not document.pages:
+        raise ValueError(f"{document.filename} has no pages to convert")
+
+    usable = bool(previous_parts and existing_markdown)
+    page_tiers = cascade.classify(document) if cascade else None
+    groups = plan_page_groups(document, model, max_tokens, previous_parts if usable else None, page_tiers)
+    tiers = [cascade.route(group, page_tiers) if cascade else COMPLEX for group in groups]
+
+    offsets = None
+    if usable and len(groups) == len(previous_parts):
+        offsets = _part_offsets(existing_markdown, previous_parts)
+
+    if offsets is None:
+        changed = list(range(1, len(groups) + 1))
+    else:
+        changed = [
+            part for part, group in enumerate(groups, start=1)
+            if [page.content_hash() for page in group] != previous_parts[part - 1]["page_hashes"]
+        ]
+
+    def build_prompt(part: int) -> str:
+        if len(groups) == 1:
+            return USER_PROMPT_TEMPLATE.format(
+                filename=document.filename,
+                content=document.get_full_text(include_page_markers=True)
+            )
+        chunk = "\n".join(page.get_text() for page in groups[part - 1])
+        return _build_part_prompt(document, chunk, part, len(groups))
+
+    prompts = {part: build_prompt(part) for part in changed}
+
+    if offsets is not None:
+        print(f"     Re-converting {len(changed)} of {len(groups)} part(s)")
+
+    outputs = _convert_parts(
+        client, model, prompts, max_tokens, rate_limiter,
+        checkpoint, max_parallel_parts, part_retries, cascade,
+        routes={part: (tiers[part - 1], len(groups[part - 1])) for part in changed}
+    ) if changed else {}
+
+    if offsets is None:
+        markdown = _combine_parts([outputs[part] for part in sorted(outputs)])
+    else:
+        pieces = []
+        for part in range(1, len(groups) + 1):
+            if part in outputs:
+                piece = outputs[part] if part == 1 else _strip_frontmatter(outputs[part])
+            else:
+                piece = existing_markdown[offsets[part - 1]:offsets[part]]
+            pieces.append(piece.strip("\n"))
+        markdown = "\n\n".join(pieces) + "\n"
 
-def generate_document_id(title: str) -> str:
-    """Generate a document ID from the title."""
-    # Common mappings
-    mappings = {
-        "cyber security": "CSP",
-        "cybersecurity": "CSP",
-        "information security": "ISP",
-        "incident": "IMP",
-        "access control": "ACP",
-        "network security": "NSP",
-        "data classification": "DCP",
-        "asset classification": "ACP",
-        "business continuity": "BCP",
-        "disaster recovery": "DRP",
-        "sdlc": "SDLC",
-        "supplier": "SPP",
-        "vendor": "VMP",
-        "mobile device": "MDP",
-        "hardening": "HSP",
-        "crisis": "CMP",
-        "risk management": "RMP",
-        "data disposal": "DDP",
-        "retention": "DRP",
-    }
+    records = [
+        _part_record(group, outputs[part], cascade.model_for(tiers[part - 1]) if cascade else model)
+        if part in outputs else previous_parts[part - 1]
+        for part, group in enumerate(groups, start=1)
+    ]
 
-    title_lower = title.lower()
-    for key, doc_id in mappings.items():
-        if key in title_lower:
-            return doc_id
+    return markdown, records
 
-    # Fallback: Use first letters of significant words
-    words = re.findall(r'[A-Z][a-z]+|[A-Z]+', title)
-    if words:
-        return "".join(w[0] for w in words[:4]).upper()
 
-    return "DOC"
+def converter_signature(converter: str, model: str) -> tuple[str, str]:
+    """
+    The (model, prompt_version) pair recorded in the conversion manifest.
+
+    Rule-based output is recorded under its own name and RULES_VERSION, so
+    it is never spliced into (or with) LLM output during incremental runs.
+    """
+    if converter == "rules":
+        return "rules", RULES_VERSION
+    if converter == "draft":
+        return f"rules+{model}", f"{RULES_VERSION}+{PROMPT_VERSION}"
+    return model, PROMPT_VERSION
+
+
+def touch_up_frontmatter(
+    markdown: str,
+    document: ExtractedDocument,
+    client: OpenAI,
+    model: str = "gpt-4o",
+    rate_limiter: Optional[RateLimiter] = None,
+    control_pages: int = 3
+) -> str:
+    """
+    Have the LLM rewrite only the frontmatter of a rule-based draft.
+
+    The request carries the first `control_pages` pages (title page and
+    version control) plus the section outline, and the response is a few
+    hundred tokens instead of the whole document. If the response has no
+    usable frontmatter, the draft is returned unchanged.
+    """
+    match = re.match(r'^---\n(.*?)\n---\n', markdown, re.DOTALL)
+    if not match:
+        return markdown
+    draft, body = match.group(1), markdown[match.end():]
+
+    prompt = FRONTMATTER_PROMPT_TEMPLATE.format(
+        filename=document.filename,
+        draft=draft,
+        content="\n".join(page.get_text() for page in document.pages[:control_pages]),
+        outline="\n".join(line for line in body.split("\n") if line.startswith("#"))
+    )
+    try:
+        response = _create_completion(client, model, prompt, 2000, rate_limiter)
+    except TruncatedResponseError as e:
+        response = e.content  # Unusable unless the closing marker made it
+
+    # Models sometimes fence the YAML; take whatever sits between the markers
+    corrected = re.search(r'^---\s*\n(.*?)\n---\s*$', response, re.DOTALL | re.MULTILINE)
+    try:
+        frontmatter = yaml.safe_load(corrected.group(1)) if corrected else None
+    except yaml.YAMLError:
+        frontmatter = None
+    if not isinstance(frontmatter, dict):
+        print(f"  ⚠ No usable frontmatter in response for {document.filename}; keeping draft")
+        return markdown
+
+    frontmatter["document_id"] = yaml.safe_load(draft)["document_id"]
+    yaml_text = yaml.safe_dump(frontmatter, sort_keys=False, allow_unicode=True, width=1000)
+    return f"---\n{yaml_text}---\n{body}"
+
+
+def convert_with_rules(
+    document: ExtractedDocument,
+    existing_path: Optional[Path] = None,
+    client: Optional[OpenAI] = None,
+    model: str = "gpt-4o",
+    rate_limiter: Optional[RateLimiter] = None
+) -> str:
+    """
+    Convert a document with the rule-based converter.
+
+    Args:
+        document: ExtractedDocument from pdf_extractor
+        existing_path: Markdown from an earlier conversion of the same PDF;
+            its document_id and title are kept so section IDs stay stable
+        client: OpenAI client; if given, the frontmatter is touched up by the LLM
+        model: Model used for the touch-up
+        rate_limiter: Optional RPM/TPM limiter for the touch-up request
+
+    Returns:
+        Structured markdown string
+    """
+    known = read_frontmatter(existing_path) if existing_path else {}
+    markdown = convert_document_rules(document, known.get("document_id"), known.get("title"))
+    if client is not None:
+        markdown = touch_up_frontmatter(markdown, document, client, model, rate_limiter)
+    return markdown
 
 
 def save_markdown(content: str, output_path: Path, document_id: str = None) -> Path:
@@ -372,8 +834,12 @@ def save_markdown(content: str, output_path: Path, document_id: str = None) -> P
 def convert_pdf_to_markdown(
     pdf_path: str | Path,
     output_dir: str | Path,
-    client: OpenAI,
-    model: str = "gpt-4o"
+    client: Optional[OpenAI],
+    model: str = "gpt-4o",
+    cache: Optional[ExtractionCache] = None,
+    backend: str = DEFAULT_BACKEND,
+    converter: str = "llm",
+    small_model: Optional[str] = None
 ) -> Path:
     """
     Full pipeline: Extract PDF and convert to structured markdown.
@@ -381,8 +847,13 @@ def convert_pdf_to_markdown(
     Args:
         pdf_path: Path to PDF file
         output_dir: Directory to save markdown output
-        client: OpenAI client
+        client: OpenAI client (unused, may be None, with converter="rules")
         model: Model to use
+        cache: Optional extraction cache to skip re-parsing unchanged PDFs
+        backend: PDF extraction engine ("pdfplumber", "pdfium" or "hybrid")
+        converter: "llm" (full LLM conversion), "rules" (rule-based, no API
+            calls) or "draft" (rule-based body, LLM-corrected frontmatter)
+        small_model: Model for plain prose pages (None = `model` for all pages)
 
     Returns:
         Path to saved markdown file
@@ -392,15 +863,62 @@ def convert_pdf_to_markdown(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     print(f"Extracting: {pdf_path.name}")
-    document = extract_pdf(pdf_path)
-    print(f"  → {document.total_pages} pages extracted")
-
-    print(f"Converting with {model}...")
-    markdown = convert_to_markdown(document, client, model)
+    pdf_hash = file_sha256(pdf_path)
+    if cache:
+        document, from_cache = cache.get_or_extract(pdf_path, sha256=pdf_hash, backend=backend)
+    else:
+        document, from_cache = extract_pdf(pdf_path, backend=backend), False
+    print(f"  → {document.total_pages} pages extracted{' (from cache)' if from_cache else ''}")
+
+    manifest = ConversionManifest.load(output_dir)
+    signature = converter_signature(converter, model)
+
+    if converter != "llm":
+        entry = manifest.entries.get(pdf_path.name)
+        existing_path = output_dir / entry["markdown"] if entry else None
+        if existing_path and not existing_path.exists():
+            existing_path = None
+
+        print(f"Converting with rules{f' (frontmatter by {model})' if converter == 'draft' else ''}...")
+        markdown = convert_with_rules(
+            document, existing_path, client if converter == "draft" else None, model
+        )
+        output_path = save_markdown(markdown, existing_path or output_dir)
+        print(f"  → Saved to: {output_path.name}")
+
+        manifest.record(pdf_path.name, pdf_hash, output_path.name, *signature)
+        manifest.save()
+        return output_path
+
+    checkpoint = ConversionCheckpoint.for_pdf(pdf_hash)
+    if checkpoint.completed_parts():
+        print(f"Resuming: {checkpoint.completed_parts()} part(s) already converted")
+
+    # Re-convert only changed pages if an earlier revision was converted the same way
+    cascade = ModelCascade(model, small_model)
+    previous = manifest.previous(pdf_path.name, cascade.signature, PROMPT_VERSION)
+    existing_path = output_dir / previous["markdown"] if previous else None
+
+    print(f"Converting with {cascade.signature}...")
+    markdown, parts = convert_to_markdown_incremental(
+        document, client, model,
+        checkpoint=checkpoint,
+        previous_parts=previous["parts"] if previous else None,
+        existing_markdown=existing_path.read_text(encoding="utf-8") if previous else None,
+        cascade=cascade
+    )
     print(f"  → Conversion complete")
+    for tier, stats in cascade.summary().items():
+        print(f"     {tier}: {stats['model']}, {stats['parts']} part(s), {stats['seconds']}s, "
+              f"{stats['prompt_tokens'] + stats['completion_tokens']} tokens")
 
-    output_path = save_markdown(markdown, output_dir)
+    output_path = save_markdown(markdown, existing_path or output_dir)
     print(f"  → Saved to: {output_path.name}")
+    checkpoint.clear()
+
+    # Record in the manifest so batch runs skip this PDF until it changes
+    manifest.record(pdf_path.name, pdf_hash, output_path.name, cascade.signature, PROMPT_VERSION, parts)
+    manifest.save()
 
     return output_path
 
@@ -0,0 +1,101 @@
+"""
+API Rate Limiter
+
+Thread-safe token buckets for OpenAI requests-per-minute (RPM) and
+tokens-per-minute (TPM) quotas, plus an optional cap on requests in flight.
+Conversion workers call acquire() before each request and release() after
+it, so concurrent conversion stays within the account's limits instead of
+relying on fixed sleeps between files.
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """A bucket holding up to `capacity` units, refilled continuously per minute."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.available = float(per_minute)
+        self.refill_rate = per_minute / 60.0  # Units per second
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated
+        self.available = min(self.capacity, self.available + elapsed * self.refill_rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` units are available (0 if available now)."""
+        self._refill(now)
+        # Requests larger than the whole bucket are allowed once it is full
+        amount = min(amount, self.capacity)
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) / self.refill_rate
+
+    def take(self, amount: float):
+        self.available -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    """
+    Combined RPM/TPM limiter shared by all conversion workers.
+
+    Args:
+        requests_per_minute: Max requests per minute (None = unlimited)
+        tokens_per_minute: Max prompt + completion tokens per minute (None = unlimited)
+        max_in_flight: Max requests running at once across all workers (None = unlimited)
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_in_flight: Optional[int] = None
+    ):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._in_flight = threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 0):
+        """
+        Block until one request using `tokens` tokens fits within both quotas
+        (and a request slot is free); pair with release().
+        """
+        if self._in_flight:
+            self._in_flight.acquire()
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = 0.0
+                if self.requests:
+                    wait = max(wait, self.requests.wait_time(1, now))
+                if self.tokens:
+                    wait = max(wait, self.tokens.wait_time(tokens, now))
+
+                if wait == 0.0:
+                    if self.requests:
+                        self.requests.take(1)
+                    if self.tokens:
+                        self.tokens.take(tokens)
+                    return
+
+            time.sleep(wait)
+
+    def release(self):
+        """Free the request slot taken by acquire() once the request has finished."""
+        if self._in_flight:
+            self._in_flight.release()
+
+    def record_usage(self, estimated: int, actual: int):
+        """Correct the token bucket once the real usage of a request is known."""
+        if not self.tokens:
+            return
+        with self._lock:
+            # Over-estimates are refunded, but never beyond a full bucket
+            self.tokens.available = min(self.tokens.capacity, self.tokens.available - (actual - estimated))
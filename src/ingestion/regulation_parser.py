@@ -0,0 +1,487 @@
+"""
+Regulation Ingestion
+
+Splits the SEBI CSCRF PDF (data/regulations/csrcf_document.pdf) into
+individually addressable requirement records for bulk compliance mapping:
+
+- Standards (Part I), e.g. GV.OC.S1, using the framework's own codes
+- Guidelines (Part II), e.g. GV.PO.G1.9 = category GV.PO, guideline group 1
+  (a block of guidelines implementing the same standards), item 9
+
+IDs are derived only from the document's structure, so re-ingesting the same
+framework version always yields the same IDs. Records are saved as JSONL.
+"""
+
+import re
+import json
+import os
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Optional
+
+from .pdf_extractor import ExtractedDocument, extract_pdf
+
+
+FRAMEWORK = "CSCRF"
+
+# Page furniture repeated on every page
+HEADER_PATTERN = re.compile(r'^(CSCRF|Page \d+ of \d+|Version [\d.]+)$')
+VERSION_PATTERN = re.compile(r'^Version ([\d.]+)$', re.MULTILINE)
+
+# Part I structure
+PART_I_START = "Part I: CSCRF Objectives and Standards"
+GOAL_PATTERN = re.compile(
+    r'^\d+\.\s*Cyber Resilience Goal:\s*(.+?)\s*(?:\|\s*Cybersecurity function:\s*(.*))?$'
+)
+CATEGORY_PATTERN = re.compile(r'^\d+\.\d+\.\s*([A-Z]{2}\.[A-Z]{2}):\s*(.+)$')
+OBJECTIVE_PATTERN = re.compile(r'^[iv]+\.\s*([A-Z]{2}\.[A-Z]{2}):\s*Objective:?$')
+STANDARD_PATTERN = re.compile(r'^[iv]+\.\s*([A-Z]{2}\.[A-Z]{2}):\s*[Ss]tandard:?$')
+BOX_PATTERN = re.compile(r'^Box Item \d+')
+FIGURE_PATTERN = re.compile(r'^Figure \d+:')
+PART_I_END_PATTERN = re.compile(r'^\d+\.\s*Exemption Table')
+
+# Numbered list items ("1. text", "10.text")
+ITEM_PATTERN = re.compile(r'^(\d+)\.\s*(.*)$')
+# Sub-items that keep their own line ("a. text", "iv. text")
+SUB_ITEM_PATTERN = re.compile(r'^([a-z]|[ivx]+)\.\s')
+
+# Part II structure (guideline tables)
+TABLE_GOAL_PATTERN = re.compile(r'^Cyber Resilience goal:\s*(.+)$')
+TABLE_FUNCTION_PATTERN = re.compile(r'^Cybersecurity control:\s*(.+)$')
+TABLE_CATEGORY_PATTERN = re.compile(r'^([A-Z]{2}\.[A-Z]{2}): Guidelines$')
+STANDARD_CODE_PATTERN = re.compile(r'[A-Z]{2}\.[A-Z]{2}\.S\d+')
+
+
+@dataclass
+class RegulationRequirement:
+    """A single addressable requirement (standard or guideline)."""
+    requirement_id: str
+    kind: str  # "standard" or "guideline"
+    clause_path: list[str]
+    text: str
+    goal: str
+    function: str
+    category: str
+    category_title: str
+    objective: str = ""
+    standards: list[str] = field(default_factory=list)
+    applicability: str = ""
+    mandatory: bool = False
+    page: int = 0
+    framework: str = FRAMEWORK
+    version: str = ""
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _join_lines(lines: list[str]) -> str:
+    """
+    Re-flow wrapped PDF lines into text.
+
+    Wrapped lines are joined with spaces (or directly after a trailing
+    hyphen); lettered/roman sub-items start a new line.
+    """
+    text = ""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if not text:
+            text = line
+        elif SUB_ITEM_PATTERN.match(line):
+            text += "\n" + line
+        elif text.endswith("-"):
+            text += line
+        else:
+            text += " " + line
+    return text
+
+
+def _content_lines(page_text: str) -> list[str]:
+    """Page text lines without headers/footers."""
+    return [
+        line.strip() for line in page_text.split("\n")
+        if line.strip() and not HEADER_PATTERN.match(line.strip())
+    ]
+
+
+def detect_version(document: ExtractedDocument) -> str:
+    """Framework version from the page footer ("Version 1.0")."""
+    for page in document.pages[:5]:
+        match = VERSION_PATTERN.search(page.text)
+        if match:
+            return match.group(1)
+    return ""
+
+
+def parse_standards(document: ExtractedDocument, version: str = "") -> list[RegulationRequirement]:
+    """
+    Parse Part I (objectives and standards) into standard records.
+
+    Args:
+        document: Extracted CSCRF document
+        version: Framework version stored on each record
+
+    Returns:
+        Standards in document order, with IDs like GV.OC.S1
+    """
+    records = []
+    in_part = False
+    goal = function = ""
+    category = category_title = ""
+    objective_lines: list[str] = []
+    mode = None  # "objective", "standard" or "skip" (box items)
+    pending_function = False
+    current: Optional[dict] = None
+
+    def flush():
+        nonlocal current
+        if current is None:
+            return
+        number = current["number"]
+        records.append(RegulationRequirement(
+            requirement_id=f"{category}.S{number}",
+            kind="standard",
+            clause_path=["Part I", goal, function, f"{category}: {category_title}", f"Standard {number}"],
+            text=_join_lines(current["lines"]),
+            goal=goal,
+            function=function,
+            category=category,
+            category_title=category_title,
+            objective=_join_lines(objective_lines),
+            standards=[f"{category}.S{number}"],
+            page=current["page"],
+            version=version
+        ))
+        current = None
+
+    for page in document.pages:
+        for line in _content_lines(page.text):
+            if not in_part:
+                in_part = line == PART_I_START
+                continue
+
+            if PART_I_END_PATTERN.match(line):
+                flush()
+                return records
+
+            if pending_function:
+                function = line
+                pending_function = False
+                continue
+
+            match = GOAL_PATTERN.match(line)
+            if match:
+                flush()
+                goal = match.group(1).strip()
+                function = (match.group(2) or "").strip() or goal
+                pending_function = match.group(2) is not None and not match.group(2).strip()
+                mode = None
+                continue
+
+            match = CATEGORY_PATTERN.match(line)
+            if match:
+                flush()
+                category, category_title = match.group(1), match.group(2).strip()
+                objective_lines = []
+                mode = None
+                continue
+
+            if OBJECTIVE_PATTERN.match(line):
+                mode = "objective"
+                continue
+
+            if STANDARD_PATTERN.match(line):
+                mode = "standard"
+                continue
+
+            if BOX_PATTERN.match(line):
+                flush()
+                mode = "skip"
+                continue
+
+            if FIGURE_PATTERN.match(line) or mode in (None, "skip"):
+                continue
+
+            if mode == "objective":
+                objective_lines.append(line)
+                continue
+
+            # Standard items are numbered 1, 2, 3... within a category
+            match = ITEM_PATTERN.match(line)
+            expected = current["number"] + 1 if current else 1
+            if match and int(match.group(1)) == expected:
+                flush()
+                current = {"number": expected, "lines": [match.group(2)], "page": page.page_number}
+            elif current is not None:
+                current["lines"].append(line)
+
+    flush()
+    return records
+
+
+def _split_items(text: str, next_number: Optional[int]) -> list[tuple[Optional[int], list[str]]]:
+    """
+    Split a guideline cell into numbered items.
+
+    Returns (number, lines) pairs; the first pair has number None if the cell
+    starts by continuing the previous item. A line only starts a new item if
+    it carries the next expected number (or 1, which restarts numbering).
+    """
+    items: list[tuple[Optional[int], list[str]]] = []
+    number, lines = None, []
+    for line in text.split("\n"):
+        match = ITEM_PATTERN.match(line.strip())
+        if match:
+            value = int(match.group(1))
+            expected = number + 1 if number is not None else next_number
+            if value == 1 or value == expected or (not items and not lines and expected is None):
+                if lines or number is not None:
+                    items.append((number, lines))
+                number, lines = value, [match.group(2)]
+                continue
+        lines.append(line)
+    if lines or number is not None:
+        items.append((number, lines))
+    return items
+
+
+def _table_columns(header: list) -> Optional[tuple[int, int, int]]:
+    """Column indexes of (standards, guidelines, applicability) in a guideline table."""
+    cells = [(cell or "").strip() for cell in header]
+    if "Standards" not in cells or "CSCRF guidelines" not in cells:
+        return None
+    return cells.index("Standards"), cells.index("CSCRF guidelines"), cells.index("Applicability")
+
+
+def parse_guidelines(
+    document: ExtractedDocument,
+    category_titles: Optional[dict[str, str]] = None,
+    version: str = ""
+) -> list[RegulationRequirement]:
+    """
+    Parse the Part II guideline tables into guideline records.
+
+    Table rows split across pages are stitched back together: a row whose
+    guideline cell does not start a new numbered item continues the previous
+    item, and empty (merged) standards/applicability cells are inherited.
+
+    Args:
+        document: Extracted CSCRF document
+        category_titles: Category code → title (from the standards)
+        version: Framework version stored on each record
+
+    Returns:
+        Guidelines in document order, with IDs like GV.PO.G1.9
+    """
+    category_titles = category_titles or {}
+    records = []
+    goal = function = category = ""
+    group = 0
+    standards: list[str] = []
+    applicability = ""
+    current: Optional[dict] = None
+    last_number: Optional[int] = None
+
+    def flush():
+        nonlocal current
+        if current is None:
+            return
+        app_text = "; ".join(
+            _join_lines(cell.split("\n")) for cell in current["applicability"] if cell
+        )
+        records.append(RegulationRequirement(
+            requirement_id=f"{category}.G{group}.{current['number']}",
+            kind="guideline",
+            clause_path=["Part II", goal, function, f"{category}: Guidelines",
+                         f"Group {group}", f"Guideline {current['number']}"],
+            text=_join_lines(current["lines"]),
+            goal=goal,
+            function=function,
+            category=category,
+            category_title=category_titles.get(category, ""),
+            standards=list(standards),
+            applicability=app_text,
+            mandatory="(mandatory)" in app_text.lower(),
+            page=current["page"],
+            version=version
+        ))
+        current = None
+
+    for page in document.pages:
+        for table in page.tables:
+            if not table:
+                continue
+            columns = _table_columns(table[0])
+            if columns is None:
+                continue
+            std_col, text_col, app_col = columns
+
+            for row in table[1:]:
+                filled = [cell.strip() for cell in row if cell and cell.strip()]
+                heading = filled[0] if len(filled) == 1 else ""
+
+                # Section heading rows span the whole table
+                match = TABLE_GOAL_PATTERN.match(heading)
+                if match:
+                    flush()
+                    goal = match.group(1).strip()
+                    function = goal  # EVOLVE has no separate control row
+                    continue
+                match = TABLE_FUNCTION_PATTERN.match(heading)
+                if match:
+                    function = match.group(1).strip()
+                    continue
+                match = TABLE_CATEGORY_PATTERN.match(heading)
+                if match:
+                    flush()
+                    category = match.group(1)
+                    group, standards, last_number = 0, [], None
+                    continue
+                if not category:
+                    continue
+
+                std_cell = (row[std_col] or "").strip() if std_col < len(row) else ""
+                text_cell = (row[text_col] or "") if text_col < len(row) else ""
+                app_cell = (row[app_col] or "").strip() if app_col < len(row) else ""
+                if not text_cell.strip():
+                    continue
+
+                row_standards = STANDARD_CODE_PATTERN.findall(std_cell)
+                for number, lines in _split_items(text_cell.strip(), None if last_number is None else last_number + 1):
+                    if number is None:
+                        # Continuation of the item from the previous row/page
+                        if current is not None:
+                            current["lines"].extend(lines)
+                            if app_cell.startswith("("):
+                                # Applicability cell wrapped onto the next page
+                                current["applicability"][-1] += "\n" + app_cell
+                                applicability = current["applicability"][-1]
+                            elif app_cell and app_cell not in current["applicability"]:
+                                current["applicability"].append(app_cell)
+                            if row_standards:
+                                standards.extend(s for s in row_standards if s not in standards)
+                        row_standards, app_cell = [], ""
+                        continue
+
+                    flush()
+                    # A new standards cell or restarted numbering opens a new group
+                    if row_standards or number == 1 or group == 0:
+                        group += 1
+                    if row_standards:
+                        standards = row_standards
+                    if app_cell:
+                        applicability = app_cell
+                    current = {
+                        "number": number,
+                        "lines": lines,
+                        "applicability": [applicability],
+                        "page": page.page_number
+                    }
+                    last_number = number
+                    # Standards/applicability cells belong to the row's first item
+                    row_standards, app_cell = [], ""
+
+    flush()
+    return records
+
+
+def parse_regulation(document: ExtractedDocument) -> list[RegulationRequirement]:
+    """Parse all standards and guidelines from an extracted CSCRF document."""
+    version = detect_version(document)
+    standards = parse_standards(document, version=version)
+    category_titles = {record.category: record.category_title for record in standards}
+    guidelines = parse_guidelines(document, category_titles=category_titles, version=version)
+    return standards + guidelines
+
+
+def save_requirements(records: list[RegulationRequirement], output_path: str | Path) -> Path:
+    """Write requirement records as JSONL (one record per line), atomically."""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record.to_dict(), ensure_ascii=False) + "\n")
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+def load_requirements(path: str | Path) -> list[RegulationRequirement]:
+    """Load requirement records saved by save_requirements."""
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                records.append(RegulationRequirement(**json.loads(line)))
+    return records
+
+
+def ingest_regulation(
+    pdf_path: str | Path,
+    output_path: str | Path,
+    cache=None,
+    workers: int = 1
+) -> list[RegulationRequirement]:
+    """
+    Full pipeline: extract the regulation PDF and save its requirements.
+
+    Args:
+        pdf_path: Path to the CSCRF PDF
+        output_path: JSONL file to write
+        cache: Optional ExtractionCache
+        workers: Processes for page extraction
+
+    Returns:
+        The parsed requirement records
+    """
+    pdf_path = Path(pdf_path)
+    print(f"Extracting: {pdf_path.name}")
+    document = extract_pdf(pdf_path, workers=workers, cache=cache)
+    print(f"  → {document.total_pages} pages extracted")
+
+    records = parse_regulation(document)
+    ids = [record.requirement_id for record in records]
+    duplicates = sorted({rid for rid in ids if ids.count(rid) > 1})
+    if duplicates:
+        print(f"  ⚠️  Duplicate requirement IDs: {', '.join(duplicates)}")
+
+    save_requirements(records, output_path)
+    n_standards = sum(1 for r in records if r.kind == "standard")
+    print(f"  → {n_standards} standards, {len(records) - n_standards} guidelines")
+    print(f"  → Saved: {output_path}")
+    return records
+
+
+if __name__ == "__main__":
+    import argparse
+    from .extraction_cache import ExtractionCache
+
+    project_root = Path(__file__).resolve().parent.parent.parent
+
+    parser = argparse.ArgumentParser(description="Split the CSCRF PDF into requirement records")
+    parser.add_argument(
+        "pdf",
+        nargs="?",
+        type=Path,
+        default=project_root / "data" / "regulations" / "csrcf_document.pdf",
+        help="Regulation PDF (default: data/regulations/csrcf_document.pdf)"
+    )
+    parser.add_argument(
+        "--output", "-o",
+        type=Path,
+        default=project_root / "data" / "requirements" / "cscrf_requirements.jsonl",
+        help="Output JSONL (default: data/requirements/cscrf_requirements.jsonl)"
+    )
+    parser.add_argument("--workers", "-w", type=int, default=None, help="Extraction processes (default: all CPUs)")
+    parser.add_argument("--no-cache", action="store_true", help="Re-extract instead of using the extraction cache")
+
+    args = parser.parse_args()
+
+    ingest_regulation(
+        args.pdf,
+        args.output,
+        cache=None if args.no_cache else ExtractionCache(),
+        workers=args.workers
+    )
@@ -0,0 +1,818 @@
+"""
+Rule-Based PDF to Markdown Conversion
+
+Deterministic, LLM-free conversion of an ExtractedDocument into the structured
+markdown described in schemas/policy_extraction_schema.md:
+- repeated page headers/footers and the table of contents are dropped
+- numbered lines ("6.1 Critical Cyber Asset Identification") become headings,
+  short Title Case lines become unnumbered subheadings
+- every heading gets a <!-- section_id: DOC-N --> comment
+- bullets and wrapped lines are re-flowed into list items and paragraphs
+- shall/must → **[MANDATORY]**, should/recommended → **[RECOMMENDED]**
+- entities from a dictionary are annotated as [[type:name]]
+- extracted tables replace their duplicated text lines
+
+A whole corpus converts in seconds, either as the final output or as a draft
+whose frontmatter the LLM touches up (see pdf_to_markdown.touch_up_frontmatter).
+"""
+
+import re
+from collections import Counter
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+from .pdf_extractor import ExtractedDocument
+
+
+# Bump when the conversion rules change the output; recorded in the
+# conversion manifest alongside each converted file.
+RULES_VERSION = "1"
+
+BULLET_PATTERN = re.compile(r'^([●•\-\*]|[○▪◦o])\s+(.*)$')
+SUB_BULLETS = "○▪◦o"
+LABEL_ITEM_PATTERN = re.compile(r'^((?:[a-z]|[ivx]+|[IVX]+|[A-H])[\.\)]|\((?:[a-z]|[ivx]+)\))\s+(\S.*)$')
+NUMBERED_PATTERN = re.compile(r'^(\d{1,2}(?:\.\d{1,2}){0,4})(\.?)\s+(\S.*)$')
+TOC_TITLE_PATTERN = re.compile(r'^(?:table\s+of\s+)?contents?$', re.IGNORECASE)
+TOC_ENTRY_PATTERN = re.compile(r'^\S.*?[\s.]+\d{1,3}$')
+PAGE_NUMBER_PATTERN = re.compile(r'^(?:page\s+)?\d{1,3}(?:\s+of\s+\d{1,3})?$', re.IGNORECASE)
+DEFINITIONS_PATTERN = re.compile(r'\b(?:glossary|definitions?|terminology|abbreviations)\b', re.IGNORECASE)
+TERMINAL_PUNCTUATION = ".:;!?"
+SMALL_WORDS = {"a", "an", "and", "as", "at", "by", "for", "from", "in", "of", "on", "or", "the", "to", "with", "&", "-", "–", "/"}
+
+MANDATORY_PATTERN = re.compile(r'\b(?:shall|must|is required to|are required to|mandatory)\b', re.IGNORECASE)
+RECOMMENDED_PATTERN = re.compile(r'\b(?:should|recommended|may consider)\b', re.IGNORECASE)
+
+TITLE_PATTERN = re.compile(
+    r'[A-Za-z][A-Za-z&/\- ]{2,60}?\b(?:Policy|Plan|Procedures?|Methodology|Scope|Standard)\b',
+    re.IGNORECASE
+)
+VERSION_PATTERN = re.compile(r'^v?(\d{1,2}\.\d{1,2}(?:\.\d{1,2})?)$', re.IGNORECASE)
+DATE_PATTERN = re.compile(r'\b(\d{1,2})(?:st|nd|rd|th)?[\s\-/]+([A-Za-z]{3,9}),?[\s\-/]+(\d{2}|\d{4})\b')
+
+# Frameworks recognised in the body text → frontmatter regulatory_frameworks
+FRAMEWORK_PATTERNS = [
+    ("ISO27001", "ISO 27001:2022", re.compile(r'ISO[\s/]*(?:IEC\s*)?27001', re.IGNORECASE)),
+    ("SEBI-CSCRF", "SEBI CSCRF", re.compile(r'\bCSCRF\b|Cyber\s*Security and Cyber Resilience Framework', re.IGNORECASE)),
+    ("NIST-CSF", "NIST Cybersecurity Framework", re.compile(r'\bNIST\b')),
+    ("PCI-DSS", "PCI DSS", re.compile(r'\bPCI[\s-]?DSS\b', re.IGNORECASE)),
+    ("IT-ACT", "Information Technology Act, 2000", re.compile(r'\bIT Act\b|Information Technology Act')),
+    ("DPDP", "Digital Personal Data Protection Act, 2023", re.compile(r'\bDPDP\b|Digital Personal Data Protection')),
+]
+
+APPLIES_TO_PATTERNS = {
+    "employees": re.compile(r'\bemployees?\b', re.IGNORECASE),
+    "contractors": re.compile(r'\bcontractors?\b', re.IGNORECASE),
+    "vendors": re.compile(r'\bvendors?\b|\bsuppliers?\b', re.IGNORECASE),
+    "third parties": re.compile(r'\bthird[\s-]part(?:y|ies)\b', re.IGNORECASE),
+}
+
+# Frontmatter entity group → annotation type
+ENTITY_TYPES = {
+    "roles": "role",
+    "external_parties": "external",
+    "controls": "control",
+    "assets": "asset",
+    "processes": "process",
+}
+
+# Built-in dictionary, extended with the entities of already converted policies
+DEFAULT_ENTITIES = {
+    "roles": [
+        "CISO", "CTO", "CEO", "COO", "Chief Information Security Officer",
+        "Information Security Team", "Information Security Steering Committee",
+        "Technology Committee", "Compliance Officer", "IT Team", "Data Owners",
+    ],
+    "external_parties": [
+        "SEBI", "CERT-In", "NCIIPC", "NSE", "BSE", "MCX", "NCDEX", "CDSL", "NSDL", "RBI",
+    ],
+    "controls": [
+        "Firewall", "Firewalls", "Encryption", "Multi-Factor Authentication", "MFA", "VPN",
+        "Antivirus", "SIEM", "DLP", "IDS", "IPS", "Intrusion Prevention and Detection",
+    ],
+    "assets": [
+        "Servers", "Databases", "Laptops", "Desktops", "Routers", "Switches",
+        "Mobile Devices", "Removable Media", "Network Devices",
+    ],
+    "processes": [
+        "Incident Management", "Change Management", "Patch Management", "Access Review",
+        "Vulnerability Assessment", "Risk Assessment", "Business Continuity",
+    ],
+}
+
+
+def generate_document_id(title: str) -> str:
+    """Generate a document ID from the title."""
+    # Common mappings
+    mappings = {
+        "cyber security": "CSP",
+        "cybersecurity": "CSP",
+        "information security": "ISP",
+        "incident": "IMP",
+        "access control": "ACP",
+        "network security": "NSP",
+        "data classification": "DCP",
+        "asset classification": "ACP",
+        "business continuity": "BCP",
+        "disaster recovery": "DRP",
+        "sdlc": "SDLC",
+        "supplier": "SPP",
+        "vendor": "VMP",
+        "mobile device": "MDP",
+        "hardening": "HSP",
+        "crisis": "CMP",
+        "risk management": "RMP",
+        "data disposal": "DDP",
+        "retention": "DRP",
+    }
+
+    title_lower = title.lower()
+    for key, doc_id in mappings.items():
+        if key in title_lower:
+            return doc_id
+
+    # Fallback: Use first letters of significant words
+    words = re.findall(r'[A-Z][a-z]+|[A-Z]+', title)
+    if words:
+        return "".join(w[0] for w in words[:4]).upper()
+
+    return "DOC"
+
+
+def read_frontmatter(path: str | Path) -> dict:
+    """Read the YAML frontmatter of a converted markdown file ({} if absent)."""
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    # Older LLM output wraps the frontmatter in a ```yaml fence
+    match = re.match(r'^(?:```yaml\s*\n)?---\n(.*?)\n---', content, re.DOTALL)
+    if not match:
+        return {}
+    try:
+        return yaml.safe_load(match.group(1)) or {}
+    except yaml.YAMLError:
+        return {}
+
+
+class EntityVocabulary:
+    """
+    Dictionary of known entities, matched with one precompiled regex.
+
+    Short all-caps terms (CISO, SEBI, MFA) match case-sensitively, everything
+    else case-insensitively; longer terms win over their prefixes.
+    """
+
+    def __init__(self, entities: dict[str, list[str]], documents: Optional[dict[str, str]] = None):
+        self.terms: dict[str, tuple[str, str]] = {}
+        for group, annotation in ENTITY_TYPES.items():
+            for term in entities.get(group, []):
+                term = str(term).strip()
+                if len(term) < 2 or term.lower() in self.terms:
+                    continue
+                self.terms[term.lower()] = (annotation, term)
+
+        # Internal documents by title → document_id, for [[doc:...]] and references
+        self.documents = {title.lower(): (title, doc_id) for title, doc_id in (documents or {}).items()}
+
+        alternatives = []
+        for key in sorted(self.terms, key=len, reverse=True):
+            term = self.terms[key][1]
+            escaped = re.escape(term)
+            alternatives.append(escaped if term.isupper() and len(term) <= 5 else f"(?i:{escaped})")
+        self.pattern = re.compile(
+            r'(?<![\w\-\[:])(?:' + "|".join(alternatives) + r')(?![\w\-\]])'
+        ) if alternatives else None
+
+        self.document_pattern = re.compile(
+            r'(?i:(?<!\w)(?:' + "|".join(re.escape(t) for t in sorted(self.documents, key=len, reverse=True)) + r')(?!\w))'
+        ) if self.documents else None
+
+    def lookup(self, surface: str) -> tuple[str, str]:
+        """Get (annotation type, canonical name) for a matched surface form."""
+        return self.terms[surface.lower()]
+
+
+@lru_cache(maxsize=8)
+def load_vocabulary(markdown_dir: Optional[str] = None) -> EntityVocabulary:
+    """
+    Build the entity vocabulary from the defaults plus the `entities:` and
+    titles found in the frontmatter of already converted markdown files.
+
+    Args:
+        markdown_dir: Directory of converted markdown (default: data/policies_md)
+    """
+    if markdown_dir is None:
+        # Navigate up from src/ingestion/rule_converter.py
+        markdown_dir = Path(__file__).resolve().parent.parent.parent / "data" / "policies_md"
+
+    entities = {group: list(terms) for group, terms in DEFAULT_ENTITIES.items()}
+    documents = {}
+    for md_file in sorted(Path(markdown_dir).glob("*.md")):
+        frontmatter = read_frontmatter(md_file)
+        for group in ENTITY_TYPES:
+            for term in (frontmatter.get("entities") or {}).get(group) or []:
+                # Single generic words ("Management", "Media") annotate noise;
+                # keep acronyms and multi-word names
+                term = str(term)
+                if " " in term or "-" in term or term.isupper():
+                    entities[group].append(term)
+        if frontmatter.get("title") and frontmatter.get("document_id"):
+            documents[frontmatter["title"]] = frontmatter["document_id"]
+
+    return EntityVocabulary(entities, documents)
+
+
+def _normalize_margin(line: str) -> str:
+    """Normalize a header/footer line so page numbers don't make it unique."""
+    return re.sub(r'\d+', '#', line.strip()).lower()
+
+
+def _repeated_margins(document: ExtractedDocument) -> set[str]:
+    """Find header/footer lines that repeat on most pages."""
+    if len(document.pages) < 2:
+        return set()
+
+    counts = Counter()
+    for page in document.pages:
+        lines = [line for line in page.text.split("\n") if line.strip()]
+        counts.update({_normalize_margin(line) for line in lines[:2] + lines[-2:]})
+
+    threshold = max(2, len(document.pages) // 2)
+    return {line for line, count in counts.items() if count >= threshold}
+
+
+def _page_lines(text: str, margins: set[str]) -> list[str]:
+    """Page lines without repeated headers/footers and bare page numbers."""
+    lines = [line.strip() for line in text.split("\n") if line.strip()]
+    head = 0
+    while head < min(2, len(lines)) and (
+        _normalize_margin(lines[head]) in margins or PAGE_NUMBER_PATTERN.match(lines[head])
+    ):
+        head += 1
+    tail = len(lines)
+    while tail > max(head, len(lines) - 2) and (
+        _normalize_margin(lines[tail - 1]) in margins or PAGE_NUMBER_PATTERN.match(lines[tail - 1])
+    ):
+        tail -= 1
+    return lines[head:tail]
+
+
+def _clean_table(table: list[list]) -> list[list[str]]:
+    """Normalize table cells to single-line strings and drop empty rows."""
+    rows = []
+    for row in table:
+        cells = [re.sub(r'\s+', ' ', str(cell or "")).strip() for cell in row]
+        if any(cells):
+            rows.append(cells)
+    return rows
+
+
+def _words(text: str) -> list[str]:
+    return re.findall(r'\w+', text.lower())
+
+
+def _coverage(line: str, vocabulary: set[str]) -> float:
+    words = _words(line)
+    if not words:
+        return 0.0
+    return sum(word in vocabulary for word in words) / len(words)
+
+
+def _place_tables(lines: list[str], tables: list[list[list]]) -> list:
+    """
+    Replace the text lines that duplicate each table with the table itself.
+
+    Returns page items in reading order: strings for text lines and
+    lists of rows for tables. A table whose text cannot be located is
+    placed after the lines consumed so far.
+    """
+    items = []
+    cursor = 0
+    for table in tables:
+        rows = _clean_table(table)
+        # Bordered text boxes come out as one-cell-per-row tables; keep them as text
+        if not rows or max(sum(1 for cell in row if cell) for row in rows) <= 1:
+            continue
+        vocabulary = {word for row in rows for cell in row for word in _words(cell)}
+        covered = [_coverage(line, vocabulary) >= 0.9 for line in lines]
+
+        # The table's text is the longest run of lines made of its words
+        start, end = None, cursor
+        i = cursor
+        while i < len(lines):
+            if not covered[i]:
+                i += 1
+                continue
+            j = i
+            while j < len(lines) and covered[j]:
+                j += 1
+            if (j - i >= min(2, len(rows))) and (start is None or j - i > end - start):
+                start, end = i, j
+            i = j
+
+        if start is None:
+            items.append(rows)
+            continue
+
+        items.extend(lines[cursor:start])
+        items.append(rows)
+        cursor = end
+
+    items.extend(lines[cursor:])
+    return items
+
+
+def _is_title_case(text: str) -> bool:
+    """Whether every significant word starts with a capital (or is a number)."""
+    words = text.split()
+    if not words or not words[0][0].isupper():
+        return False
+    return all(
+        word[0].isupper() or word[0].isdigit() or word.lower() in SMALL_WORDS or not word[0].isalpha()
+        for word in words
+    )
+
+
+def _numbered_heading(line: str, top: Optional[int]) -> Optional[tuple[str, str]]:
+    """
+    Recognise "6.1 Critical Cyber Asset Identification" style headings.
+
+    A top-level number must continue (or restart) the current numbering and a
+    sub-number must sit under the current top-level section, so numbered list
+    items and table rows further down a section are not promoted.
+
+    Returns:
+        (number, title) or None
+    """
+    match = NUMBERED_PATTERN.match(line)
+    if not match:
+        return None
+    number, _, title = match.groups()
+    title = title.rstrip(":").strip()
+
+    words = title.split()
+    if not title or not title[0].isupper() or len(words) > 12 or len(title) > 100:
+        return None
+    if title[-1] in ".,;" or MANDATORY_PATTERN.search(title) or words[-1].lower() in SMALL_WORDS:
+        return None
+
+    parts = number.split(".")
+    first = int(parts[0])
+    if top is None and first != 1:
+        return None
+    if len(parts) == 1 or (len(parts) == 2 and parts[1] == "0"):
+        if top is not None and first not in (top + 1, 1):
+            return None
+    elif top is not None and first != top:
+        return None
+
+    return number, title
+
+
+def _number_parts(number: str) -> tuple[int, ...]:
+    """"6.1" → (6, 1); a trailing ".0" is dropped so "1.0" == "1"."""
+    parts = [int(part) for part in number.split(".")]
+    if len(parts) > 1 and parts[-1] == 0:
+        parts = parts[:-1]
+    return tuple(parts)
+
+
+def _is_successor(number: str, previous: Optional[str]) -> bool:
+    """Whether `number` is the next heading number after `previous` (6.2 → 6.3, 6.2.1, 7)."""
+    if previous is None:
+        return _number_parts(number) == (1,)
+    last = _number_parts(previous)
+    candidates = {last[:depth] + (last[depth] + 1,) for depth in range(len(last))}
+    candidates.add(last + (1,))
+    return _number_parts(number) in candidates
+
+
+def _heading_level(number: str) -> int:
+    """## for "1"/"1.0", ### for "1.1", #### for "1.1.1", ..."""
+    return min(len(_number_parts(number)) + 1, 6)
+
+
+def _ends_block(text: str) -> bool:
+    return bool(text) and text[-1] in TERMINAL_PUNCTUATION
+
+
+def _build_blocks(document: ExtractedDocument) -> list[dict]:
+    """
+    Turn the document's pages into a flat list of blocks:
+    heading, item (bullet / labelled list item), paragraph and table.
+    """
+    margins = _repeated_margins(document)
+    blocks: list[dict] = []
+    current: Optional[dict] = None
+    in_toc = False
+    top: Optional[int] = None
+    last_number: Optional[str] = None
+
+    def flush():
+        nonlocal current
+        if current is not None:
+            blocks.append(current)
+            current = None
+
+    for page in document.pages:
+        lines = _page_lines(page.text, margins)
+        items = _place_tables(lines, page.tables)
+        width = max((len(line) for line in lines), default=0)
+        previous_line = ""
+
+        for index, item in enumerate(items):
+            if isinstance(item, list):
+                flush()
+                # A table continued from the previous page is merged into it
+                if blocks and blocks[-1]["type"] == "table" and blocks[-1].get("page") == page.page_number - 1 \
+                        and len(blocks[-1]["rows"][0]) == len(item[0]) and index == 0:
+                    blocks[-1]["rows"].extend(item)
+                    blocks[-1]["page"] = page.page_number
+                else:
+                    blocks.append({"type": "table", "rows": item, "page": page.page_number})
+                previous_line = ""
+                continue
+
+            line = item
+            if TOC_TITLE_PATTERN.match(line):
+                in_toc = True
+                continue
+            if in_toc:
+                if TOC_ENTRY_PATTERN.match(line):
+                    continue
+                in_toc = False
+
+            ended = current is None or _ends_block(current["text"])
+            # The previous line stopped early if this line's first word would
+            # still have fitted on it
+            short_previous = len(previous_line) + 1 + len(line.split()[0]) < 0.85 * width
+            at_boundary = ended or short_previous
+            paragraph_ended = ended and short_previous
+            previous_line = line
+
+            bullet = BULLET_PATTERN.match(line)
+            if bullet:
+                flush()
+                marker, text = bullet.groups()
+                current = {"type": "item", "depth": 1 if marker in SUB_BULLETS else 0, "text": text}
+                continue
+
+            # The expected next number is a heading even mid-paragraph (a
+            # sentence without a full stop often runs straight into it)
+            next_line = next((i for i in items[index + 1:] if isinstance(i, str)), "")
+            wrapped = len(line) >= 0.85 * width and next_line[:1].islower()
+
+            heading = None if wrapped else _numbered_heading(line, top)
+            if heading and (at_boundary or _is_successor(heading[0], last_number)):
+                flush()
+                number, title = heading
+                top = int(number.split(".")[0])
+                last_number = number
+                blocks.append({"type": "heading", "number": number, "title": title,
+                               "level": _heading_level(number)})
+                continue
+
+            numbered = NUMBERED_PATTERN.match(line)
+            labelled = LABEL_ITEM_PATTERN.match(line)
+            if at_boundary and (labelled or (numbered and numbered.group(2))):
+                flush()
+                current = {"type": "item", "depth": 0, "text": line, "ordered": not labelled}
+                continue
+
+            if (ended or (line.isupper() and short_previous)) and len(line) < 0.6 * width and len(line.split()) <= 7 \
+                    and not re.search(r'[.,;:]', line) and _is_title_case(line) \
+                    and (BULLET_PATTERN.match(next_line) or next_line[:1].isupper()):
+                flush()
+                blocks.append({"type": "heading", "number": None, "title": line, "level": None})
+                continue
+
+            if current is not None and current["type"] == "item":
+                # A list item ends at a short line followed by a capitalised one
+                continues = not (line[0].isupper() and short_previous)
+            else:
+                continues = current is not None and not paragraph_ended
+
+            if continues:
+                # Continuation of a wrapped line
+                if current["text"].endswith("-") and not current["text"].endswith(" -"):
+                    current["text"] += line
+                else:
+                    current["text"] += " " + line
+                continue
+
+            flush()
+            current = {"type": "paragraph", "text": line}
+
+    flush()
+    return blocks
+
+
+def _mark_definitions(blocks: list[dict]):
+    """Turn unnumbered subheadings of a glossary/definitions section into terms."""
+    in_definitions = False
+    for block in blocks:
+        if block["type"] != "heading":
+            continue
+        if block["number"] is not None:
+            in_definitions = bool(DEFINITIONS_PATTERN.search(block["title"]))
+        elif in_definitions:
+            block["type"] = "term"
+
+
+def _assign_section_ids(blocks: list[dict], document_id: str):
+    """Give every heading a unique section ID and a level."""
+    seen = Counter()
+    parent_number = None
+    parent_level = 1
+    sub_count = 0
+
+    for block in blocks:
+        if block["type"] != "heading":
+            continue
+        if block["number"] is not None:
+            parent_number = block["number"]
+            parent_level = block["level"]
+            sub_count = 0
+            base = f"{document_id}-{block['number']}"
+        else:
+            sub_count += 1
+            block["level"] = min(parent_level + 1, 6)
+            base = f"{document_id}-{parent_number}.{sub_count}" if parent_number else f"{document_id}-S{sub_count}"
+
+        seen[base] += 1
+        block["section_id"] = base if seen[base] == 1 else f"{base}-{seen[base]}"
+
+
+def _requirement_marker(text: str) -> str:
+    if MANDATORY_PATTERN.search(text):
+        return "**[MANDATORY]** "
+    if RECOMMENDED_PATTERN.search(text):
+        return "**[RECOMMENDED]** "
+    return ""
+
+
+def _annotate(text: str, vocabulary: EntityVocabulary, annotated: set[str], found: dict) -> str:
+    """Annotate the first occurrence (per section) of each known entity."""
+    def entity(match: re.Match) -> str:
+        annotation, canonical = vocabulary.lookup(match.group(0))
+        found.setdefault(annotation, {}).setdefault(canonical.lower(), canonical)
+        if canonical.lower() in annotated:
+            return match.group(0)
+        annotated.add(canonical.lower())
+        return f"[[{annotation}:{match.group(0)}]]"
+
+    def document_ref(match: re.Match) -> str:
+        title, doc_id = vocabulary.documents[match.group(0).lower()]
+        found.setdefault("doc", {})[doc_id] = title
+        return match.group(0)
+
+    if vocabulary.document_pattern:
+        vocabulary.document_pattern.sub(document_ref, text)
+    if vocabulary.pattern:
+        text = vocabulary.pattern.sub(entity, text)
+    return text
+
+
+def _render_table(rows: list[list[str]]) -> str:
+    width = max(len(row) for row in rows)
+    rows = [[cell.replace("|", "\\|") for cell in row] + [""] * (width - len(row)) for row in rows]
+    lines = ["| " + " | ".join(rows[0]) + " |", "|" + "---|" * width]
+    lines.extend("| " + " | ".join(row) + " |" for row in rows[1:])
+    return "\n".join(lines)
+
+
+def _render_body(blocks: list[dict], vocabulary: EntityVocabulary, found: dict) -> str:
+    out: list[str] = []
+    annotated: set[str] = set()
+    previous_type = None
+
+    for block in blocks:
+        kind = block["type"]
+        if kind == "heading":
+            annotated = set()
+            title = f"{block['number']} {block['title']}" if block["number"] else block["title"]
+            chunk = f"{'#' * block['level']} {title}\n<!-- section_id: {block['section_id']} -->"
+        elif kind == "term":
+            chunk = f"**{block['title']}**"
+        elif kind == "table":
+            chunk = _render_table(block["rows"])
+        else:
+            text = _annotate(block["text"], vocabulary, annotated, found)
+            marker = _requirement_marker(block["text"])
+            if kind == "item" and block.get("ordered"):
+                number, _, rest = text.partition(" ")
+                chunk = f"{number} {marker}{rest}"
+            elif kind == "item":
+                chunk = "  " * block["depth"] + "- " + marker + text
+            elif previous_type == "term":
+                chunk = ": " + marker + text
+            else:
+                chunk = marker + text
+
+        # List items and definitions stay together; everything else is
+        # separated by a blank line
+        if out:
+            together = (kind == "item" and previous_type == "item") or previous_type == "term"
+            out.append("\n" if together else "\n\n")
+        out.append(chunk)
+        previous_type = kind
+
+    return "".join(out) + "\n"
+
+
+def _parse_date(text: str) -> Optional[str]:
+    """Parse "17-Oct-16", "08-Jan-2025" or "07th April, 2025" to YYYY-MM-DD."""
+    match = DATE_PATTERN.search(text)
+    if not match:
+        return None
+    day, month, year = match.groups()
+    if len(year) == 2:
+        year = "20" + year
+    try:
+        return datetime.strptime(f"{day} {month[:3]} {year}", "%d %b %Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def _document_control(tables: list[list[list[str]]]) -> dict:
+    """Pull version, dates and approvers out of version-control tables."""
+    versions = []
+    dates = []
+    approved_by = None
+    prepared_by = None
+
+    for rows in tables:
+        header = [cell.lower() for cell in rows[0]]
+        if not any("version" in cell or "revision" in cell for cell in header):
+            continue
+        approver_col = next((i for i, cell in enumerate(header) if "approved by" in cell), None)
+        preparer_col = next(
+            (i for i, cell in enumerate(header)
+             if "prepared" in cell or "amended" in cell or "responsible" in cell),
+            None
+        )
+        for row in rows[1:]:
+            for cell in row:
+                version = VERSION_PATTERN.match(cell)
+                if version:
+                    versions.append(version.group(1))
+                date = _parse_date(cell)
+                if date:
+                    dates.append(date)
+            if approver_col is not None and approver_col < len(row) and row[approver_col]:
+                approved_by = row[approver_col]
+            if preparer_col is not None and preparer_col < len(row) and row[preparer_col]:
+                prepared_by = row[preparer_col]
+
+    control = {}
+    if versions:
+        control["version"] = max(versions, key=lambda v: tuple(int(p) for p in v.split(".")))
+    if dates:
+        control["created_date"] = min(dates)
+        control["last_reviewed"] = max(dates)
+    if approved_by:
+        control["approved_by"] = approved_by
+    if prepared_by:
+        control["prepared_by"] = prepared_by
+    return control
+
+
+def detect_title(document: ExtractedDocument) -> str:
+    """Find the policy title on the first page, falling back to the filename."""
+    first_page = document.pages[0].text if document.pages else ""
+    for line in first_page.split("\n"):
+        match = TITLE_PATTERN.search(line.strip())
+        if match:
+            # "CYBER SECURITY POLICY" / "Asset Classification POLICY" → Title Case,
+            # keeping short acronyms such as ISMS
+            return " ".join(
+                word.capitalize() if word.isupper() and len(word) > 4 else word
+                for word in match.group(0).split()
+            )
+
+    stem = Path(document.filename).stem
+    stem = re.sub(r'^Choice[\s_-]*(?:ISMS|IS)?[\s_-]*', '', stem, flags=re.IGNORECASE)
+    return re.sub(r'[_\-]+', ' ', stem).strip(" .") or stem
+
+
+def _person(cell: str) -> dict:
+    """Split "Ashutosh Bhardwaj, CISO" into name and role."""
+    name, _, role = cell.partition(",")
+    return {"name": name.strip(), "role": role.strip() or None}
+
+
+def _build_frontmatter(
+    document: ExtractedDocument,
+    document_id: str,
+    title: str,
+    control: dict,
+    found: dict,
+    full_text: str
+) -> dict:
+    frameworks = [
+        {"id": framework_id, "name": name}
+        for framework_id, name, pattern in FRAMEWORK_PATTERNS
+        if pattern.search(full_text)
+    ]
+    references = [
+        {"document_id": doc_id, "title": ref_title, "relationship": "related"}
+        for doc_id, ref_title in sorted(found.get("doc", {}).items())
+        if doc_id != document_id
+    ]
+
+    frontmatter = {
+        "document_id": document_id,
+        "title": title,
+        "filename": document.filename,
+        "version": control.get("version"),
+        "status": "approved" if control.get("approved_by") else "draft",
+        "created_date": control.get("created_date"),
+        "effective_date": control.get("created_date"),
+        "last_reviewed": control.get("last_reviewed"),
+        "next_review": None,
+        "owner": {"name": None, "role": None},
+        "prepared_by": [_person(control["prepared_by"])] if "prepared_by" in control else [],
+        "approved_by": [{"name": control["approved_by"], "role": None, "date": control.get("last_reviewed")}]
+        if "approved_by" in control else [],
+        "classification": "Internal" if re.search(r'\bInternal\b', full_text) else None,
+        "applies_to": [name for name, pattern in APPLIES_TO_PATTERNS.items() if pattern.search(full_text)],
+        "regulatory_frameworks": frameworks,
+        "references": references,
+        "entities": {
+            group: sorted(found.get(annotation, {}).values(), key=str.lower)
+            for group, annotation in ENTITY_TYPES.items()
+        },
+        "tags": [],
+    }
+    return frontmatter
+
+
+def convert_document_rules(
+    document: ExtractedDocument,
+    document_id: Optional[str] = None,
+    title: Optional[str] = None,
+    vocabulary: Optional[EntityVocabulary] = None
+) -> str:
+    """
+    Convert an extracted PDF document to structured markdown without an LLM.
+
+    Args:
+        document: ExtractedDocument from pdf_extractor
+        document_id: Document ID for section IDs (derived from the title if omitted)
+        title: Document title (detected from the first page if omitted)
+        vocabulary: Entity dictionary (default: load_vocabulary())
+
+    Returns:
+        Structured markdown string with YAML frontmatter
+    """
+    title = title or detect_title(document)
+    document_id = document_id or generate_document_id(title)
+    vocabulary = vocabulary or load_vocabulary()
+
+    blocks = _build_blocks(document)
+
+    # Content before the first (numbered, if any) heading is the title page
+    # and version control; it feeds the frontmatter instead of the body
+    headings = [i for i, block in enumerate(blocks) if block["type"] == "heading"]
+    numbered = [i for i in headings if blocks[i]["number"] is not None]
+    first_heading = (numbered or headings or [None])[0]
+    preamble = blocks[:first_heading] if first_heading else []
+    body_blocks = blocks[first_heading:] if first_heading is not None else blocks
+
+    control = _document_control([block["rows"] for block in preamble if block["type"] == "table"])
+    _mark_definitions(body_blocks)
+    _assign_section_ids(body_blocks, document_id)
+
+    found: dict = {}
+    body = _render_body(body_blocks, vocabulary, found)
+
+    full_text = "\n".join(page.text for page in document.pages)
+    frontmatter = _build_frontmatter(document, document_id, title, control, found, full_text)
+    yaml_text = yaml.safe_dump(frontmatter, sort_keys=False, allow_unicode=True, width=1000)
+
+    return f"---\n{yaml_text}---\n\n{body}"
+
+
+# CLI for testing
+if __name__ == "__main__":
+    import sys
+    import time
+    from .pdf_extractor import extract_pdf
+    from .extraction_cache import ExtractionCache
+
+    if len(sys.argv) < 2:
+        print("Usage: python -m ingestion.rule_converter <pdf_path> [output_path]")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    document = extract_pdf(sys.argv[1], cache=ExtractionCache())
+    markdown = convert_document_rules(document)
+    elapsed = time.perf_counter() - start
+
+    if len(sys.argv) > 2:
+        Path(sys.argv[2]).write_text(markdown, encoding="utf-8")
+        print(f"Saved to {sys.argv[2]} ({elapsed:.2f}s)")
+    else:
+        print(markdown)
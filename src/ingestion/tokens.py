@@ -0,0 +1,65 @@
+"""
+Token Counting and Conversion Budgets
+
+Counts tokens with tiktoken (a requirement; without it counts fall back
+to a characters/4 estimate, with a warning) and sizes conversion requests
+by the output tokens they are predicted to produce, so extracted pages can
+be packed into requests that fill the model's output budget without being
+truncated.
+"""
+
+import warnings
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:  # Listed in requirements.txt; warned about on first use
+    tiktoken = None
+
+
+# Converted markdown re-emits the input plus headings, section_id comments,
+# [MANDATORY]/[RECOMMENDED] markers and [[type:entity]] annotations, so it is
+# longer than the extracted text. Conservative ratio of output to input tokens.
+OUTPUT_TOKEN_RATIO = 1.3
+
+# Tokens reserved for the YAML frontmatter emitted with part 1
+FRONTMATTER_TOKENS = 1500
+
+# Fraction of max_tokens a request is planned to use, leaving headroom for
+# pages that expand more than average
+OUTPUT_BUDGET_FILL = 0.85
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+@lru_cache(maxsize=None)
+def _warn_estimated():
+    warnings.warn(
+        "tiktoken is not installed; token counts are estimated from characters, "
+        "so conversion parts may be mis-sized (pip install tiktoken)",
+        RuntimeWarning,
+        stacklevel=3
+    )
+
+
+def count_tokens(text: str, model: str = "gpt-4o") -> int:
+    """Count tokens in text for a model (estimated, with a warning, without tiktoken)."""
+    if tiktoken is None:
+        _warn_estimated()
+        return len(text) // 4 + 1
+    return len(_get_encoding(model).encode(text, disallowed_special=()))
+
+
+def input_token_budget(max_tokens: int) -> int:
+    """
+    Largest input (in tokens) per request whose predicted output, including
+    frontmatter, fits within max_tokens.
+    """
+    usable = max_tokens * OUTPUT_BUDGET_FILL - FRONTMATTER_TOKENS
+    return max(1, int(usable / OUTPUT_TOKEN_RATIO))
@@ -20,7 +20,7 @@ from openai import OpenAI
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from indexing.index_builder import BM25Index, VectorStore
+from indexing.index_builder import BUNDLE_FILENAME, BM25Index, VectorStore
 from indexing.graph_builder import KnowledgeGraphBuilder
 
 
@@ -237,20 +237,14 @@ class HybridRetriever:
                 max_expansion=per_retriever_k
             )
 
-            # Convert graph results to the same format
-            # Section ID → chunk ID lookup
-            section_to_chunk = {}
-            for chunk in self.bm25_index.chunks:
-                if chunk.section_id not in section_to_chunk:
-                    section_to_chunk[chunk.section_id] = chunk.chunk_id
-
+            # Convert graph results to the same format (first chunk of each section)
             graph_list = []
             for exp in expanded:
-                chunk_id = section_to_chunk.get(exp.section_id)
-                if chunk_id:
+                rows = self.bm25_index.section_rows.get(exp.section_id)
+                if rows:
                     # Score based on relevance (normalize to 0-1 range)
                     score = min(exp.relevance_score / 3.0, 1.0)
-                    graph_list.append((chunk_id, score, "graph"))
+                    graph_list.append((self.bm25_index.chunks[rows[0]].chunk_id, score, "graph"))
 
             if graph_list:
                 result_lists.append(graph_list)
@@ -258,13 +252,10 @@ class HybridRetriever:
                 # Re-fuse with graph results
                 fused = self._reciprocal_rank_fusion(result_lists)
 
-        # Build chunk lookup from BM25 index (has full chunk data)
-        chunk_lookup = {chunk.chunk_id: chunk for chunk in self.bm25_index.chunks}
-
-        # Build final results
+        # Build final results (the BM25 index has the full chunk data)
         results = []
         for chunk_id, score, sources, ret_scores in fused[:top_k]:
-            chunk = chunk_lookup.get(chunk_id)
+            chunk = self.bm25_index.get_chunk(chunk_id)
             if chunk:
                 results.append(RetrievalResult(
                     chunk_id=chunk_id,
@@ -287,18 +278,20 @@ class HybridRetriever:
 
     def _chunk_id_to_section_id(self, chunk_id: str) -> str:
         """Extract section ID from chunk ID."""
-        for chunk in self.bm25_index.chunks:
-            if chunk.chunk_id == chunk_id:
-                return chunk.section_id
-        return chunk_id
+        chunk = self.bm25_index.get_chunk(chunk_id)
+        return chunk.section_id if chunk else chunk_id
 
 
-def load_retriever(index_dir: str | Path, load_graph: bool = True) -> HybridRetriever:
+def load_retriever(
+    index_dir: str | Path,
+    load_graph: bool = True
+) -> HybridRetriever:
     """
     Load a HybridRetriever from saved indexes.
 
     Args:
-        index_dir: Directory containing bm25_index.pkl, chromadb/, and knowledge_graph.pkl
+        index_dir: Directory containing index.bundle (or bm25_index.pkl), chromadb/,
+            and knowledge_graph.pkl
         load_graph: Whether to load the knowledge graph for GraphRAG
 
     Returns:
@@ -306,9 +299,12 @@ def load_retriever(index_dir: str | Path, load_graph: bool = True) -> HybridRetr
     """
     index_dir = Path(index_dir)
 
-    # Load BM25 index
+    # Load BM25 index (memory-mapped bundle, or the pickle of older builds)
     bm25_index = BM25Index()
-    bm25_index.load(index_dir / "bm25_index.pkl")
+    if (index_dir / BUNDLE_FILENAME).exists():
+        bm25_index.load_bundle(index_dir / BUNDLE_FILENAME)
+    else:
+        bm25_index.load(index_dir / "bm25_index.pkl")
 
     # Load vector store (ChromaDB)
     vector_store = None
@@ -0,0 +1,26 @@
+"""
+Shared test setup.
+
+Tests import the pipeline packages from src/ (as the run_*.py scripts do)
+and reference implementations from benchmarks/, and run against the
+markdown policies in data/policies_md.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+sys.path.insert(0, str(PROJECT_ROOT / "benchmarks"))
+
+POLICIES_MD = PROJECT_ROOT / "data" / "policies_md"
+
+
+@pytest.fixture
+def policies_md() -> Path:
+    """Directory of the converted markdown policies."""
+    if not any(POLICIES_MD.glob("*.md")):
+        pytest.skip("No markdown policies in data/policies_md")
+    return POLICIES_MD
@@ -0,0 +1,101 @@
+"""Tests for indexing.bm25_engine.SparseBM25."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from conftest import POLICIES_MD
+from indexing.bm25_engine import SparseBM25, select_top_k
+from indexing.markdown_parser import parse_markdown_file
+from indexing.tokenizer import Tokenizer
+
+
+@pytest.fixture(scope="module")
+def corpus() -> list[list[str]]:
+    """Tokenized sections of the markdown policies."""
+    tokenize = Tokenizer().tokenize
+    corpus = [
+        tokenize(section.get_full_text())
+        for md_path in sorted(POLICIES_MD.glob("*.md"))
+        for section in parse_markdown_file(md_path).sections
+    ]
+    if not corpus:
+        pytest.skip("No markdown policies in data/policies_md")
+    return corpus
+
+
+@pytest.fixture(scope="module")
+def queries(corpus) -> list[list[str]]:
+    """Multi-term queries drawn from the corpus, with repeated and unknown terms."""
+    rng = random.Random(0)
+    pool = [token for tokens in corpus for token in tokens]
+    queries = [rng.choices(pool, k=rng.randint(1, 15)) for _ in range(50)]
+    queries.append(["password", "password", "notaword"])
+    queries.append(["notaword"])
+    queries.append([])
+    return queries
+
+
+def _stable_top_k(scores, k: int) -> list[int]:
+    """Top k as a stable sort of all scores would give them (ties in document order)."""
+    return sorted(range(len(scores)), key=lambda i: -scores[i])[:k]
+
+
+def test_scores_match_rank_bm25(corpus, queries):
+    rank_bm25 = pytest.importorskip("rank_bm25")
+    reference = rank_bm25.BM25Okapi(corpus)
+    engine = SparseBM25(corpus)
+
+    for query in queries:
+        np.testing.assert_allclose(engine.get_scores(query), reference.get_scores(query), rtol=1e-9, atol=1e-12)
+
+
+def test_top_k_matches_rank_bm25(corpus, queries):
+    rank_bm25 = pytest.importorskip("rank_bm25")
+    reference = rank_bm25.BM25Okapi(corpus)
+    engine = SparseBM25(corpus)
+
+    for query in queries:
+        for k in (1, 10, 50):
+            indices, scores = engine.top_k(query, k)
+            expected = _stable_top_k(reference.get_scores(query), k)
+            np.testing.assert_allclose(scores, reference.get_scores(query)[expected], rtol=1e-9, atol=1e-12)
+            assert list(indices) == _stable_top_k(engine.get_scores(query), k)
+
+
+@pytest.mark.parametrize("k", [0, -1])
+def test_top_k_nonpositive_k(corpus, k):
+    indices, scores = SparseBM25(corpus).top_k(["password"], k)
+    assert len(indices) == 0 and len(scores) == 0
+
+
+def test_select_top_k_breaks_ties_by_index():
+    scores = np.array([1.0, 3.0, 3.0, 2.0, 3.0, 0.0])
+    assert list(select_top_k(scores, 2)) == [1, 2]
+    assert list(select_top_k(scores, 4)) == [1, 2, 4, 3]
+    assert list(select_top_k(scores, 10)) == [1, 2, 4, 3, 0, 5]
+    assert list(select_top_k(scores, 0)) == []
+
+
+def test_state_round_trip(corpus, queries):
+    engine = SparseBM25(corpus)
+    restored = SparseBM25.from_state(engine.state())
+
+    for query in queries:
+        np.testing.assert_array_equal(restored.get_scores(query), engine.get_scores(query))
+
+
+
+def test_updated_matches_rebuild(corpus, queries):
+    rng = random.Random(1)
+    keep = np.array([rng.random() > 0.2 for _ in corpus])
+    added = [list(reversed(tokens)) + ["newterm"] for tokens in corpus[:25]]
+
+    updated = SparseBM25(corpus).updated(keep, added)
+    rebuilt = SparseBM25([tokens for tokens, kept in zip(corpus, keep) if kept] + added)
+
+    assert set(updated.vocabulary) == set(rebuilt.vocabulary)
+    for query in queries + [["newterm"]]:
+        np.testing.assert_allclose(updated.get_scores(query), rebuilt.get_scores(query), rtol=1e-12, atol=1e-12)
@@ -0,0 +1,98 @@
+"""Tests for ingestion.conversion_checkpoint and checkpointed conversion requests."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from ingestion.conversion_checkpoint import ConversionCheckpoint
+
+
+def test_part_key_identifies_the_request():
+    key = ConversionCheckpoint.part_key(1, "gpt-4o", "system", "prompt")
+    assert key == ConversionCheckpoint.part_key(1, "gpt-4o", "system", "prompt")
+    assert key.startswith("part-0001-")
+    assert len({
+        key,
+        ConversionCheckpoint.part_key(2, "gpt-4o", "system", "prompt"),
+        ConversionCheckpoint.part_key(1, "gpt-4o-mini", "system", "prompt"),
+        ConversionCheckpoint.part_key(1, "gpt-4o", "system", "other prompt"),
+        ConversionCheckpoint.part_key(1, "gpt-4o", "systemprompt", "")
+    }) == 5
+
+
+def test_commit_load_discard_clear(tmp_path):
+    checkpoint = ConversionCheckpoint.for_pdf("abc123", root=tmp_path)
+    assert checkpoint.completed_parts() == 0
+
+    key = ConversionCheckpoint.part_key(1, "gpt-4o", "system", "prompt")
+    checkpoint.partial_path(key).write_text("partial output", encoding="utf-8")
+    assert checkpoint.load(key) is None  # Not finished
+
+    checkpoint.commit(key)
+    assert checkpoint.load(key) == "partial output"
+    assert checkpoint.completed_parts() == 1
+
+    other = ConversionCheckpoint.part_key(2, "gpt-4o", "system", "prompt")
+    checkpoint.partial_path(other).write_text("cut off", encoding="utf-8")
+    checkpoint.discard(other)
+    assert not checkpoint.partial_path(other).exists()
+    assert checkpoint.completed_parts() == 1
+
+    checkpoint.clear()
+    assert not checkpoint.directory.exists()
+
+
+class StreamingClient:
+    """Chat client double that streams a fixed response in pieces."""
+
+    def __init__(self, pieces: list[str], finish_reason: str = "stop"):
+        self.pieces = pieces
+        self.finish_reason = finish_reason
+        self.requests = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        assert kwargs["stream"]
+        self.requests += 1
+        chunks = [
+            SimpleNamespace(usage=None, choices=[SimpleNamespace(delta=SimpleNamespace(content=piece), finish_reason=None)])
+            for piece in self.pieces
+        ]
+        chunks[-1].choices[0].finish_reason = self.finish_reason
+        usage = SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15)
+        return iter(chunks + [SimpleNamespace(usage=usage, choices=[])])
+
+
+@pytest.fixture
+def pdf_to_markdown():
+    pytest.importorskip("openai")
+    pytest.importorskip("yaml")
+    from ingestion import pdf_to_markdown
+    return pdf_to_markdown
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")  # Estimated token counts without tiktoken
+def test_completed_parts_are_reused(tmp_path, pdf_to_markdown):
+    checkpoint = ConversionCheckpoint(tmp_path)
+    client = StreamingClient(["## 1. Purpose\n", "Text\n"])
+
+    first = pdf_to_markdown._run_part(client, "gpt-4o", "prompt", 1000, None, checkpoint, part=1)
+    second = pdf_to_markdown._run_part(client, "gpt-4o", "prompt", 1000, None, checkpoint, part=1)
+
+    assert first == second == "## 1. Purpose\nText\n"
+    assert client.requests == 1
+    assert checkpoint.completed_parts() == 1
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_truncated_parts_are_not_checkpointed(tmp_path, pdf_to_markdown):
+    checkpoint = ConversionCheckpoint(tmp_path)
+    client = StreamingClient(["## 1. Purpose\n", "Te"], finish_reason="length")
+
+    with pytest.raises(pdf_to_markdown.TruncatedResponseError) as raised:
+        pdf_to_markdown._convert_part(client, "gpt-4o", "prompt", 1000, None, checkpoint, part=1, retries=2)
+
+    assert raised.value.content == "## 1. Purpose\nTe"
+    assert client.requests == 1  # Not retried
+    assert checkpoint.completed_parts() == 0
+    assert not list(tmp_path.glob("*.partial"))
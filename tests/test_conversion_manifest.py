@@ -0,0 +1,63 @@
+"""Tests for ingestion.conversion_manifest."""
+
+import pytest
+
+from ingestion.conversion_manifest import ConversionManifest
+
+PARTS = [{"pages": [1, 10], "page_hashes": ["a"] * 10, "section_ids": ["HP-1"], "model": "gpt-4o"}]
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    (tmp_path / "HP_hardening_policy.md").write_text("---\ndocument_id: HP\n---\n", encoding="utf-8")
+    return tmp_path
+
+
+def test_save_load_round_trip(output_dir):
+    manifest = ConversionManifest.load(output_dir)
+    manifest.record("hp.pdf", "hash1", "HP_hardening_policy.md", "gpt-4o", "1", PARTS)
+    manifest.save()
+
+    loaded = ConversionManifest.load(output_dir)
+    assert loaded.entries == manifest.entries
+    assert not list(output_dir.glob("*.tmp"))
+
+
+def test_lookup(output_dir):
+    manifest = ConversionManifest.load(output_dir)
+    manifest.record("hp.pdf", "hash1", "HP_hardening_policy.md", "gpt-4o", "1")
+
+    assert manifest.lookup("hp.pdf", "hash1", "gpt-4o", "1")["markdown"] == "HP_hardening_policy.md"
+    assert manifest.lookup("hp.pdf", "hash2", "gpt-4o", "1") is None  # PDF changed
+    assert manifest.lookup("hp.pdf", "hash1", "gpt-4o-mini", "1") is None  # Other model
+    assert manifest.lookup("hp.pdf", "hash1", "gpt-4o", "2") is None  # Other prompts
+    assert manifest.lookup("other.pdf", "hash1", "gpt-4o", "1") is None
+
+    (output_dir / "HP_hardening_policy.md").unlink()
+    assert manifest.lookup("hp.pdf", "hash1", "gpt-4o", "1") is None  # Markdown deleted
+
+
+def test_previous_needs_parts_and_same_signature(output_dir):
+    manifest = ConversionManifest.load(output_dir)
+    manifest.record("hp.pdf", "hash1", "HP_hardening_policy.md", "gpt-4o", "1")
+    assert manifest.previous("hp.pdf", "gpt-4o", "1") is None
+
+    manifest.record("hp.pdf", "hash1", "HP_hardening_policy.md", "gpt-4o", "1", PARTS)
+    assert manifest.previous("hp.pdf", "gpt-4o", "1")["parts"] == PARTS
+    assert manifest.previous("hp.pdf", "gpt-4o-mini", "1") is None
+
+
+def test_bootstrap_adopts_existing_markdown(tmp_path):
+    (tmp_path / "HP_hardening_policy.md").write_text(
+        '---\ndocument_id: HP\nfilename: "Choice ISMS_Hardening Policy..pdf"\n---\n# 1. Purpose\n',
+        encoding="utf-8"
+    )
+    (tmp_path / "notes.md").write_text("No frontmatter\n", encoding="utf-8")
+
+    manifest = ConversionManifest.load(tmp_path)
+    assert list(manifest.entries) == ["Choice ISMS_Hardening Policy..pdf"]
+
+    # Adopted with the current hash, whatever the model
+    entry = manifest.lookup("Choice ISMS_Hardening Policy..pdf", "hash1", "gpt-4o", "1")
+    assert entry["markdown"] == "HP_hardening_policy.md" and entry["sha256"] == "hash1"
+    assert manifest.lookup("Choice ISMS_Hardening Policy..pdf", "hash2", "gpt-4o", "1") is None
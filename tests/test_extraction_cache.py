@@ -0,0 +1,95 @@
+"""Tests for ingestion.extraction_cache."""
+
+import gzip
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from ingestion import extraction_cache
+from ingestion.extraction_cache import ExtractionCache, file_sha256
+from ingestion.pdf_extractor import DEFAULT_BACKEND, ExtractedDocument, ExtractedPage
+
+
+def make_document(filepath: Path) -> ExtractedDocument:
+    return ExtractedDocument(
+        filename=filepath.name,
+        filepath=filepath,
+        pages=[
+            ExtractedPage(1, "Title page ✓", tables=[[["Version", "Date"], ["1.0", "2024-01-01"]]]),
+            ExtractedPage(2, "Body text", tables_scanned=False)
+        ],
+        total_pages=2,
+        metadata={"Title": "Policy", "Pages": 2}
+    )
+
+
+@pytest.fixture
+def pdf(tmp_path) -> Path:
+    path = tmp_path / "policy.pdf"
+    path.write_bytes(b"%PDF-1.4 test bytes")
+    return path
+
+
+def test_put_get_round_trip(tmp_path, pdf):
+    cache = ExtractionCache(tmp_path / "cache")
+    document = make_document(pdf)
+    cache.put(document, sha256=file_sha256(pdf))
+
+    assert cache.get(pdf) == document
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_entries_are_keyed_by_content_and_backend(tmp_path, pdf):
+    cache = ExtractionCache(tmp_path / "cache")
+    cache.put(make_document(pdf), sha256=file_sha256(pdf))
+
+    # Same bytes under another name: a hit, reported under the caller's name
+    copy = tmp_path / "renamed.pdf"
+    copy.write_bytes(pdf.read_bytes())
+    cached = cache.get(copy)
+    assert (cached.filename, cached.filepath) == ("renamed.pdf", copy)
+
+    assert cache.get(pdf, backend="pdfium") is None
+    pdf.write_bytes(b"%PDF-1.4 changed bytes")
+    assert cache.get(pdf) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_corrupt_entry_is_a_miss(tmp_path, pdf):
+    cache = ExtractionCache(tmp_path / "cache")
+    entry = cache.put(make_document(pdf), sha256=file_sha256(pdf))
+    with gzip.open(entry, "wt", encoding="utf-8") as f:
+        f.write("{not json")
+
+    assert cache.get(pdf) is None
+    assert cache.misses == 1
+
+
+def test_get_or_extract(tmp_path, pdf, monkeypatch):
+    cache = ExtractionCache(tmp_path / "cache")
+    calls = []
+
+    def fake_extract(filepath, backend):
+        calls.append(backend)
+        return make_document(Path(filepath))
+
+    monkeypatch.setattr(extraction_cache, "extract_pdf", fake_extract)
+
+    document, from_cache = cache.get_or_extract(pdf, backend="pdfium")
+    assert not from_cache and calls == ["pdfium"]
+
+    cached, from_cache = cache.get_or_extract(pdf, backend="pdfium")
+    assert from_cache and cached == document and calls == ["pdfium"]
+
+
+def test_concurrent_puts(tmp_path, pdf):
+    cache = ExtractionCache(tmp_path / "cache")
+    document = make_document(pdf)
+    sha256 = file_sha256(pdf)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: cache.put(document, sha256=sha256), range(64)))
+
+    assert [path.name for path in cache.cache_dir.iterdir()] == [cache._entry_path(sha256, DEFAULT_BACKEND).name]
+    assert cache.get(pdf) == document
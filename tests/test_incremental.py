@@ -0,0 +1,139 @@
+"""Tests for indexing.incremental: an incremental update must equal a full build."""
+
+import shutil
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("chromadb")  # Imported by index_builder
+pytest.importorskip("networkx")
+
+from conftest import POLICIES_MD
+from indexing.graph_builder import KnowledgeGraphBuilder, build_knowledge_graph
+from indexing.incremental import IndexManifest, build_manifest, update_indexes
+from indexing.index_builder import BUNDLE_FILENAME, BM25Index, create_chunks_from_documents
+from indexing.markdown_parser import parse_all_markdown_files
+from indexing.parse_cache import ParseCache
+from indexing.tokenizer import TokenizerConfig
+
+# Two of the ISMS files share document_id "ISMS" (and so a graph document node)
+INITIAL_FILES = [
+    "ACP_asset_classification_policy.md",
+    "DCP_data_classification_policy.md",
+    "ISMS_choice_equity_broking_pvt_ltd_consolidated_procedures.md",
+    "ISMS_isms_scope.md",
+    "SRP_supplier_relationship_policy.md"
+]
+CHANGED_FILE = "ISMS_isms_scope.md"
+REMOVED_FILE = "DCP_data_classification_policy.md"
+ADDED_FILE = "MDP_mobile_device_policy.md"
+
+NEW_SECTION = """
+## 9. Review of Scope
+<!-- section_id: ISMS-9 -->
+
+The [[role:CISO]] shall review the scope annually with the [[role:Risk Committee]].
+"""
+
+QUERIES = ["scope review annually", "asset classification owner", "supplier access", "mobile device loss"]
+
+
+def full_build(markdown_dir, index_dir, cache=None):
+    """What `run_indexing.py --no-vector` builds."""
+    documents = parse_all_markdown_files(markdown_dir, cache=cache)
+    chunks = create_chunks_from_documents(documents)
+    index = BM25Index()
+    index.build(chunks)
+    index.save_bundle(index_dir / BUNDLE_FILENAME)
+    build_knowledge_graph(markdown_dir, index_dir, documents=documents)
+    build_manifest(markdown_dir, documents, chunks, TokenizerConfig(), None, graph=True).save(index_dir)
+
+
+def load_index(index_dir) -> BM25Index:
+    index = BM25Index()
+    index.load_bundle(index_dir / BUNDLE_FILENAME)
+    return index
+
+
+def chunk_scores(index: BM25Index, query: str) -> list[tuple]:
+    """Every chunk with its score, in a canonical order (chunk order differs between builds)."""
+    scores = index.bm25.get_scores(index.tokenizer.tokenize_query(query))
+    return sorted(
+        (chunk.document_id, chunk.section_id, chunk.content, score)
+        for chunk, score in zip(index.chunks, scores)
+    )
+
+
+def graph_contents(index_dir) -> tuple[set, set]:
+    graph = KnowledgeGraphBuilder.load(index_dir).graph
+    return set(graph.nodes), {(u, v, data.get("edge_type")) for u, v, data in graph.edges(data=True)}
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    missing = [name for name in INITIAL_FILES + [ADDED_FILE] if not (POLICIES_MD / name).exists()]
+    if missing:
+        pytest.skip(f"Policies missing from data/policies_md: {', '.join(missing)}")
+
+    markdown_dir = tmp_path / "policies_md"
+    markdown_dir.mkdir()
+    for name in INITIAL_FILES:
+        shutil.copy(POLICIES_MD / name, markdown_dir / name)
+    for name in ("incremental", "full", "cache"):
+        (tmp_path / name).mkdir()
+    return markdown_dir, tmp_path / "incremental", tmp_path / "full", ParseCache(tmp_path / "cache")
+
+
+def test_incremental_update_matches_full_build(dirs):
+    markdown_dir, incremental_dir, full_dir, cache = dirs
+    full_build(markdown_dir, incremental_dir, cache)
+
+    with open(markdown_dir / CHANGED_FILE, "a", encoding="utf-8") as f:
+        f.write(NEW_SECTION)
+    (markdown_dir / REMOVED_FILE).unlink()
+    shutil.copy(POLICIES_MD / ADDED_FILE, markdown_dir / ADDED_FILE)
+
+    changes = update_indexes(markdown_dir, incremental_dir, embedding_model=None, graph=True, cache=cache)
+    assert (changes.added, changes.updated, changes.removed) == ([ADDED_FILE], [CHANGED_FILE], [REMOVED_FILE])
+
+    full_build(markdown_dir, full_dir)
+
+    updated, rebuilt = load_index(incremental_dir), load_index(full_dir)
+    assert len(updated.chunks) == len(rebuilt.chunks)
+    assert len(set(updated.chunk_rows)) == len(updated.chunks)  # Chunk IDs stay unique
+    for query in QUERIES:
+        expected = chunk_scores(rebuilt, query)
+        actual = chunk_scores(updated, query)
+        assert [row[:3] for row in actual] == [row[:3] for row in expected]
+        np.testing.assert_allclose([row[3] for row in actual], [row[3] for row in expected], rtol=1e-12)
+
+    assert graph_contents(incremental_dir) == graph_contents(full_dir)
+
+    manifest, full_manifest = IndexManifest.load(incremental_dir), IndexManifest.load(full_dir)
+    assert {name: state.sha256 for name, state in manifest.files.items()} == {
+        name: state.sha256 for name, state in full_manifest.files.items()
+    }
+    assert sorted(updated.chunk_rows) == sorted(
+        chunk_id for state in manifest.files.values() for chunk_id in state.chunk_ids
+    )
+
+
+def test_no_changes(dirs):
+    markdown_dir, index_dir, _, cache = dirs
+    full_build(markdown_dir, index_dir, cache)
+
+    changes = update_indexes(markdown_dir, index_dir, embedding_model=None, graph=True, cache=cache)
+    assert not changes.has_changes
+    assert sorted(changes.unchanged) == INITIAL_FILES
+
+
+def test_settings_must_match_the_index(dirs):
+    markdown_dir, index_dir, _, cache = dirs
+    full_build(markdown_dir, index_dir, cache)
+
+    with pytest.raises(ValueError):
+        update_indexes(markdown_dir, index_dir, embedding_model="text-embedding-3-small", graph=True)
+    with pytest.raises(ValueError):
+        update_indexes(markdown_dir, index_dir, embedding_model=None, graph=False)
+    with pytest.raises(ValueError):
+        update_indexes(markdown_dir, index_dir, TokenizerConfig(stemming=True), embedding_model=None)
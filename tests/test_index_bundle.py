@@ -0,0 +1,123 @@
+"""Tests for indexing.index_bundle and the BM25Index bundle format."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from conftest import POLICIES_MD
+from indexing.index_bundle import StringColumn, pack_strings, read_bundle, write_bundle
+
+QUERIES = [
+    "password complexity and expiry",
+    "access control for privileged users",
+    "incident reporting to CERT-In within six hours",
+    "backup and business continuity testing",
+    "notaword"
+]
+
+
+def test_string_column_round_trip():
+    strings = ["", "ascii", "ünïcödé ✓", "line\nbreaks", ""]
+    column = StringColumn(*pack_strings(strings))
+    assert len(column) == len(strings)
+    assert list(column) == strings
+    assert column[-1] == "" and column[1:3] == strings[1:3]
+    with pytest.raises(IndexError):
+        column[len(strings)]
+
+
+def test_bundle_round_trip(tmp_path):
+    arrays = {
+        "ints": np.arange(10, dtype=np.int32),
+        "floats": np.linspace(0, 1, 7),
+        "matrix": np.arange(12, dtype=np.int64).reshape(3, 4),
+        "empty": np.zeros(0, dtype=np.float64)
+    }
+    write_bundle(tmp_path / "test.bundle", {"name": "test", "count": 3}, arrays)
+
+    bundle = read_bundle(tmp_path / "test.bundle")
+    assert bundle.header == {"name": "test", "count": 3}
+    assert set(bundle.arrays) == set(arrays)
+    for name, array in arrays.items():
+        assert bundle.arrays[name].dtype == array.dtype
+        np.testing.assert_array_equal(bundle.arrays[name], array)
+
+
+def test_read_bundle_rejects_other_files(tmp_path):
+    (tmp_path / "empty").write_bytes(b"")
+    (tmp_path / "other").write_bytes(b"not a bundle at all")
+    for name in ("empty", "other"):
+        with pytest.raises(ValueError):
+            read_bundle(tmp_path / name)
+
+
+@pytest.fixture(scope="module")
+def built_index():
+    """BM25Index built from the markdown policies."""
+    pytest.importorskip("chromadb")  # Imported by index_builder
+    from indexing.index_builder import BM25Index, create_chunks_from_documents
+    from indexing.markdown_parser import parse_markdown_file
+
+    documents = [parse_markdown_file(md_path) for md_path in sorted(POLICIES_MD.glob("*.md"))]
+    if not documents:
+        pytest.skip("No markdown policies in data/policies_md")
+    index = BM25Index()
+    index.build(create_chunks_from_documents(documents))
+    return index
+
+
+def _results(index, query: str) -> list[tuple[str, float]]:
+    return [(chunk.chunk_id, score) for chunk, score in index.search(query, top_k=20)]
+
+
+def test_bm25_index_bundle_round_trip(built_index, tmp_path):
+    from indexing.index_builder import BM25Index
+
+    built_index.save_bundle(tmp_path / "index.bundle")
+    loaded = BM25Index()
+    loaded.load_bundle(tmp_path / "index.bundle")
+
+    # Lookup maps come from the key columns; no chunk is decoded to build them
+    assert loaded.chunk_rows == built_index.chunk_rows
+    assert loaded.section_rows == built_index.section_rows
+    assert all(chunk is None for chunk in loaded.chunks._chunks)
+
+    assert list(loaded.chunks) == list(built_index.chunks)
+    for query in QUERIES:
+        assert _results(loaded, query) == _results(built_index, query)
+
+    chunk = built_index.chunks[len(built_index.chunks) // 2]
+    assert loaded.get_chunk(chunk.chunk_id) == chunk
+    assert chunk in loaded.section_chunks(chunk.section_id)
+    assert loaded.get_chunk("missing") is None and loaded.section_chunks("missing") == []
+
+
+def test_bundle_without_key_columns(built_index, tmp_path):
+    """Bundles written before the chunk_id/section_id columns still load."""
+    from indexing.index_builder import CHUNK_KEY_FIELDS, BM25Index
+
+    built_index.save_bundle(tmp_path / "index.bundle")
+    bundle = read_bundle(tmp_path / "index.bundle")
+    old_names = {f"{name}s" for name in CHUNK_KEY_FIELDS} | {f"{name}_offsets" for name in CHUNK_KEY_FIELDS}
+    write_bundle(
+        tmp_path / "old.bundle", bundle.header,
+        {name: array for name, array in bundle.arrays.items() if name not in old_names}
+    )
+
+    loaded = BM25Index()
+    loaded.load_bundle(tmp_path / "old.bundle")
+    assert loaded.chunk_rows == built_index.chunk_rows
+    assert loaded.section_rows == built_index.section_rows
+
+
+def test_bm25_index_pickle_round_trip(built_index, tmp_path):
+    from indexing.index_builder import BM25Index
+
+    built_index.save(tmp_path / "bm25_index.pkl")
+    loaded = BM25Index()
+    loaded.load(tmp_path / "bm25_index.pkl")
+
+    assert loaded.chunks == built_index.chunks
+    assert loaded.chunk_rows == built_index.chunk_rows
+    for query in QUERIES:
+        assert _results(loaded, query) == _results(built_index, query)
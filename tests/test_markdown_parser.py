@@ -0,0 +1,89 @@
+"""Tests for indexing.markdown_parser."""
+
+from dataclasses import asdict
+
+import pytest
+
+from conftest import POLICIES_MD
+from bench_markdown_parser import reference_parse_sections
+from indexing.frontmatter import split_frontmatter
+from indexing import markdown_parser
+from indexing.markdown_parser import iter_markdown_sections, parse_markdown_content, parse_sections
+
+
+SAMPLE = """# 1. Access Control
+<!-- section_id: AC-1 -->
+<!-- compliance_relevance: HIGH -->
+<!-- likely_maps_to: ["ISO 27001", 'SEBI CSCRF'] -->
+
+The [[role:CISO]] shall approve access to [[asset:Production Servers]].
+
+## 1.1 Passwords
+<!-- section_id: AC-1.1 -->
+
+**[MANDATORY]** Passwords follow [[control:Password Policy]] and
+[[control:Password Policy]] again, per [[framework:ISO 27001]].
+
+### Heading without an ID
+Text under [[process:Access Review]] and [[external:CERT-In]].
+
+#Not a heading
+## 1.2 Empty
+
+# 2. Scope
+See [[doc:ISP]].
+"""
+
+
+def _sections(parse, body: str) -> list[dict]:
+    return [asdict(section) for section in parse(body, "DOC", "Document Title")]
+
+
+def test_scanner_matches_reference_on_sample():
+    assert _sections(parse_sections, SAMPLE) == _sections(reference_parse_sections, SAMPLE)
+
+
+@pytest.mark.parametrize("body", ["", "no headings at all\n", "# Only\n", "\n\n# A\n#B\n## C  \ntext"])
+def test_scanner_matches_reference_on_edge_cases(body):
+    assert _sections(parse_sections, body) == _sections(reference_parse_sections, body)
+
+
+@pytest.mark.parametrize("md_path", sorted(POLICIES_MD.glob("*.md")), ids=lambda path: path.name)
+def test_scanner_matches_reference_on_policies(md_path):
+    content = md_path.read_text(encoding="utf-8")
+    body = content[split_frontmatter(content)[1]:]
+    assert _sections(parse_sections, body) == _sections(reference_parse_sections, body)
+
+
+@pytest.mark.parametrize("md_path", sorted(POLICIES_MD.glob("*.md")), ids=lambda path: path.name)
+def test_streaming_parse_matches_in_memory_parse(md_path, monkeypatch):
+    expected = parse_markdown_content(md_path, md_path.read_text(encoding="utf-8"))
+
+    assert list(iter_markdown_sections(md_path)) == expected.sections
+
+    monkeypatch.setattr(markdown_parser, "STREAMING_THRESHOLD_BYTES", 0)
+    streamed = markdown_parser.parse_markdown_file(md_path)
+    assert (streamed.document_id, streamed.title, streamed.frontmatter) == (
+        expected.document_id, expected.title, expected.frontmatter
+    )
+    assert streamed.sections == expected.sections
+
+
+@pytest.mark.parametrize("frontmatter", [
+    "---\ndocument_id: AC\ntitle: Access Control\n---\n",
+    "```yaml\n---\ndocument_id: AC\ntitle: Access Control\n---\n```\n"
+], ids=["plain", "fenced"])
+def test_iter_markdown_sections_reads_frontmatter(tmp_path, frontmatter):
+    md_path = tmp_path / "AC_access_control.md"
+    md_path.write_text(frontmatter + SAMPLE, encoding="utf-8")
+
+    sections = iter_markdown_sections(md_path)
+    first = next(sections)  # Lazy: a generator, not a list
+    assert (first.section_id, first.document_id, first.document_title) == ("AC-1", "AC", "Access Control")
+    assert [first, *sections] == parse_sections(SAMPLE, "AC", "Access Control")
+
+
+def test_iter_markdown_sections_empty_file(tmp_path):
+    md_path = tmp_path / "empty.md"
+    md_path.write_bytes(b"")
+    assert list(iter_markdown_sections(md_path)) == []
@@ -0,0 +1,70 @@
+"""Tests for ingestion.rate_limiter."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ingestion.rate_limiter import RateLimiter, TokenBucket
+
+
+def test_token_bucket_wait_time():
+    bucket = TokenBucket(per_minute=600)  # 10 units per second
+    now = bucket.updated
+
+    assert bucket.wait_time(600, now) == 0.0
+    bucket.take(600)
+    assert bucket.wait_time(10, now) == pytest.approx(1.0)
+    assert bucket.wait_time(10, now + 1.0) == 0.0
+
+    # Requests larger than the bucket only wait for a full bucket
+    bucket.take(10)
+    assert bucket.wait_time(10_000, now + 1.0) == pytest.approx(60.0)
+
+
+def test_unlimited_limiter_does_not_block():
+    limiter = RateLimiter()
+    start = time.monotonic()
+    for _ in range(100):
+        limiter.acquire(10_000)
+        limiter.release()
+    limiter.record_usage(10_000, 0)
+    assert time.monotonic() - start < 1.0
+
+
+def test_record_usage_corrects_and_clamps_the_token_bucket():
+    limiter = RateLimiter(tokens_per_minute=1000)
+    limiter.acquire(400)
+    limiter.release()
+    available = limiter.tokens.available
+
+    limiter.record_usage(estimated=400, actual=500)  # Under-estimate is charged
+    assert limiter.tokens.available == pytest.approx(available - 100)
+
+    limiter.record_usage(estimated=5000, actual=0)  # Refund never overfills the bucket
+    assert limiter.tokens.available == limiter.tokens.capacity
+
+
+def test_max_in_flight_bounds_concurrent_requests():
+    limiter = RateLimiter(max_in_flight=3)
+    lock = threading.Lock()
+    running = peak = 0
+
+    def request(_):
+        nonlocal running, peak
+        limiter.acquire()
+        try:
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+        finally:
+            limiter.release()
+
+    with ThreadPoolExecutor(max_workers=12) as executor:
+        list(executor.map(request, range(48)))
+
+    assert 1 < peak <= 3